@@ -0,0 +1,54 @@
+"""add participant leaderboard
+
+Revision ID: 2b228eb60a22
+Revises: f9d10ab9bc1c
+Create Date: 2026-01-12 18:04:31.512207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b228eb60a22'
+down_revision: Union[str, Sequence[str], None] = 'f9d10ab9bc1c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "participant_leaderboard",
+        sa.Column("participant_id", sa.Integer(), primary_key=True),
+        sa.Column("total_score", sa.Float(), server_default="0", nullable=False),
+        sa.Column("scores_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["participant_id"], ["participants.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_participant_leaderboard_total_score", "participant_leaderboard", ["total_score"])
+
+    # Backfill the read model from already submitted scores
+    op.execute(
+        """
+        INSERT INTO participant_leaderboard (participant_id, total_score, scores_count)
+        SELECT
+            p.id,
+            COALESCE(SUM(
+                COALESCE(js.organization_score, 0) + COALESCE(js.content, 0) + COALESCE(js.visuals, 0)
+                + COALESCE(js.mechanics, 0) + COALESCE(js.delivery, 0)
+            ), 0),
+            COUNT(js.id)
+        FROM participants p
+        LEFT JOIN jury_scores js ON js.participant_id = p.id
+        GROUP BY p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_participant_leaderboard_total_score", table_name="participant_leaderboard")
+    op.drop_table("participant_leaderboard")
@@ -0,0 +1,58 @@
+"""add foreign key indexes
+
+Revision ID: 2ce0c845b846
+Revises: 2b228eb60a22
+Create Date: 2026-10-18 11:20:05.314876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ce0c845b846'
+down_revision: Union[str, Sequence[str], None] = '2b228eb60a22'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, covered columns)
+# jury_scores.jury_id needs no index of its own: uq_jury_participant_score leads with it
+INDEXES = [
+    (
+        "ix_jury_scores_participant_id",
+        "jury_scores",
+        ["participant_id"],
+        ["id", "organization_score", "content", "visuals", "mechanics", "delivery"],
+    ),
+    ("ix_participants_section_id", "participants", ["section_id"], []),
+    ("ix_participants_person_id", "participants", ["person_id"], []),
+    ("ix_section_juries_jury_id", "section_juries", ["jury_id"], ["section_id"]),
+    ("ix_topics_section_id", "topics", ["section_id"], []),
+    ("ix_jury_scores_changes_jury_scores_id", "jury_scores_changes", ["jury_scores_id"], []),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps score submission running while the indexes build,
+    # it cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    op.execute(sa.text("ANALYZE jury_scores, participants, section_juries, topics, jury_scores_changes"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _include in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""add draw indexes
+
+Revision ID: 5b7e2a9c4d13
+Revises: 8d41f0b7a6c3
+Create Date: 2026-10-18 17:40:12.118394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2a9c4d13'
+down_revision: Union[str, Sequence[str], None] = '8d41f0b7a6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, covered columns)
+INDEXES = [
+    ("ix_groups_section_id", "groups", ["section_id"], []),
+    ("ix_group_topics_group_id", "group_topics", ["group_id"], ["topic_id"]),
+    ("ix_group_topics_topic_id", "group_topics", ["topic_id"], []),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the draw reads groups by section and joins group_topics to them; topic deletes look up group_topics.topic_id
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    op.execute(sa.text("ANALYZE groups, group_topics"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _include in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
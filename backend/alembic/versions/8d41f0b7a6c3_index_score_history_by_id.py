@@ -0,0 +1,42 @@
+"""index score history by id
+
+Revision ID: 8d41f0b7a6c3
+Revises: ce9dd4c2e89c
+Create Date: 2026-10-18 16:12:31.540927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0b7a6c3'
+down_revision: Union[str, Sequence[str], None] = 'ce9dd4c2e89c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_index(columns: list[str]) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jury_scores_changes_jury_scores_id", table_name="jury_scores_changes", postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_jury_scores_changes_jury_scores_id",
+            "jury_scores_changes",
+            columns,
+            postgresql_concurrently=True,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The history endpoint pages through one score's changes by id, newest first
+    _recreate_index(["jury_scores_id", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_index(["jury_scores_id"])
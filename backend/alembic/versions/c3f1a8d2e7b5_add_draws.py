@@ -0,0 +1,40 @@
+"""add draws
+
+Revision ID: c3f1a8d2e7b5
+Revises: 5b7e2a9c4d13
+Create Date: 2026-10-18 18:25:03.417209
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a8d2e7b5'
+down_revision: Union[str, Sequence[str], None] = '5b7e2a9c4d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "draws",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("section_id", sa.Integer(), nullable=False),
+        sa.Column("seed", sa.String(length=64), nullable=False),
+        sa.Column("algorithm", sa.String(length=32), nullable=False),
+        sa.Column("inputs_digest", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["section_id"], ["sections.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_draws_section_id", "draws", ["section_id", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_draws_section_id", table_name="draws")
+    op.drop_table("draws")
@@ -0,0 +1,57 @@
+"""add generated total to jury_scores
+
+Revision ID: ce9dd4c2e89c
+Revises: 2ce0c845b846
+Create Date: 2026-10-18 14:02:47.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ce9dd4c2e89c'
+down_revision: Union[str, Sequence[str], None] = '2ce0c845b846'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOTAL_EXPRESSION = (
+    "coalesce(organization_score, 0) + coalesce(content, 0) + coalesce(visuals, 0)"
+    " + coalesce(mechanics, 0) + coalesce(delivery, 0)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rewrites jury_scores once; the value is then maintained by PostgreSQL on every write
+    op.add_column(
+        "jury_scores",
+        sa.Column("total", sa.Float(), sa.Computed(TOTAL_EXPRESSION, persisted=True), nullable=False),
+    )
+
+    # The leaderboard aggregate and jury progress only need jury_id and total now
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jury_scores_participant_id", table_name="jury_scores", postgresql_concurrently=True)
+        op.create_index(
+            "ix_jury_scores_participant_id",
+            "jury_scores",
+            ["participant_id"],
+            postgresql_include=["jury_id", "total"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jury_scores_participant_id", table_name="jury_scores", postgresql_concurrently=True)
+        op.create_index(
+            "ix_jury_scores_participant_id",
+            "jury_scores",
+            ["participant_id"],
+            postgresql_include=["id", "organization_score", "content", "visuals", "mechanics", "delivery"],
+            postgresql_concurrently=True,
+        )
+    op.drop_column("jury_scores", "total")
@@ -0,0 +1,42 @@
+"""index technical requirements by topic
+
+Revision ID: e6a94b1f0c28
+Revises: c3f1a8d2e7b5
+Create Date: 2026-10-18 19:10:47.220931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a94b1f0c28'
+down_revision: Union[str, Sequence[str], None] = 'c3f1a8d2e7b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The draw looks up the poster requirements of every topic in the section
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_technical_requirements_topic_id",
+            "technical_requirements",
+            ["topic_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_technical_requirements_topic_id",
+            table_name="technical_requirements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
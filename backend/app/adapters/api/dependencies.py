@@ -2,17 +2,22 @@ from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.db.session import get_db_session
+from app.core.cache import score_cache
+from app.core.events import RankingBroadcaster, ranking_broadcaster
+from app.db.session import engine, get_db_session, get_read_db_session, reads_pinned_to_primary
 from app.repositories.event import EventRepository
 from app.repositories.jury import JuryRepository
 from app.repositories.jury_score import JuryScoreRepository
+from app.repositories.notification import NotificationOutboxRepository
 from app.repositories.organizer import OrganizerRepository
 from app.repositories.participant import ParticipantRepository
+from app.repositories.participant_leaderboard import ParticipantLeaderboardRepository
 from app.repositories.participant_ranking import ParticipantRankingRepository
 from app.repositories.person import PersonRepository
 from app.repositories.poster_content import PosterContentRepository
+from app.repositories.score_stats import ScoreStatsRepository
 from app.repositories.section import SectionRepository
 from app.repositories.section_jury import SectionJuryRepository
 from app.repositories.technical_requirement import (
@@ -22,8 +27,10 @@ from app.repositories.topic import TopicRepository
 from app.repositories.university import UniversityRepository
 from app.services.jury import JuryService
 from app.services.jury_score import JuryScoreService
+from app.services.notification import NotificationService
 from app.services.participant_ranking import ParticipantRankingService
 from app.services.poster_content import PosterContentService
+from app.services.score_stats import ScoreStatsService
 from app.services.section import SectionService
 from app.services.section_jury import SectionJuryService
 from app.services.technical_requirement import TechnicalRequirementService
@@ -36,6 +43,16 @@ async def get_session() -> AsyncIterator[AsyncSession]:
         yield session
 
 
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Session for read-only endpoints; served by a replica when replicas are configured."""
+    async for session in get_read_db_session():
+        yield session
+
+
+def get_engine() -> AsyncEngine:
+    return engine
+
+
 def get_university_service(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> UniversityService:
@@ -72,6 +89,12 @@ def get_jury_service(
     )
 
 
+def get_jury_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> JuryService:
+    return get_jury_service(session)
+
+
 def get_jury_score_service(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> JuryScoreService:
@@ -80,15 +103,27 @@ def get_jury_score_service(
     participant_repo = ParticipantRepository(session)
     jury_repo = JuryRepository(session)
     section_jury_repo = SectionJuryRepository(session)
+    leaderboard_repo = ParticipantLeaderboardRepository(session)
+    ranking_repo = ParticipantRankingRepository(session)
 
     return JuryScoreService(
         jury_score_repository=jury_score_repo,
         participant_repository=participant_repo,
         jury_repository=jury_repo,
         section_jury_repository=section_jury_repo,
+        leaderboard_repository=leaderboard_repo,
+        ranking_repository=ranking_repo,
+        cache=score_cache,
+        broadcaster=ranking_broadcaster,
     )
 
 
+def get_jury_score_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> JuryScoreService:
+    return get_jury_score_service(session)
+
+
 def get_section_service(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> SectionService:
@@ -99,10 +134,27 @@ def get_section_service(
 
 
 def get_participant_ranking_service(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> ParticipantRankingService:
     repository = ParticipantRankingRepository(session)
-    return ParticipantRankingService(repository)
+    # cached pages may have been computed from a lagging replica
+    return ParticipantRankingService(repository, score_cache, bypass_cache=reads_pinned_to_primary())
+
+
+def get_score_stats_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> ScoreStatsService:
+    return ScoreStatsService(
+        ScoreStatsRepository(session),
+        SectionRepository(session),
+        score_cache,
+        bypass_cache=reads_pinned_to_primary(),
+    )
+
+
+def get_ranking_broadcaster() -> RankingBroadcaster:
+    """Live-feed broadcaster; deliberately does not open a database session."""
+    return ranking_broadcaster
 
 
 def get_topic_service(
@@ -123,3 +175,15 @@ def get_section_jury_service(
         section_repository=section_repository,
         jury_repository=jury_repository,
     )
+
+
+def get_section_jury_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> SectionJuryService:
+    return get_section_jury_service(session)
+
+
+def get_notification_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> NotificationService:
+    return NotificationService(NotificationOutboxRepository(session))
@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import RequestMetrics, request_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["internal"])
+
+
+def get_request_metrics() -> RequestMetrics:
+    return request_metrics
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(metrics: Annotated[RequestMetrics, Depends(get_request_metrics)]) -> PlainTextResponse:
+    """Per-route request, SQL statement and timing totals of this worker in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,135 @@
+import logging
+import math
+import time
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import RequestMetrics
+from app.db.query_count import count_queries
+from app.db.session import read_from_primary
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = b"x-query-count"
+SERVER_TIMING_HEADER = b"server-timing"
+UNMATCHED_ROUTE = "unmatched"
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "x-read-primary"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class QueryCountMiddleware:
+    """
+    Report how many SQL statements a request executed in the ``X-Query-Count`` response header.
+
+    Streaming responses report the statements executed before the first byte was sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER, str(counter.count).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
+
+        logger.debug("%s %s executed %d queries", scope["method"], scope["path"], counter.count)
+
+
+class RequestMetricsMiddleware:
+    """
+    Time every request and the SQL statements it executed, per route.
+
+    The ``Server-Timing`` response header shows the statement count and database time so far
+    and the time until the response started (visible in the browser's network panel). Totals
+    of the whole request, including streamed bodies, are added to ``metrics`` for ``/metrics``.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        with count_queries() as counter:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    timing = (
+                        f'db;dur={counter.duration_seconds * 1000:.2f};desc="{counter.count} queries", '
+                        f"total;dur={elapsed_ms:.2f}"
+                    )
+                    headers = list(message.get("headers", []))
+                    headers.append((SERVER_TIMING_HEADER, timing.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                # the router stores the matched route in the scope; the template keeps label values bounded
+                route = scope.get("route")
+                self.metrics.observe(
+                    method=scope["method"],
+                    route=getattr(route, "path", UNMATCHED_ROUTE),
+                    status=status,
+                    duration_seconds=time.perf_counter() - started,
+                    db_statements=counter.count,
+                    db_duration_seconds=counter.duration_seconds,
+                )
+
+
+class ReadYourWritesMiddleware:
+    """
+    Keep a client on the primary database right after it wrote something.
+
+    A successful unsafe request (POST/PUT/PATCH/DELETE) sets the short-lived ``read_primary``
+    cookie; while it is present, read-only sessions of that client's requests skip the
+    replicas, so e.g. a jury member sees their own score immediately instead of waiting
+    for replication. Clients without cookies can send ``X-Read-Primary: 1`` instead.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float) -> None:
+        self.app = app
+        self.cookie = (
+            f"{READ_PRIMARY_COOKIE}=1; Max-Age={math.ceil(window_seconds)}; Path=/; HttpOnly; SameSite=lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        pinned = READ_PRIMARY_COOKIE in connection.cookies or connection.headers.get(READ_PRIMARY_HEADER) == "1"
+        is_write = scope["method"] not in SAFE_METHODS
+
+        async def send_with_cookie(message: Message) -> None:
+            if is_write and message["type"] == "http.response.start" and message["status"] < 400:
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", self.cookie))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with read_from_primary(pinned):
+            await self.app(scope, receive, send_with_cookie)
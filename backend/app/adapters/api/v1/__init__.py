@@ -1,9 +1,12 @@
 from fastapi import APIRouter
 
 from app.adapters.api.v1 import (
+    internal,
     juries,
+    notifications,
     participant_rankings,
     participant_scores,
+    participant_scores_bulk,
     poster_contents,
     section_juries,
     technical_requirements,
@@ -23,9 +26,12 @@ router.include_router(technical_requirements.router, prefix="/technical-requirem
 router.include_router(poster_contents.router, prefix="/poster-contents")
 router.include_router(juries.router, prefix="/juries")
 router.include_router(participant_scores.router, prefix="/participants/{participant_id}/scores")
+router.include_router(participant_scores_bulk.router, prefix="/participants")
 router.include_router(participant_rankings.router, prefix="/participant-rankings")
 router.include_router(sections.router, prefix="/sections")
 router.include_router(section_juries.router, prefix="/section-juries")
+router.include_router(internal.router, prefix="/internal")
+router.include_router(notifications.router, prefix="/notifications")
 router.include_router(draw_router)
 router.include_router(draw_results_router)
 router.include_router(topics_router)
@@ -1,57 +1,43 @@
+from app.db.session import get_db_session, get_read_db_session
+from app.repositories.draw import DrawRepository
+from app.services.draw import DrawService
 from openapi_server.apis.draw_api_base import BaseDrawApi
+from openapi_server.models.draw import Draw
+from openapi_server.models.draw_verification import DrawVerification
 
 
 class DrawApiImpl(BaseDrawApi):
     """
-    Реализация запуска жеребьёвки.
+    Реализация запуска и проверки жеребьёвки.
     """
 
-    _topics_db = {}
-    _draw_results_db = {}
+    async def _with_service(self) -> DrawService:
+        # создаём сессию для каждого вызова; вся жеребьёвка — одна транзакция
+        async for session in get_db_session():
+            yield DrawService(DrawRepository(session))
+
+    async def _with_read_service(self) -> DrawService:
+        # проверка только читает: может идти с реплики
+        async for session in get_read_db_session():
+            yield DrawService(DrawRepository(session))
 
     async def draw_run_post(
         self,
         sectionId: int,
-    ) -> None:
-        section_topics = [topic for topic in self._topics_db.values() if topic["section_id"] == sectionId]
-
-        if not section_topics:
-            from fastapi import HTTPException
-
-            raise HTTPException(409, "Нет тем для распределения в секции")
-
-        groups = [
-            {"id": 1, "name": "Группа 1"},
-            {"id": 2, "name": "Группа 2"},
-            {"id": 3, "name": "Группа 3"},
-        ]
-
-        if len(groups) < len(section_topics):
-            from fastapi import HTTPException
-
-            raise HTTPException(
-                409,
-                f"Недостаточно групп ({len(groups)}) для {len(section_topics)} тем",
-            )
+    ) -> Draw:
+        async for service in self._with_service():
+            return await service.run_draw(sectionId)
 
-        import random
-
-        random.shuffle(section_topics)
-
-        results = []
-        for i, topic in enumerate(section_topics):
-            group = groups[i]
-            results.append(
-                {
-                    "group_id": group["id"],
-                    "group_name": group["name"],
-                    "topics": [
-                        {
-                            "topic_id": topic["id"],
-                            "topic_name": topic["name"],
-                        }
-                    ],
-                }
-            )
+    async def draw_run_event_post(
+        self,
+        eventId: int,
+    ) -> list[Draw]:
+        async for service in self._with_service():
+            return await service.run_event_draw(eventId)
 
-        self._draw_results_db[sectionId] = results
+    async def draw_verify_get(
+        self,
+        sectionId: int,
+    ) -> DrawVerification:
+        async for service in self._with_read_service():
+            return await service.verify_draw(sectionId)
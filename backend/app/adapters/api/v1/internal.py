@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.api.dependencies import get_engine
+from app.db.pool import get_pool_stats
+from app.schemas import PoolStatsRead
+
+router = APIRouter(tags=["internal"])
+
+
+@router.get("/pool", response_model=PoolStatsRead)
+async def get_database_pool_stats(engine: Annotated[AsyncEngine, Depends(get_engine)]) -> PoolStatsRead:
+    """
+    Connection pool metrics of the worker that served the request.
+
+    `checked_out` close to `size + max_overflow` together with a growing `wait_seconds_*`
+    or `checkout_timeouts` means requests queue for connections: raise `DB_POOL_SIZE` /
+    `DB_MAX_OVERFLOW` (within the server's `max_connections`) or shorten transactions.
+    """
+    stats = get_pool_stats(engine)
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Connection pool is not instrumented",
+        )
+    return PoolStatsRead(
+        size=stats.size,
+        checked_out=stats.checked_out,
+        checked_in=stats.checked_in,
+        overflow=stats.overflow,
+        max_overflow=stats.max_overflow,
+        timeout_seconds=stats.timeout_seconds,
+        checkouts=stats.checkouts,
+        checkout_timeouts=stats.checkout_timeouts,
+        wait_seconds_total=round(stats.wait_seconds_total, 6),
+        wait_seconds_avg=round(stats.wait_seconds_total / stats.checkouts, 6) if stats.checkouts else 0.0,
+        wait_seconds_max=round(stats.wait_seconds_max, 6),
+    )
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.adapters.api.dependencies import get_jury_service
+from app.adapters.api.dependencies import get_jury_read_service, get_jury_service
 from app.schemas import JuryCreate, JuryProgressItem, JuryRead, JuryUpdate
 from app.services.jury import JuryService
 
@@ -36,7 +36,7 @@ async def get_jury(
 @router.get("/{jury_id}/progress", response_model=list[JuryProgressItem])
 async def get_jury_progress(
     jury_id: int,
-    service: Annotated[JuryService, Depends(get_jury_service)],
+    service: Annotated[JuryService, Depends(get_jury_read_service)],
 ) -> list[JuryProgressItem]:
     return await service.get_jury_progress(jury_id)
 
@@ -0,0 +1,18 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from app.adapters.api.dependencies import get_notification_service
+from app.schemas import DrawResultsNotificationRequest, NotificationResponse
+from app.services.notification import NotificationService
+
+router = APIRouter(tags=["Draw"])
+
+
+@router.post("/draw/results", response_model=NotificationResponse, status_code=status.HTTP_202_ACCEPTED)
+async def send_draw_results_notification(
+    payload: DrawResultsNotificationRequest,
+    service: Annotated[NotificationService, Depends(get_notification_service)],
+) -> NotificationResponse:
+    """Queue the draw results e-mail for the group; the notification dispatcher sends it."""
+    return await service.enqueue_draw_results(payload)
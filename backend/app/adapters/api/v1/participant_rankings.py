@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import json
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
-from app.adapters.api.dependencies import get_participant_ranking_service
+from app.adapters.api.dependencies import get_participant_ranking_service, get_ranking_broadcaster
+from app.core.events import RankingBroadcaster, ServerSentEvent
 from app.schemas import (
+    CacheStatsRead,
     ParticipantRankingList,
     ParticipantRankingRead,
     ParticipantRankingSortField,
+    RankingExportFormat,
+    RankingNormalization,
     SortOrder,
 )
 from app.services.participant_ranking import ParticipantRankingService
 
 router = APIRouter(tags=["participant-rankings"])
 
+NormalizationQuery = Annotated[
+    RankingNormalization,
+    Query(description="Rescale each jury member's scores before summing, to offset lenient or harsh juries"),
+]
+
+EXPORT_MEDIA_TYPES = {
+    RankingExportFormat.CSV: "text/csv; charset=utf-8",
+    RankingExportFormat.NDJSON: "application/x-ndjson",
+}
+
 
 @router.get("/", response_model=ParticipantRankingList)
 async def list_participant_rankings(
@@ -31,12 +47,27 @@ async def list_participant_rankings(
         SortOrder,
         Query(description="Sorting direction"),
     ] = SortOrder.DESC,
+    cursor: Annotated[
+        str | None,
+        Query(description="Opaque `next_cursor` of the previous page; when set, `page` is ignored"),
+    ] = None,
+    include_total: Annotated[
+        bool,
+        Query(description="Count all matching participants (disable for cheaper infinite scrolling)"),
+    ] = True,
+    normalization: NormalizationQuery = RankingNormalization.NONE,
 ) -> ParticipantRankingList:
     """
     Aggregated leaderboard for participants with pagination, filtering, and sorting.
 
     By default, the list is sorted by the total score (descending) with alphabetical
     tie-breaking to satisfy the tech requirements.
+
+    Deep pages should be fetched with `cursor` (keyset pagination) instead of `page`,
+    which makes the database skip all previous rows.
+
+    With `normalization=zscore|minmax`, `total_score` is the sum of the participant's scores
+    after rescaling each score against all scores of the same jury member in the requested scope.
     """
     return await service.list_rankings(
         section_id=section_id,
@@ -45,9 +76,89 @@ async def list_participant_rankings(
         page_size=page_size,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        include_total=include_total,
+        normalization=normalization,
     )
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_participant_rankings(
+    service: Annotated[ParticipantRankingService, Depends(get_participant_ranking_service)],
+    format: Annotated[RankingExportFormat, Query(description="Output format")] = RankingExportFormat.CSV,
+    section_id: Annotated[int | None, Query(description="Filter by section id")] = None,
+    jury_id: Annotated[int | None, Query(description="Filter by jury section assignment")] = None,
+    sort_by: Annotated[
+        ParticipantRankingSortField,
+        Query(description="Field to sort by"),
+    ] = ParticipantRankingSortField.TOTAL_SCORE,
+    sort_order: Annotated[
+        SortOrder,
+        Query(description="Sorting direction"),
+    ] = SortOrder.DESC,
+    normalization: NormalizationQuery = RankingNormalization.NONE,
+) -> StreamingResponse:
+    """
+    Download the whole leaderboard as CSV or NDJSON.
+
+    Rows are read through a server-side cursor and written as they arrive, so the
+    export does not hold the leaderboard in memory.
+    """
+    rows = service.export_rankings(
+        section_id=section_id,
+        jury_id=jury_id,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        export_format=format,
+        normalization=normalization,
+    )
+    return StreamingResponse(
+        rows,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="participant-rankings.{format.value}"'},
+    )
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_participant_rankings(
+    broadcaster: Annotated[RankingBroadcaster, Depends(get_ranking_broadcaster)],
+    section_id: Annotated[int | None, Query(description="Only push changes of this section")] = None,
+) -> StreamingResponse:
+    """
+    Live leaderboard feed (server-sent events).
+
+    Events:
+    - `ready` once the subscription is registered; load the board with `GET /` after it
+    - `ranking` with a `ParticipantRankingDelta` after a committed jury score: every row of the
+      subscribed section (or of the whole board) whose rank or total changed
+    - `resync` when this client fell behind and deltas were dropped; reload the board
+
+    Comment lines are sent as keep-alive while nothing changes.
+    """
+    ready = ServerSentEvent(event="ready", data=json.dumps({"section_id": section_id}))
+    return StreamingResponse(
+        broadcaster.listen(section_id, ready),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/cache-stats", response_model=CacheStatsRead)
+async def get_participant_rankings_cache_stats(
+    service: Annotated[ParticipantRankingService, Depends(get_participant_ranking_service)],
+) -> CacheStatsRead:
+    """Hit/miss counters of this worker's leaderboard cache."""
+    return service.get_cache_stats()
+
+
 @router.get("/{participant_id}", response_model=ParticipantRankingRead)
 async def get_participant_ranking(
     participant_id: int,
@@ -60,12 +171,14 @@ async def get_participant_ranking(
         int | None,
         Query(description="Ensure participant is visible to this jury member"),
     ] = None,
+    normalization: NormalizationQuery = RankingNormalization.NONE,
 ) -> ParticipantRankingRead:
     """Return a single leaderboard entry for the provided participant."""
     ranking = await service.get_ranking(
         participant_id,
         section_id=section_id,
         jury_id=jury_id,
+        normalization=normalization,
     )
     if ranking is None:
         raise HTTPException(
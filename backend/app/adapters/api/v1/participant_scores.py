@@ -1,9 +1,16 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-
-from app.adapters.api.dependencies import get_jury_score_service
-from app.schemas import JuryScoreCreate, JuryScoreRead, JuryScoreUpdate, ParticipantScoreSummary
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+
+from app.adapters.api.dependencies import get_jury_score_read_service, get_jury_score_service
+from app.schemas import (
+    JuryScoreCreate,
+    JuryScoreHistoryPage,
+    JuryScoreRead,
+    JuryScoreUpdate,
+    JuryScoreUpsert,
+    ParticipantScoreSummary,
+)
 from app.services.jury_score import JuryScoreService
 
 router = APIRouter(tags=["participant-scores"])
@@ -63,6 +70,37 @@ async def get_participant_score(
     return JuryScoreRead.model_validate(score)
 
 
+@router.get("/{score_id}/history", response_model=JuryScoreHistoryPage)
+async def list_participant_score_history(
+    participant_id: int,
+    score_id: int,
+    service: Annotated[JuryScoreService, Depends(get_jury_score_read_service)],
+    limit: Annotated[int, Query(ge=1, le=200, description="Maximum number of changes per page")] = 50,
+    before_id: Annotated[
+        int | None,
+        Query(ge=1, description="`next_before_id` of the previous page; omit for the newest changes"),
+    ] = None,
+) -> JuryScoreHistoryPage:
+    """
+    Retrieve the audit trail of a jury score, newest change first.
+
+    Each entry records which jury member updated the score and when.
+
+    Args:
+        participant_id: ID of the participant
+        score_id: ID of the jury score
+        limit: Page size
+        before_id: Cursor of the page to fetch
+
+    Returns:
+        Page of score changes with the cursor of the next (older) page
+
+    Raises:
+        HTTPException: 404 if score not found or doesn't belong to participant
+    """
+    return await service.list_score_history(participant_id, score_id, limit=limit, before_id=before_id)
+
+
 @router.post("/", response_model=JuryScoreRead, status_code=status.HTTP_201_CREATED)
 async def create_participant_score(
     participant_id: int,
@@ -95,6 +133,42 @@ async def create_participant_score(
     return JuryScoreRead.model_validate(score)
 
 
+@router.put(
+    "/by-jury/{jury_id}",
+    response_model=JuryScoreRead,
+    responses={status.HTTP_201_CREATED: {"model": JuryScoreRead, "description": "Score created"}},
+)
+async def upsert_participant_score(
+    participant_id: int,
+    jury_id: int,
+    payload: JuryScoreUpsert,
+    response: Response,
+    service: Annotated[JuryScoreService, Depends(get_jury_score_service)],
+) -> JuryScoreRead:
+    """
+    Create or replace the score a jury member gave to a participant.
+
+    Idempotent: repeating the request (e.g. a double tap) stores the same score once.
+    Replacing an existing score creates an audit trail entry attributed to `jury_id`.
+    All fields are replaced - omitted criteria are cleared.
+
+    Args:
+        participant_id: ID of the participant (from URL)
+        jury_id: ID of the jury member (from URL)
+        payload: Score values
+
+    Returns:
+        Stored jury score (201 if it was created, 200 if it was replaced)
+
+    Raises:
+        HTTPException: 404 for missing entities, 422 if the jury member is not assigned to the section
+    """
+    score, created = await service.upsert_score(participant_id, jury_id, payload)
+    if created:
+        response.status_code = status.HTTP_201_CREATED
+    return score
+
+
 @router.patch("/{score_id}", response_model=JuryScoreRead)
 async def update_participant_score(
     participant_id: int,
@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from app.adapters.api.dependencies import get_jury_score_service
+from app.schemas import JuryScoreBulkCreate, JuryScoreBulkResult
+from app.services.jury_score import JuryScoreService
+
+router = APIRouter(tags=["participant-scores"])
+
+
+@router.post("/scores:bulk", response_model=JuryScoreBulkResult, status_code=status.HTTP_200_OK)
+async def create_participant_scores_bulk(
+    payload: JuryScoreBulkCreate,
+    service: Annotated[JuryScoreService, Depends(get_jury_score_service)],
+) -> JuryScoreBulkResult:
+    """
+    Create many jury scores in one request (e.g. a whole sheet of paper scores).
+
+    Every item is checked with the same rules as `POST /participants/{participant_id}/scores/`,
+    and `participant_id` is required in each item. Duplicates inside the request are rejected.
+
+    - `atomic=true` (default): either all items are stored, or none and the response is
+      a 422 whose `detail` holds the per-item results (`rejected` / `skipped`)
+    - `atomic=false`: valid items are stored, invalid ones are reported as `rejected`
+
+    Args:
+        payload: Items to store and the atomic flag
+
+    Returns:
+        Per-item results in request order
+
+    Raises:
+        HTTPException: 422 if an atomic batch contains invalid items
+    """
+    return await service.create_scores_bulk(payload)
@@ -2,9 +2,21 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
 
-from app.adapters.api.dependencies import get_section_service
-from app.schemas import SectionCreate, SectionRead, SectionUpdate
+from app.adapters.api.dependencies import (
+    get_score_stats_service,
+    get_section_jury_read_service,
+    get_section_service,
+)
+from app.schemas import (
+    SectionCreate,
+    SectionJuryProgressRead,
+    SectionRead,
+    SectionScoreStatsRead,
+    SectionUpdate,
+)
+from app.services.score_stats import ScoreStatsService
 from app.services.section import SectionService
+from app.services.section_jury import SectionJuryService
 
 router = APIRouter(tags=["Sections"])
 
@@ -34,6 +46,38 @@ async def read_section(
     return SectionRead.model_validate(await service.get_section_by_id(section_id))
 
 
+@router.get("/{section_id}/score-stats", response_model=SectionScoreStatsRead)
+async def read_section_score_stats(
+    section_id: int, service: Annotated[ScoreStatsService, Depends(get_score_stats_service)]
+) -> SectionScoreStatsRead:
+    """
+    Retrieve mean, median, standard deviation and per-criterion averages of the section scores.
+
+    Args:
+        section_id: section id
+
+    Returns:
+        Statistics over the whole section and per jury member
+    """
+    return await service.get_section_stats(section_id)
+
+
+@router.get("/{section_id}/jury-progress", response_model=SectionJuryProgressRead)
+async def read_section_jury_progress(
+    section_id: int, service: Annotated[SectionJuryService, Depends(get_section_jury_read_service)]
+) -> SectionJuryProgressRead:
+    """
+    Retrieve the grading matrix of all jury members of the section.
+
+    Args:
+        section_id: section id
+
+    Returns:
+        Participant ids (bitmap column order) and, per jury member, a "1"/"0" bitmap and completion percentage
+    """
+    return await service.get_section_progress(section_id)
+
+
 @router.post("/", response_model=SectionRead, status_code=status.HTTP_201_CREATED)
 async def create_section(
     data: SectionCreate, service: Annotated[SectionService, Depends(get_section_service)]
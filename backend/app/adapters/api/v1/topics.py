@@ -1,27 +1,27 @@
+from app.db.session import get_db_session, get_read_db_session
+from app.repositories.topic import TopicRepository
+from app.services.topic import TopicService
 from openapi_server.apis.topics_api_base import BaseTopicsApi
 from openapi_server.models.topic import Topic
 from openapi_server.models.topic_create import TopicCreate
 from openapi_server.models.topic_update import TopicUpdate
 
-from app.db.session import get_db_session
-from app.repositories.topic import TopicRepository
-from app.services.topic import TopicService
-
 
 class TopicsApiImpl(BaseTopicsApi):
     """
     Реализация Topics API (CRUD тем).
     """
 
-    async def _with_service(self) -> TopicService:
-        # создаём сессию для каждого вызова
-        async for session in get_db_session():
+    async def _with_service(self, *, read_only: bool = False) -> TopicService:
+        # создаём сессию для каждого вызова; чтение может идти с реплики
+        get_session = get_read_db_session if read_only else get_db_session
+        async for session in get_session():
             repo = TopicRepository(session)
             service = TopicService(repo)
             yield service
 
     async def topics_get(self, sectionId: int) -> list[Topic]:
-        async for service in self._with_service():
+        async for service in self._with_service(read_only=True):
             topics = await service.list_topics(sectionId)
             return [Topic(id=t.id, section_id=t.section_id, name=t.name) for t in topics]
 
@@ -31,7 +31,7 @@ class TopicsApiImpl(BaseTopicsApi):
             return Topic(id=topic.id, section_id=topic.section_id, name=topic.name)
 
     async def topics_topic_id_get(self, topicId: int) -> Topic:
-        async for service in self._with_service():
+        async for service in self._with_service(read_only=True):
             topic = await service.get_topic(topicId)
             return Topic(id=topic.id, section_id=topic.section_id, name=topic.name)
 
@@ -0,0 +1,36 @@
+"""
+Send the queued e-mail notifications until interrupted.
+
+Runs the same dispatcher as ``NOTIFICATION_WORKER=true`` does inside the API, as a separate
+process; several workers may run at once, each claims its own messages.
+
+Usage:
+    uv run python -m app.commands.notification_worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.db.session import AsyncSessionMaker, engine
+from app.services.notification import NotificationDispatcher
+
+
+async def main() -> None:
+    if not settings.smtp_host:
+        raise SystemExit("SMTP_HOST is not set")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        await NotificationDispatcher.from_settings(AsyncSessionMaker, settings).run(stop)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
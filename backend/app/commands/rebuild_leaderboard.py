@@ -0,0 +1,30 @@
+"""
+Rebuild the participant leaderboard read model from jury scores.
+
+Usage:
+    uv run python -m app.commands.rebuild_leaderboard
+"""
+
+import asyncio
+
+from app.db.session import AsyncSessionMaker, engine
+from app.repositories.participant_leaderboard import ParticipantLeaderboardRepository
+
+
+async def rebuild_leaderboard() -> int:
+    async with AsyncSessionMaker() as session:
+        rows = await ParticipantLeaderboardRepository(session).rebuild()
+        await session.commit()
+    return rows
+
+
+async def main() -> None:
+    try:
+        rows = await rebuild_leaderboard()
+    finally:
+        await engine.dispose()
+    print(f"Leaderboard rebuilt: {rows} participants")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+
+ALL_SECTIONS_TAG = "section:*"
+
+
+def section_tags(section_id: int | None) -> tuple[str, ...]:
+    """
+    Tags for a cache entry computed over one section (or over all of them).
+
+    Entries that are not scoped to a single section are tagged with ``ALL_SECTIONS_TAG``
+    so that a write to any section invalidates them.
+    """
+    if section_id is None:
+        return (ALL_SECTIONS_TAG,)
+    return (f"section:{section_id}",)
+
+
+def section_invalidation_tags(section_id: int | None) -> tuple[str, ...]:
+    """Tags to drop after a jury score of the provided section has been written."""
+    if section_id is None:
+        return (ALL_SECTIONS_TAG,)
+    return (f"section:{section_id}", ALL_SECTIONS_TAG)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    expires_at: float
+    tags: tuple[Hashable, ...]
+    value: Any
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL and tag-based invalidation.
+
+    The cache lives in the worker process, so every uvicorn worker keeps its own copy.
+    A non-positive TTL disables caching entirely.
+
+    Every tag has a generation that ``invalidate`` bumps. A reader takes ``version(tags)``
+    before it queries and passes it to ``set``; a result computed before an invalidation
+    of one of its tags is then dropped instead of living stale for the whole TTL.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[Hashable, set[Hashable]] = {}
+        # never reset, not even by clear(): an old version must not become current again
+        self._generations: dict[Hashable, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value or None on a miss (expired entries count as misses)."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def version(self, tags: Iterable[Hashable]) -> tuple[int, ...]:
+        """Current generation of the tags; take it before computing a value to ``set`` later."""
+        return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        tags: Iterable[Hashable] = (),
+        version: tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            version: ``version(tags)`` taken before the value was computed; if one of the tags
+                has been invalidated since, the value is stale and is not stored
+        """
+        tags = tuple(tags)
+        if not self.enabled or (version is not None and version != self.version(tags)):
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        entry = _CacheEntry(expires_at=time.monotonic() + self._ttl_seconds, tags=tags, value=value)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def invalidate(self, *tags: Hashable) -> int:
+        """
+        Drop every entry carrying at least one of the provided tags.
+
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in self._keys_by_tag.pop(tag, set()):
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        self._invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            ttl_seconds=self._ttl_seconds,
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+score_cache = TTLCache(
+    max_entries=settings.score_cache_max_entries,
+    ttl_seconds=settings.score_cache_ttl_seconds,
+)
+
+
+__all__ = [
+    "ALL_SECTIONS_TAG",
+    "CacheStats",
+    "TTLCache",
+    "score_cache",
+    "section_invalidation_tags",
+    "section_tags",
+]
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,12 +20,60 @@ class Settings(BaseSettings):
     db_password: str = Field(default="postgres")
     db_name: str = Field(default="digital_events")
     db_echo: bool = Field(default=False)
+    db_pool_size: int = Field(default=5, description="Connections kept open per worker")
+    db_max_overflow: int = Field(default=10, description="Extra connections opened under load")
+    db_pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free connection")
+    db_pool_recycle: int = Field(default=1800, description="Reopen connections older than this, -1 disables")
+    db_pool_pre_ping: bool = Field(default=False, description="Check connections with a ping on checkout")
+    db_statement_cache_size: int = Field(default=100, description="asyncpg prepared statements, 0 for pgbouncer")
+    db_command_timeout: float | None = Field(default=None, description="asyncpg per-statement timeout in seconds")
+    db_query_count_header: bool = Field(
+        default=False, description="Report SQL statements per request in X-Query-Count (debugging aid)"
+    )
+    request_metrics: bool = Field(
+        default=False, description="Server-Timing header and Prometheus /metrics with per-route SQL and timing"
+    )
+    db_replica_urls: str = Field(default="", description="Comma-separated asyncpg DSNs of read replicas")
+    db_read_your_writes_seconds: float = Field(
+        default=5.0, description="After a write, the client reads from the primary for this long"
+    )
+
+    score_cache_ttl_seconds: float = Field(default=5.0, description="Lifetime of cached leaderboard pages, 0 disables")
+    score_cache_max_entries: int = Field(default=1024, description="LRU bound of the leaderboard cache")
+
+    ranking_stream_queue_size: int = Field(default=100, description="Pending events per live-feed client")
+    ranking_stream_heartbeat_seconds: float = Field(default=15.0, description="Keep-alive interval of the live feed")
+
+    smtp_host: str = Field(default="", description="SMTP server for notifications, empty disables sending")
+    smtp_port: int = Field(default=465)
+    smtp_security: Literal["ssl", "starttls", "none"] = Field(default="ssl")
+    smtp_username: str = Field(default="")
+    smtp_password: str = Field(default="")
+    smtp_sender: str = Field(default="", description="From address, defaults to SMTP_USERNAME")
+    smtp_timeout_seconds: float = Field(default=30.0)
+    notification_worker: bool = Field(
+        default=False, description="Run the notification dispatcher inside the API process"
+    )
+    notification_batch_size: int = Field(default=50, description="Messages claimed and sent over one SMTP connection")
+    notification_rate_per_second: float = Field(default=5.0, description="Messages sent per second, 0 for no limit")
+    notification_max_attempts: int = Field(default=5)
+    notification_retry_base_seconds: float = Field(default=30.0, description="First retry delay, doubled per attempt")
+    notification_retry_max_seconds: float = Field(default=3600.0)
+    notification_lease_seconds: float = Field(
+        default=300.0, description="Claimed messages are retried after this long if the dispatcher dies"
+    )
+    notification_poll_seconds: float = Field(default=5.0, description="Pause when the outbox has nothing due")
 
     @property
     def database_url(self) -> str:
         """Async connection string for SQLAlchemy."""
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def replica_database_urls(self) -> list[str]:
+        """Async connection strings of the read replicas, empty when reads go to the primary."""
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
+
     @property
     def sync_database_url(self) -> str:
         """Sync connection string for Alembic."""
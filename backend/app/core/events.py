@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+
+RESYNC_EVENT = "resync"
+"""Sent instead of the dropped deltas when a subscriber could not keep up."""
+
+
+@dataclass(slots=True, frozen=True)
+class ServerSentEvent:
+    event: str
+    data: str
+
+    def encode(self) -> str:
+        lines = "".join(f"data: {line}\n" for line in self.data.splitlines() or [""])
+        return f"event: {self.event}\n{lines}\n"
+
+
+HEARTBEAT = ": keep-alive\n\n"
+
+
+class RankingSubscription:
+    """
+    One client of the ranking feed with its own bounded queue.
+
+    Publishing never waits for a subscriber: when the queue is full the pending events are
+    discarded and replaced with a single ``resync`` event, after which the client is expected
+    to re-read the leaderboard through the regular endpoint.
+    """
+
+    def __init__(self, section_id: int | None, queue_size: int) -> None:
+        self.section_id = section_id
+        self._queue: asyncio.Queue[ServerSentEvent] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def push(self, event: ServerSentEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                if self._queue.get_nowait().event != RESYNC_EVENT:
+                    self.dropped += 1
+            self._queue.put_nowait(ServerSentEvent(event=RESYNC_EVENT, data="{}"))
+
+    async def get(self, timeout: float) -> ServerSentEvent | None:
+        """Wait for the next event, or return None after ``timeout`` seconds of silence."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class RankingBroadcaster:
+    """
+    In-process fan-out of leaderboard changes to server-sent-event clients.
+
+    A subscription is scoped to one section or, with ``section_id=None``, to the whole board;
+    ranks differ between the two, so every scope gets its own events. Every uvicorn worker has
+    its own broadcaster, so a client only receives the changes committed by the worker it is
+    connected to.
+    """
+
+    def __init__(self, *, queue_size: int, heartbeat_seconds: float) -> None:
+        self._queue_size = queue_size
+        self._heartbeat_seconds = heartbeat_seconds
+        self._subscribers: set[RankingSubscription] = set()
+        # board last sent to each scope, {participant_id: row}
+        self._published: dict[int | None, dict[int, Any]] = {}
+
+    def has_subscribers(self, section_id: int | None) -> bool:
+        return any(sub.section_id == section_id for sub in self._subscribers)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def changed_rows(self, section_id: int | None, board: Mapping[int, Any]) -> list[Any]:
+        """
+        Remember ``board`` as the current state of the scope and return its rows that differ
+        from the previously remembered board (every row the first time).
+
+        A score changes the rank of other participants too, so callers pass the whole ranked
+        scope and publish what this returns.
+        """
+        previous = self._published.get(section_id, {})
+        self._published[section_id] = dict(board)
+        return [row for key, row in board.items() if previous.get(key) != row]
+
+    def publish(self, section_id: int | None, event: ServerSentEvent) -> int:
+        """
+        Queue the event for every subscriber of the scope.
+
+        Returns:
+            Number of subscribers the event was queued for
+        """
+        delivered = 0
+        for subscription in list(self._subscribers):
+            if subscription.section_id == section_id:
+                subscription.push(event)
+                delivered += 1
+        return delivered
+
+    async def listen(self, section_id: int | None, ready: ServerSentEvent) -> AsyncIterator[str]:
+        """Yield encoded events for one client until it disconnects."""
+        subscription = RankingSubscription(section_id, self._queue_size)
+        self._subscribers.add(subscription)
+        try:
+            yield ready.encode()
+            while True:
+                event = await subscription.get(self._heartbeat_seconds)
+                yield event.encode() if event is not None else HEARTBEAT
+        finally:
+            self._subscribers.discard(subscription)
+            # nobody tracks the scope any more, its next subscriber starts from a fresh board
+            if not self.has_subscribers(section_id):
+                self._published.pop(section_id, None)
+
+
+ranking_broadcaster = RankingBroadcaster(
+    queue_size=settings.ranking_stream_queue_size,
+    heartbeat_seconds=settings.ranking_stream_heartbeat_seconds,
+)
+
+
+__all__ = [
+    "HEARTBEAT",
+    "RESYNC_EVENT",
+    "RankingBroadcaster",
+    "RankingSubscription",
+    "ServerSentEvent",
+    "ranking_broadcaster",
+]
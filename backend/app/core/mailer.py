@@ -0,0 +1,162 @@
+"""
+Outgoing e-mail over SMTP for the notification dispatcher.
+
+``smtplib`` is blocking, so every network call (connect, login, send, quit) runs in a
+worker thread via ``asyncio.to_thread``: a slow or unreachable mail server delays the
+dispatcher, never the event loop that serves the API. One connection is opened per batch
+and reused for all of its messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import smtplib
+import ssl
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from typing import Literal
+
+from app.core.config import Settings
+
+SmtpSecurity = Literal["ssl", "starttls", "none"]
+
+
+def build_message(sender: str, recipient: str, subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """Whether the server rejected a message for good (5xx), so retrying is pointless."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def is_connection_lost(error: Exception) -> bool:
+    """Whether the connection itself broke, so the rest of the batch cannot be sent over it."""
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(error, smtplib.SMTPException)
+
+
+class SmtpConnection:
+    """An open SMTP session; messages are sent one after another from a worker thread."""
+
+    def __init__(self, client: smtplib.SMTP) -> None:
+        self._client = client
+
+    async def send(self, message: EmailMessage) -> None:
+        """
+        Raises:
+            smtplib.SMTPException: if the server refuses the message
+            OSError: if the connection breaks
+        """
+        await asyncio.to_thread(self._client.send_message, message)
+
+
+class SmtpMailer:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        security: SmtpSecurity = "ssl",
+        username: str = "",
+        password: str = "",
+        sender: str = "",
+        timeout: float = 30.0,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._security = security
+        self._username = username
+        self._password = password
+        self.sender = sender or username
+        self._timeout = timeout
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> SmtpMailer:
+        return cls(
+            settings.smtp_host,
+            settings.smtp_port,
+            security=settings.smtp_security,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            sender=settings.smtp_sender,
+            timeout=settings.smtp_timeout_seconds,
+        )
+
+    def _open(self) -> smtplib.SMTP:
+        if self._security == "ssl":
+            client = smtplib.SMTP_SSL(
+                self._host, self._port, timeout=self._timeout, context=ssl.create_default_context()
+            )
+        else:
+            client = smtplib.SMTP(self._host, self._port, timeout=self._timeout)
+        try:
+            if self._security == "starttls":
+                client.starttls(context=ssl.create_default_context())
+            if self._username:
+                client.login(self._username, self._password)
+        except BaseException:
+            client.close()
+            raise
+        return client
+
+    @staticmethod
+    def _close(client: smtplib.SMTP) -> None:
+        try:
+            client.quit()
+        except (smtplib.SMTPException, OSError):
+            # the server may already have dropped the connection
+            client.close()
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[SmtpConnection]:
+        """
+        Open one SMTP session for a batch of messages.
+
+        Raises:
+            smtplib.SMTPException: if the server refuses the session (e.g. wrong credentials)
+            OSError: if the server cannot be reached
+        """
+        client = await asyncio.to_thread(self._open)
+        try:
+            yield SmtpConnection(client)
+        finally:
+            await asyncio.to_thread(self._close, client)
+
+
+class RateLimiter:
+    """
+    Spaces calls evenly at ``rate_per_second``; ``0`` disables the limit.
+
+    Mail providers throttle or block senders that burst, so the dispatcher waits here
+    before every message instead of sending a whole batch at once.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._interval = 1 / rate_per_second if rate_per_second > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        now = self._clock()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await self._sleep(slot - now)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class _RouteStats:
+    requests_by_status: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    duration_buckets: list[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    duration_seconds: float = 0.0
+    db_statements: int = 0
+    db_duration_seconds: float = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+class RequestMetrics:
+    """
+    Per-route request, SQL statement and timing totals of one worker process.
+
+    Routes are identified by their path template (``/api/v1/sections/{section_id}``), so the
+    number of series stays bounded. Counters start over when the worker restarts; Prometheus
+    handles that as a counter reset.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], _RouteStats] = {}
+
+    def observe(
+        self,
+        *,
+        method: str,
+        route: str,
+        status: int,
+        duration_seconds: float,
+        db_statements: int,
+        db_duration_seconds: float,
+    ) -> None:
+        """Record one finished request."""
+        bucket = bisect.bisect_left(DURATION_BUCKETS, duration_seconds)
+        with self._lock:
+            stats = self._routes.setdefault((method, route), _RouteStats())
+            stats.requests_by_status[status] += 1
+            if bucket < len(DURATION_BUCKETS):
+                stats.duration_buckets[bucket] += 1
+            stats.duration_seconds += duration_seconds
+            stats.db_statements += db_statements
+            stats.db_duration_seconds += db_duration_seconds
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = [
+                "# HELP http_requests_total Finished HTTP requests.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route), stats in routes:
+                for status, count in sorted(stats.requests_by_status.items()):
+                    labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+                    lines.append(f"http_requests_total{{{labels}}} {count}")
+
+            lines += [
+                "# HELP http_request_duration_seconds Time from receiving a request to sending the last byte.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), stats in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                requests = sum(stats.requests_by_status.values())
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS, stats.duration_buckets, strict=True):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {requests}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {_format_float(stats.duration_seconds)}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {requests}")
+
+            lines += [
+                "# HELP db_statements_total SQL statements executed while serving requests.",
+                "# TYPE db_statements_total counter",
+            ]
+            for (method, route), stats in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                lines.append(f"db_statements_total{{{labels}}} {stats.db_statements}")
+
+            lines += [
+                "# HELP db_duration_seconds_total Time spent executing SQL statements while serving requests.",
+                "# TYPE db_duration_seconds_total counter",
+            ]
+            for (method, route), stats in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                lines.append(f"db_duration_seconds_total{{{labels}}} {_format_float(stats.db_duration_seconds)}")
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+__all__ = ["DURATION_BUCKETS", "RequestMetrics", "request_metrics"]
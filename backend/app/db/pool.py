@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings
+
+
+@dataclass(slots=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    timeout_seconds: float
+    checkouts: int
+    checkout_timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    ``AsyncAdaptedQueuePool`` that measures how long checkouts take.
+
+    The measured time covers waiting for a free connection, opening a new one when the pool
+    grows into overflow and the pre-ping when it is enabled. Counters are per pool instance and
+    start over when the engine recreates its pool (e.g. after ``dispose()``).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # Measured around connect(): QueuePool._do_get calls itself again when it loses a race for
+    # an overflow slot, so one checkout may pass through it more than once
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._checkouts += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            return PoolStats(
+                size=self.size(),
+                checked_out=self.checkedout(),
+                checked_in=self.checkedin(),
+                overflow=max(self.overflow(), 0),
+                max_overflow=self._max_overflow,
+                timeout_seconds=self.timeout(),
+                checkouts=self._checkouts,
+                checkout_timeouts=self._checkout_timeouts,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+            )
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` built from the pool/asyncpg settings."""
+    connect_args: dict[str, Any] = {
+        # asyncpg's own statement cache and SQLAlchemy's prepared statement cache on top of it;
+        # both must be 0 behind a transaction-pooling pgbouncer
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+    if settings.db_command_timeout is not None:
+        connect_args["command_timeout"] = settings.db_command_timeout
+
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    """Live statistics of the engine pool, or None if it is not instrumented."""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return None
+    return pool.stats()
+
+
+__all__ = ["InstrumentedAsyncPool", "PoolStats", "engine_options", "get_pool_stats"]
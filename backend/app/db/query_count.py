@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_STARTED_KEY = "query_count_started"
+
+
+@dataclass(slots=True)
+class QueryCounter:
+    """SQL statements sent to the database inside a ``count_queries`` block and the time they took."""
+
+    count: int = 0
+    duration_seconds: float = 0.0
+
+
+_active_counters: ContextVar[tuple[QueryCounter, ...]] = ContextVar("query_counters", default=())
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Count statements executed by the current task (and the tasks it spawns) until exit.
+
+    Blocks may be nested (e.g. the ``X-Query-Count`` and ``Server-Timing`` middlewares);
+    every enclosing block sees the statement.
+    """
+    counter = QueryCounter()
+    token = _active_counters.set((*_active_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+def _on_before_cursor_execute(conn, *_args) -> None:
+    counters = _active_counters.get()
+    if not counters:
+        return
+    for counter in counters:
+        counter.count += 1
+    # statements on one connection run one at a time; a failed one is overwritten by the next
+    conn.info[_STARTED_KEY] = time.perf_counter()
+
+
+def _on_after_cursor_execute(conn, *_args) -> None:
+    started = conn.info.pop(_STARTED_KEY, None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    for counter in _active_counters.get():
+        counter.duration_seconds += elapsed
+
+
+def install_query_counter(engine: AsyncEngine) -> None:
+    """Make ``count_queries`` see the statements executed through ``engine``."""
+    for name, listener in (
+        ("before_cursor_execute", _on_before_cursor_execute),
+        ("after_cursor_execute", _on_after_cursor_execute),
+    ):
+        if not event.contains(engine.sync_engine, name, listener):
+            event.listen(engine.sync_engine, name, listener)
+
+
+__all__ = ["QueryCounter", "count_queries", "install_query_counter"]
@@ -1,4 +1,7 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import cycle
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -8,19 +11,81 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.db.pool import engine_options
+from app.db.query_count import install_query_counter
 
 
-def get_engine() -> AsyncEngine:
-    return create_async_engine(settings.database_url, echo=settings.db_echo, future=True)
+def get_engine(url: str | None = None) -> AsyncEngine:
+    return create_async_engine(
+        url or settings.database_url,
+        echo=settings.db_echo,
+        future=True,
+        **engine_options(settings),
+    )
 
 
 engine = get_engine()
+install_query_counter(engine)
 AsyncSessionMaker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+replica_engines = [get_engine(url) for url in settings.replica_database_urls]
+for replica_engine in replica_engines:
+    install_query_counter(replica_engine)
+ReplicaSessionMakers = [
+    async_sessionmaker(replica_engine, expire_on_commit=False, class_=AsyncSession)
+    for replica_engine in replica_engines
+]
+_replica_rotation = cycle(ReplicaSessionMakers)
+
+_read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+@contextmanager
+def read_from_primary(enabled: bool = True) -> Iterator[None]:
+    """Route read-only sessions opened inside the block to the primary (read-your-writes)."""
+    token = _read_from_primary.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_primary.reset(token)
+
+
+def reads_pinned_to_primary() -> bool:
+    """Whether the current request asked for read-your-writes while replicas are configured."""
+    return bool(ReplicaSessionMakers) and _read_from_primary.get()
+
+
+def get_read_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory for read-only work.
+
+    Replicas are used round-robin; without replicas, or inside ``read_from_primary()``,
+    reads go to the primary like everything else.
+    """
+    if not ReplicaSessionMakers or _read_from_primary.get():
+        return AsyncSessionMaker
+    return next(_replica_rotation)
+
 
 async def get_db_session() -> AsyncIterator[AsyncSession]:
     async with AsyncSessionMaker() as session:
         yield session
 
 
-__all__ = ["engine", "AsyncSessionMaker", "get_db_session"]
+async def get_read_db_session() -> AsyncIterator[AsyncSession]:
+    """Session for queries that never write; may lag behind the primary by the replication delay."""
+    async with get_read_session_maker()() as session:
+        yield session
+
+
+__all__ = [
+    "engine",
+    "replica_engines",
+    "AsyncSessionMaker",
+    "ReplicaSessionMakers",
+    "get_db_session",
+    "get_read_db_session",
+    "get_read_session_maker",
+    "read_from_primary",
+    "reads_pinned_to_primary",
+]
@@ -1,12 +1,51 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.adapters.api import metrics
+from app.adapters.api.middleware import QueryCountMiddleware, ReadYourWritesMiddleware, RequestMetricsMiddleware
 from app.adapters.api.v1 import router as api_v1_router
 from app.core.config import settings
+from app.core.metrics import request_metrics
+from app.db.session import AsyncSessionMaker
+from app.services.notification import NotificationDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Run the notification dispatcher next to the API when NOTIFICATION_WORKER is enabled."""
+    if not settings.notification_worker:
+        yield
+        return
+    if not settings.smtp_host:
+        logger.warning("NOTIFICATION_WORKER is enabled but SMTP_HOST is empty; notifications stay queued")
+        yield
+        return
+
+    stop = asyncio.Event()
+    dispatcher = asyncio.create_task(NotificationDispatcher.from_settings(AsyncSessionMaker, settings).run(stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        await dispatcher
 
 
 def create_app() -> FastAPI:
-    application = FastAPI(title=settings.app_name)
+    application = FastAPI(title=settings.app_name, lifespan=lifespan)
     application.include_router(api_v1_router, prefix=settings.api_v1_prefix)
+    if settings.db_query_count_header:
+        application.add_middleware(QueryCountMiddleware)
+    if settings.request_metrics:
+        application.include_router(metrics.router)
+        application.add_middleware(RequestMetricsMiddleware, metrics=request_metrics)
+    if settings.replica_database_urls:
+        application.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.db_read_your_writes_seconds)
     return application
 
 
@@ -3,13 +3,17 @@ from __future__ import annotations
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Computed,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -142,6 +146,9 @@ class Section(Base):
     section_juries: Mapped[list[SectionJury]] = relationship(back_populates="section")
     organizer_changes: Mapped[list[OrganizerSectionChange]] = relationship(back_populates="section")
     event_links: Mapped[list[EventSection]] = relationship(back_populates="section")
+    draws: Mapped[list[Draw]] = relationship(
+        back_populates="section", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class EventSection(Base):
@@ -157,6 +164,7 @@ class EventSection(Base):
 
 class Topic(Base):
     __tablename__ = "topics"
+    __table_args__ = (Index("ix_topics_section_id", "section_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     section_id: Mapped[int | None] = mapped_column(ForeignKey("sections.id", ondelete="SET NULL"))
@@ -169,6 +177,7 @@ class Topic(Base):
 
 class Group(Base):
     __tablename__ = "groups"
+    __table_args__ = (Index("ix_groups_section_id", "section_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     section_id: Mapped[int | None] = mapped_column(ForeignKey("sections.id", ondelete="SET NULL"))
@@ -183,6 +192,11 @@ class Group(Base):
 
 class GroupTopic(Base):
     __tablename__ = "group_topics"
+    __table_args__ = (
+        # draw results join groups to their topics without visiting the heap
+        Index("ix_group_topics_group_id", "group_id", postgresql_include=["topic_id"]),
+        Index("ix_group_topics_topic_id", "topic_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id", ondelete="CASCADE"))
@@ -192,6 +206,23 @@ class GroupTopic(Base):
     topic: Mapped[Topic | None] = relationship(back_populates="group_topics")
 
 
+class Draw(Base):
+    """A topic draw of one section: the seed and inputs the current ``group_topics`` were computed from."""
+
+    __tablename__ = "draws"
+    # the latest draw of a section
+    __table_args__ = (Index("ix_draws_section_id", "section_id", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    section_id: Mapped[int] = mapped_column(ForeignKey("sections.id", ondelete="CASCADE"))
+    seed: Mapped[str] = mapped_column(String(64))
+    algorithm: Mapped[str] = mapped_column(String(32))
+    inputs_digest: Mapped[str] = mapped_column(String(64))
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    section: Mapped[Section] = relationship(back_populates="draws")
+
+
 class Teacher(Base):
     __tablename__ = "teachers"
 
@@ -208,6 +239,10 @@ class Teacher(Base):
 
 class Participant(Base):
     __tablename__ = "participants"
+    __table_args__ = (
+        Index("ix_participants_section_id", "section_id"),
+        Index("ix_participants_person_id", "person_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     person_id: Mapped[int | None] = mapped_column(ForeignKey("people.id", ondelete="SET NULL"))
@@ -233,6 +268,7 @@ class Participant(Base):
     group_participants: Mapped[list[GroupParticipant]] = relationship(back_populates="participant")
     jury_scores: Mapped[list[JuryScore]] = relationship(back_populates="participant")
     organizer_changes: Mapped[list[OrganizerParticipantChange]] = relationship(back_populates="participant")
+    leaderboard_entry: Mapped[ParticipantLeaderboard | None] = relationship(back_populates="participant")
 
 
 class GroupParticipant(Base):
@@ -265,7 +301,11 @@ class Jury(Base):
 
 class SectionJury(Base):
     __tablename__ = "section_juries"
-    __table_args__ = (UniqueConstraint("section_id", "jury_id", name="uq_section_jury"),)
+    __table_args__ = (
+        UniqueConstraint("section_id", "jury_id", name="uq_section_jury"),
+        # jury -> sections lookups (jury progress, jury-scoped leaderboard) as index-only scans
+        Index("ix_section_juries_jury_id", "jury_id", postgresql_include=["section_id"]),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     section_id: Mapped[int] = mapped_column(ForeignKey("sections.id", ondelete="CASCADE"))
@@ -277,7 +317,14 @@ class SectionJury(Base):
 
 class JuryScore(Base):
     __tablename__ = "jury_scores"
-    __table_args__ = (UniqueConstraint("jury_id", "participant_id", name="uq_jury_participant_score"),)
+    __table_args__ = (
+        # also serves lookups by jury_id alone
+        UniqueConstraint("jury_id", "participant_id", name="uq_jury_participant_score"),
+        # covers the leaderboard aggregate and jury progress without visiting the heap
+        Index("ix_jury_scores_participant_id", "participant_id", postgresql_include=["jury_id", "total"]),
+    )
+    # read back the generated total on UPDATE as well (INSERT already uses RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
     jury_id: Mapped[int | None] = mapped_column(ForeignKey("juries.id", ondelete="SET NULL"))
@@ -288,14 +335,29 @@ class JuryScore(Base):
     mechanics: Mapped[float | None] = mapped_column(Float)
     delivery: Mapped[float | None] = mapped_column(Float)
     comment: Mapped[str | None] = mapped_column(String(100))
+    # sum of the criteria, kept by the database on every write; unset criteria count as 0
+    total: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "coalesce(organization_score, 0) + coalesce(content, 0) + coalesce(visuals, 0)"
+            " + coalesce(mechanics, 0) + coalesce(delivery, 0)",
+            persisted=True,
+        ),
+        nullable=False,
+    )
 
     jury: Mapped[Jury | None] = relationship(back_populates="jury_scores")
     participant: Mapped[Participant | None] = relationship(back_populates="jury_scores")
-    changes: Mapped[list[JuryScoreChange]] = relationship(back_populates="jury_score")
+    # the database removes the audit trail with the score (ON DELETE CASCADE)
+    changes: Mapped[list[JuryScoreChange]] = relationship(
+        back_populates="jury_score", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class JuryScoreChange(Base):
     __tablename__ = "jury_scores_changes"
+    # history of one score, newest first, straight from the index
+    __table_args__ = (Index("ix_jury_scores_changes_jury_scores_id", "jury_scores_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     jury_scores_id: Mapped[int] = mapped_column(ForeignKey("jury_scores.id", ondelete="CASCADE"))
@@ -306,6 +368,20 @@ class JuryScoreChange(Base):
     jury: Mapped[Jury | None] = relationship(back_populates="jury_score_changes")
 
 
+class ParticipantLeaderboard(Base):
+    """Precomputed per-participant score totals maintained on every jury score write."""
+
+    __tablename__ = "participant_leaderboard"
+    __table_args__ = (Index("ix_participant_leaderboard_total_score", "total_score"),)
+
+    participant_id: Mapped[int] = mapped_column(ForeignKey("participants.id", ondelete="CASCADE"), primary_key=True)
+    total_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    scores_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    participant: Mapped[Participant] = relationship(back_populates="leaderboard_entry")
+
+
 class OrganizerSectionChange(Base):
     __tablename__ = "organizer_section_changes"
 
@@ -332,6 +408,8 @@ class OrganizerParticipantChange(Base):
 
 class TechnicalRequirement(Base):
     __tablename__ = "technical_requirements"
+    # the draw checks every topic for poster requirements
+    __table_args__ = (Index("ix_technical_requirements_topic_id", "topic_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     topic_id: Mapped[int | None] = mapped_column(ForeignKey("topics.id", ondelete="SET NULL"))
@@ -355,6 +433,29 @@ class PosterContent(Base):
     technical_requirement: Mapped[TechnicalRequirement | None] = relationship(back_populates="posters_content")
 
 
+class NotificationOutbox(Base):
+    """E-mails waiting to be sent by the notification dispatcher, one row per recipient."""
+
+    __tablename__ = "notification_outbox"
+    # the dispatcher claims due pending messages in next_attempt_at order
+    __table_args__ = (
+        Index("ix_notification_outbox_due", "next_attempt_at", "id", postgresql_where=text("status = 'pending'")),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(32))
+    recipient: Mapped[str] = mapped_column(String(255))
+    subject: Mapped[str] = mapped_column(String(255))
+    body: Mapped[str] = mapped_column(Text)
+    # pending -> sent | failed (attempts exhausted or rejected permanently)
+    status: Mapped[str] = mapped_column(String(16), default="pending", server_default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    next_attempt_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    sent_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True))
+
+
 __all__ = [
     "Base",
     "University",
@@ -378,8 +479,10 @@ __all__ = [
     "SectionJury",
     "JuryScore",
     "JuryScoreChange",
+    "ParticipantLeaderboard",
     "OrganizerSectionChange",
     "OrganizerParticipantChange",
     "TechnicalRequirement",
     "PosterContent",
+    "NotificationOutbox",
 ]
@@ -0,0 +1,108 @@
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Insert, insert, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.models import Base
+
+
+async def get_by_pk[ModelT: Base](
+    session: AsyncSession,
+    model: type[ModelT],
+    pk: Any,
+    *,
+    options: Sequence[ORMOption] = (),
+) -> ModelT | None:
+    """
+    Fetch one row by primary key.
+
+    ``AsyncSession.get`` answers from the session identity map when the object was already
+    loaded in this request (e.g. by a previous lookup or an INSERT ... RETURNING), and only
+    queries the database otherwise. Loader ``options`` apply only when a query is issued;
+    joined many-to-one parents land in the identity map too, so their own lookups are free.
+    """
+    return await session.get(model, pk, options=options)
+
+
+async def get_many_by_pk[ModelT: Base](
+    session: AsyncSession, model: type[ModelT], pks: Iterable[Any]
+) -> dict[Any, ModelT]:
+    """
+    Fetch several rows by primary key with at most one ``IN`` query.
+
+    Objects already present (and not expired) in the session identity map are reused; only
+    the remaining keys are loaded.
+
+    Returns:
+        ``{pk: instance}`` for the keys that exist
+    """
+    found: dict[Any, ModelT] = {}
+    missing = []
+    for pk in dict.fromkeys(pk for pk in pks if pk is not None):
+        instance = session.identity_map.get(session.identity_key(model, pk))
+        if instance is not None and not inspect(instance).expired:
+            found[pk] = instance
+        else:
+            missing.append(pk)
+
+    if missing:
+        pk_column = inspect(model).primary_key[0]
+        result = await session.execute(select(model).where(pk_column.in_(missing)))
+        for instance in result.scalars():
+            found[inspect(instance).identity[0]] = instance
+    return found
+
+
+async def insert_returning[ModelT: Base](
+    session: AsyncSession, model: type[ModelT], values: Mapping[str, Any]
+) -> ModelT:
+    """
+    Insert one row with ``INSERT ... RETURNING`` and return it as a persistent instance.
+
+    Server-generated columns (primary key, ``server_default``, computed columns) come back in
+    the same round trip, so no ``flush()`` + ``refresh()`` is needed. The instance lands in
+    the identity map, so later ``get_by_pk`` lookups of it are free.
+    """
+    result = await session.execute(insert(model).values(**values).returning(model))
+    return result.scalar_one()
+
+
+async def update_returning[ModelT: Base](
+    session: AsyncSession,
+    instance: ModelT,
+    values: Mapping[str, Any],
+    *,
+    audit: Insert | None = None,
+) -> ModelT:
+    """
+    Update the row of a loaded instance with ``UPDATE ... RETURNING`` and refresh it in place.
+
+    Args:
+        session: Session the instance belongs to
+        instance: Persistent instance to update
+        values: Column values to set; with no values nothing but ``audit`` is executed
+        audit: Optional INSERT (e.g. a change log row) attached to the UPDATE as a CTE, so it
+            is written by the same statement
+
+    Returns:
+        The same instance with every column as stored (including server-computed ones)
+    """
+    if not values:
+        if audit is not None:
+            await session.execute(audit)
+        return instance
+
+    model = type(instance)
+    mapper = inspect(model)
+    # filter on mapped attributes: with plain table columns the ORM cannot map RETURNING rows once a CTE is attached
+    pk_attributes = (getattr(model, mapper.get_property_by_column(column).key) for column in mapper.primary_key)
+    stmt = update(model).where(
+        *(attr == value for attr, value in zip(pk_attributes, inspect(instance).identity, strict=True))
+    )
+    stmt = stmt.values(**values).returning(model).execution_options(populate_existing=True)
+    if audit is not None:
+        stmt = stmt.add_cte(audit.cte("audit"))
+    result = await session.execute(stmt)
+    return result.scalar_one()
@@ -0,0 +1,161 @@
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Draw,
+    Event,
+    EventSection,
+    Faculty,
+    Group,
+    GroupParticipant,
+    GroupTopic,
+    Participant,
+    Section,
+    TechnicalRequirement,
+    Topic,
+)
+
+
+class DrawRepository:
+    """Data access layer for the topic draw (``draws`` and the ``group_topics`` assignments)."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def lock_sections(self, section_ids: Sequence[int]) -> list[int]:
+        """
+        Lock the section rows until the end of the transaction.
+
+        Concurrent draws of the same section (another worker, a double click, an event-wide
+        draw) wait for each other instead of interleaving their deletes and inserts. Rows
+        are locked in ID order, so overlapping draws cannot deadlock.
+
+        Returns:
+            IDs of the sections that exist, ascending
+        """
+        stmt = select(Section.id).where(Section.id.in_(section_ids)).order_by(Section.id).with_for_update()
+        return list(await self._session.scalars(stmt))
+
+    async def lock_event_sections(self, event_id: int) -> list[int]:
+        """
+        Lock the sections of an event, see ``lock_sections``.
+
+        Returns:
+            IDs of the event's sections, ascending
+        """
+        event_sections = select(EventSection.section_id).where(EventSection.event_id == event_id)
+        stmt = select(Section.id).where(Section.id.in_(event_sections)).order_by(Section.id).with_for_update()
+        return list(await self._session.scalars(stmt))
+
+    async def event_exists(self, event_id: int) -> bool:
+        return await self._session.scalar(select(Event.id).where(Event.id == event_id)) is not None
+
+    async def section_exists(self, section_id: int) -> bool:
+        return await self._session.scalar(select(Section.id).where(Section.id == section_id)) is not None
+
+    async def list_topics(self, section_ids: Sequence[int]) -> Sequence[Row]:
+        """
+        Topics of the sections with their draw constraints.
+
+        Returns:
+            Rows with ``section_id``, ``id`` and ``needs_poster`` (the topic has technical
+            requirements), ordered by section and ID
+        """
+        needs_poster = select(TechnicalRequirement.id).where(TechnicalRequirement.topic_id == Topic.id).exists()
+        stmt = (
+            select(Topic.section_id, Topic.id, needs_poster.label("needs_poster"))
+            .where(Topic.section_id.in_(section_ids))
+            .order_by(Topic.section_id, Topic.id)
+        )
+        return (await self._session.execute(stmt)).all()
+
+    async def list_groups(self, section_ids: Sequence[int]) -> Sequence[Row]:
+        """
+        Groups registered in the sections with their draw constraints.
+
+        Returns:
+            Rows with ``section_id``, ``id``, ``member_count``, ``university_id`` (the most
+            common university of the members' faculties, None if unknown) and
+            ``has_poster_participants``, ordered by section and ID
+        """
+        members = (
+            select(GroupParticipant.group_id)
+            .join(Participant, Participant.id == GroupParticipant.participant_id)
+            .where(GroupParticipant.group_id == Group.id)
+        )
+        university_id = (
+            members.with_only_columns(Faculty.university_id)
+            .join(Faculty, Faculty.id == Participant.faculty_id)
+            .where(Faculty.university_id.is_not(None))
+            .group_by(Faculty.university_id)
+            .order_by(func.count().desc(), Faculty.university_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        has_poster_participants = members.where(Participant.is_poster_participant).exists()
+        stmt = (
+            select(
+                Group.section_id,
+                Group.id,
+                Group.member_count,
+                university_id.label("university_id"),
+                has_poster_participants.label("has_poster_participants"),
+            )
+            .where(Group.section_id.in_(section_ids))
+            .order_by(Group.section_id, Group.id)
+        )
+        return (await self._session.execute(stmt)).all()
+
+    async def replace_assignments(self, section_ids: Sequence[int], assignments: Iterable[tuple[int, int]]) -> None:
+        """
+        Replace the topic assignments of every group in the sections.
+
+        Args:
+            section_ids: IDs of the sections
+            assignments: ``(group_id, topic_id)`` pairs, written with one multi-row INSERT
+        """
+        section_groups = select(Group.id).where(Group.section_id.in_(section_ids))
+        await self._session.execute(delete(GroupTopic).where(GroupTopic.group_id.in_(section_groups)))
+
+        rows = [{"group_id": group_id, "topic_id": topic_id} for group_id, topic_id in assignments]
+        if rows:
+            await self._session.execute(insert(GroupTopic), rows)
+
+    async def create_draws(self, draws: list[dict]) -> Sequence[Draw]:
+        """Insert the draw records with one multi-row INSERT ... RETURNING."""
+        if not draws:
+            return []
+        result = await self._session.scalars(insert(Draw).returning(Draw, sort_by_parameter_order=True), draws)
+        return result.all()
+
+    async def get_latest_draw(self, section_id: int) -> Draw | None:
+        stmt = select(Draw).where(Draw.section_id == section_id).order_by(Draw.id.desc()).limit(1)
+        return await self._session.scalar(stmt)
+
+    async def list_results(self, section_id: int) -> Sequence[Row]:
+        """
+        Draw results of a section: one row per assigned topic, ordered by group and topic.
+
+        Returns:
+            Rows with ``group_id``, ``group_name``, ``topic_id`` and ``topic_name``
+        """
+        stmt = (
+            select(
+                Group.id.label("group_id"),
+                Group.name.label("group_name"),
+                Topic.id.label("topic_id"),
+                Topic.name.label("topic_name"),
+            )
+            .join(GroupTopic, GroupTopic.group_id == Group.id)
+            .join(Topic, Topic.id == GroupTopic.topic_id)
+            .where(Group.section_id == section_id)
+            .order_by(Group.id, Topic.id)
+        )
+        result = await self._session.execute(stmt)
+        return result.all()
+
+    async def commit(self) -> None:
+        await self._session.commit()
@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
 from sqlalchemy import and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Jury, JuryScore, Participant, Person, SectionJury
+from app.repositories.base import get_by_pk, get_many_by_pk, insert_returning, update_returning
 from app.schemas import JuryCreate, JuryUpdate
 
 
@@ -39,30 +40,26 @@ class JuryRepository:
         Returns:
             Jury instance or None if not found
         """
-        stmt = select(Jury).where(Jury.id == jury_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, Jury, jury_id)
+
+    async def get_juries_by_ids(self, jury_ids: Iterable[int]) -> dict[int, Jury]:
+        """Retrieve several jury members at once (identity map first, then one ``IN`` query)."""
+        return await get_many_by_pk(self._session, Jury, jury_ids)
 
     async def create_jury(self, data: JuryCreate) -> Jury:
-        jury = Jury(
-            university_id=data.university_id,
-            person_id=data.person_id,
-            is_chairman=data.is_chairman,
-            access_key=data.access_key,
+        return await insert_returning(
+            self._session,
+            Jury,
+            {
+                "university_id": data.university_id,
+                "person_id": data.person_id,
+                "is_chairman": data.is_chairman,
+                "access_key": data.access_key,
+            },
         )
-        self._session.add(jury)
-        await self._session.flush()
-        await self._session.refresh(jury)
-        return jury
 
     async def update_jury(self, jury: Jury, data: JuryUpdate) -> Jury:
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(jury, field, value)
-
-        await self._session.flush()
-        await self._session.refresh(jury)
-        return jury
+        return await update_returning(self._session, jury, data.model_dump(exclude_unset=True))
 
     async def delete_jury(self, jury: Jury) -> None:
         await self._session.delete(jury)
@@ -79,14 +76,8 @@ class JuryRepository:
                 Person.first_name,
                 Person.last_name,
                 Participant.presentation_topic,
-                case((JuryScore.id.is_not(None), True), else_=False).label("is_graded"),
-                (
-                    func.coalesce(JuryScore.organization_score, 0)
-                    + func.coalesce(JuryScore.content, 0)
-                    + func.coalesce(JuryScore.visuals, 0)
-                    + func.coalesce(JuryScore.mechanics, 0)
-                    + func.coalesce(JuryScore.delivery, 0)
-                ).label("current_score"),
+                case((JuryScore.total.is_not(None), True), else_=False).label("is_graded"),
+                func.coalesce(JuryScore.total, 0).label("current_score"),
             )
             .join(Person, Participant.person_id == Person.id)
             .outerjoin(JuryScore, and_(JuryScore.participant_id == Participant.id, JuryScore.jury_id == jury_id))
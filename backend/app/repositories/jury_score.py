@@ -1,11 +1,25 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import Boolean, and_, literal, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import JuryScore, JuryScoreChange
-from app.schemas import JuryScoreCreate, JuryScoreUpdate
+from app.models import JuryScore, JuryScoreChange, Participant, SectionJury
+from app.repositories.base import get_by_pk, update_returning
+from app.schemas import JuryScoreCreate, JuryScoreRead, JuryScoreUpdate, JuryScoreUpsert
+
+SCORE_VALUE_FIELDS = ("organization_score", "content", "visuals", "mechanics", "delivery", "comment")
+
+
+@dataclass(slots=True)
+class UpsertedScore:
+    """Result of ``JuryScoreRepository.upsert_score``."""
+
+    score: JuryScoreRead
+    inserted: bool
+    section_id: int | None
 
 
 class JuryScoreRepository:
@@ -35,26 +49,34 @@ class JuryScoreRepository:
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
-    async def get_score_by_id(self, score_id: int, with_relations: bool = False) -> JuryScore | None:
+    async def get_score_by_id(
+        self, score_id: int, with_relations: bool = False, with_parents: bool = False
+    ) -> JuryScore | None:
         """
         Retrieve a jury score by ID.
 
         Args:
             score_id: ID of the jury score
             with_relations: If True, eagerly load related entities
+            with_parents: If True, load the jury member and participant in the same query, so
+                later lookups of them in this session are answered from the identity map
 
         Returns:
             JuryScore instance or None if not found
         """
-        stmt = select(JuryScore).where(JuryScore.id == score_id)
+        if not with_relations:
+            options = (joinedload(JuryScore.jury), joinedload(JuryScore.participant)) if with_parents else ()
+            return await get_by_pk(self._session, JuryScore, score_id, options=options)
 
-        if with_relations:
-            stmt = stmt.options(
+        stmt = (
+            select(JuryScore)
+            .where(JuryScore.id == score_id)
+            .options(
                 selectinload(JuryScore.jury),
                 selectinload(JuryScore.participant),
                 selectinload(JuryScore.changes),
             )
-
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -74,49 +96,149 @@ class JuryScoreRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def create_score(self, data: JuryScoreCreate) -> JuryScore:
+    async def create_score(self, data: JuryScoreCreate) -> JuryScore | None:
         """
         Create a new jury score.
 
+        Relies on ``uq_jury_participant_score`` instead of checking for an existing score first,
+        so two concurrent submissions cannot both pass.
+
         Args:
             data: Score creation data
 
         Returns:
-            Created JuryScore instance
-        """
-        score = JuryScore(
-            jury_id=data.jury_id,
-            participant_id=data.participant_id,
-            organization_score=data.organization_score,
-            content=data.content,
-            visuals=data.visuals,
-            mechanics=data.mechanics,
-            delivery=data.delivery,
-            comment=data.comment,
+            Created JuryScore instance, or None if this jury member has already scored the participant
+        """
+        created = await self.create_scores([data])
+        return created[0] if created else None
+
+    async def list_existing_pairs(self, pairs: Collection[tuple[int, int]]) -> set[tuple[int, int]]:
+        """
+        Return which ``(jury_id, participant_id)`` pairs already have a score, in one query.
+
+        Args:
+            pairs: Candidate ``(jury_id, participant_id)`` pairs
+
+        Returns:
+            Subset of ``pairs`` present in ``jury_scores``
+        """
+        if not pairs:
+            return set()
+
+        stmt = select(JuryScore.jury_id, JuryScore.participant_id).where(
+            tuple_(JuryScore.jury_id, JuryScore.participant_id).in_(list(pairs))
+        )
+        result = await self._session.execute(stmt)
+        return {(jury_id, participant_id) for jury_id, participant_id in result.all()}
+
+    async def create_scores(self, items: Sequence[JuryScoreCreate]) -> Sequence[JuryScore]:
+        """
+        Insert many jury scores with a single multi-row INSERT.
+
+        Rows that collide with an existing ``(jury_id, participant_id)`` score (for example one
+        written concurrently after validation) are skipped instead of failing the statement.
+
+        Args:
+            items: Validated score creation data
+
+        Returns:
+            Created JuryScore instances; colliding items are missing from the result
+        """
+        if not items:
+            return []
+
+        stmt = (
+            insert(JuryScore)
+            .values([item.model_dump() for item in items])
+            .on_conflict_do_nothing(constraint="uq_jury_participant_score")
+            .returning(JuryScore)
         )
-        self._session.add(score)
-        await self._session.flush()
-        await self._session.refresh(score)
-        return score
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
 
-    async def update_score(self, score: JuryScore, data: JuryScoreUpdate) -> JuryScore:
+    async def upsert_score(self, *, participant_id: int, jury_id: int, data: JuryScoreUpsert) -> UpsertedScore | None:
         """
-        Update an existing jury score.
+        Insert or replace the score of one jury member for one participant in a single statement.
+
+        The row is only written if the jury member is assigned to the participant's section.
+        When an existing score is replaced, a ``JuryScoreChange`` audit row is written by the
+        same statement.
+
+        Args:
+            participant_id: ID of the participant
+            jury_id: ID of the jury member
+            data: New values of all criteria and the comment
+
+        Returns:
+            The stored score, or None if the participant/jury pair is not allowed to score
+        """
+        values = data.model_dump(include=set(SCORE_VALUE_FIELDS))
+        source = (
+            select(
+                literal(jury_id).label("jury_id"),
+                Participant.id,
+                *(literal(values[field], JuryScore.__table__.c[field].type) for field in SCORE_VALUE_FIELDS),
+            )
+            .join(
+                SectionJury,
+                and_(SectionJury.section_id == Participant.section_id, SectionJury.jury_id == jury_id),
+            )
+            .where(Participant.id == participant_id)
+            .limit(1)
+        )
+        upsert = insert(JuryScore).from_select(["jury_id", "participant_id", *SCORE_VALUE_FIELDS], source)
+        upsert = upsert.on_conflict_do_update(
+            constraint="uq_jury_participant_score",
+            set_={field: upsert.excluded[field] for field in SCORE_VALUE_FIELDS},
+        ).returning(
+            *JuryScore.__table__.c,
+            # xmax is only zero for freshly inserted row versions
+            literal_column("xmax = 0", Boolean).label("inserted"),
+        )
+        upserted = upsert.cte("upserted")
+
+        audit = (
+            insert(JuryScoreChange)
+            .from_select(
+                ["jury_scores_id", "jury_id"],
+                select(upserted.c.id, literal(jury_id)).where(~upserted.c.inserted),
+            )
+            .cte("audit")
+        )
+        stmt = (
+            select(upserted, Participant.section_id)
+            .join(Participant, Participant.id == upserted.c.participant_id)
+            .add_cte(audit)
+        )
+
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+        if row is None:
+            return None
+        return UpsertedScore(
+            score=JuryScoreRead.model_validate(dict(row)),
+            inserted=row["inserted"],
+            section_id=row["section_id"],
+        )
+
+    async def update_score(self, score: JuryScore, data: JuryScoreUpdate, *, changed_by: int) -> JuryScore:
+        """
+        Update an existing jury score and record the change in its audit trail.
+
+        The ``JuryScoreChange`` row is inserted by a CTE of the same UPDATE statement, which
+        also returns the new values (including the generated ``total``), so an edit costs a
+        single round trip.
 
         Args:
             score: Existing JuryScore instance
             data: Update data with optional fields
+            changed_by: ID of the jury member making the update
 
         Returns:
             Updated JuryScore instance
         """
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(score, field, value)
-
-        await self._session.flush()
-        await self._session.refresh(score)
-        return score
+        audit = insert(JuryScoreChange).values(jury_scores_id=score.id, jury_id=changed_by)
+        return await update_returning(self._session, score, data.model_dump(exclude_unset=True), audit=audit)
 
     async def delete_score(self, score: JuryScore) -> None:
         """
@@ -128,23 +250,32 @@ class JuryScoreRepository:
         await self._session.delete(score)
         await self._session.flush()
 
-    async def create_score_change(self, jury_score_id: int, jury_id: int) -> JuryScoreChange:
+    async def list_score_changes(
+        self, score_id: int, *, limit: int, before_id: int | None = None
+    ) -> Sequence[JuryScoreChange]:
         """
-        Create an audit trail entry for score update.
+        Retrieve the audit trail of a score, newest change first (keyset pagination).
 
         Args:
-            jury_score_id: ID of the updated score
-            jury_id: ID of the jury member who made the change
+            score_id: ID of the jury score
+            limit: Maximum number of changes to return
+            before_id: Only return changes with a smaller ID (the last ID of the previous page)
 
         Returns:
-            Created JuryScoreChange instance
+            List of JuryScoreChange instances ordered by ID descending
         """
-        change = JuryScoreChange(
-            jury_scores_id=jury_score_id,
-            jury_id=jury_id,
-            # update_time is auto-generated by server_default
-        )
-        self._session.add(change)
-        await self._session.flush()
-        await self._session.refresh(change)
-        return change
+        stmt = select(JuryScoreChange).where(JuryScoreChange.jury_scores_id == score_id)
+        if before_id is not None:
+            stmt = stmt.where(JuryScoreChange.id < before_id)
+        stmt = stmt.order_by(JuryScoreChange.id.desc()).limit(limit)
+
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
+
+    async def commit(self) -> None:
+        """Commit the current unit of work (score, audit trail and leaderboard rows)."""
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        """Discard everything written in the current unit of work."""
+        await self._session.rollback()
@@ -0,0 +1,66 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import NotificationOutbox
+
+
+class NotificationOutboxRepository:
+    """Data access layer for ``notification_outbox``, the queue of e-mails to send."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(self, messages: Sequence[dict]) -> None:
+        """Queue messages (``kind``, ``recipient``, ``subject``, ``body``) with one multi-row INSERT."""
+        await self._session.execute(insert(NotificationOutbox), messages)
+
+    async def claim_due(self, now: datetime, lease_until: datetime, limit: int) -> Sequence[Row]:
+        """
+        Take up to ``limit`` pending messages that are due and count the attempt.
+
+        The rows are locked with ``SKIP LOCKED``, so several dispatchers never claim the same
+        message, and ``next_attempt_at`` moves to ``lease_until``: if the dispatcher dies
+        before recording the outcome, the messages become due again once the lease ends.
+
+        Returns:
+            ``id``, ``recipient``, ``subject``, ``body`` and ``attempts`` of the claimed rows, oldest first
+        """
+        due = (
+            select(NotificationOutbox.id)
+            .where(NotificationOutbox.status == "pending", NotificationOutbox.next_attempt_at <= now)
+            .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(due.scalar_subquery()))
+            .values(attempts=NotificationOutbox.attempts + 1, next_attempt_at=lease_until)
+            .returning(
+                NotificationOutbox.id,
+                NotificationOutbox.recipient,
+                NotificationOutbox.subject,
+                NotificationOutbox.body,
+                NotificationOutbox.attempts,
+            )
+        )
+        rows = (await self._session.execute(stmt)).all()
+        # UPDATE ... RETURNING does not keep the order of the subquery
+        return sorted(rows, key=lambda row: row.id)
+
+    async def finish(self, outcomes: Iterable[dict]) -> None:
+        """
+        Record delivery outcomes, one executemany UPDATE by primary key.
+
+        Every outcome has ``id``, ``status``, ``next_attempt_at``, ``last_error`` and ``sent_at``.
+        """
+        outcomes = list(outcomes)
+        if outcomes:
+            await self._session.execute(update(NotificationOutbox), outcomes)
+
+    async def commit(self) -> None:
+        await self._session.commit()
@@ -1,7 +1,9 @@
-from sqlalchemy import select
+from collections.abc import Iterable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Participant
+from app.repositories.base import get_by_pk, get_many_by_pk
 
 
 class ParticipantRepository:
@@ -20,6 +22,19 @@ class ParticipantRepository:
         Returns:
             Participant instance or None if not found
         """
-        stmt = select(Participant).where(Participant.id == participant_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, Participant, participant_id)
+
+    async def get_participants_by_ids(self, participant_ids: Iterable[int]) -> dict[int, Participant]:
+        """
+        Retrieve several participants at once.
+
+        Participants already loaded in this session are reused, the rest are fetched with
+        a single ``IN`` query.
+
+        Args:
+            participant_ids: IDs to look up
+
+        Returns:
+            ``{participant_id: Participant}`` for the participants that exist
+        """
+        return await get_many_by_pk(self._session, Participant, participant_ids)
@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import JuryScore, Participant, ParticipantLeaderboard
+
+
+class ParticipantLeaderboardRepository:
+    """Write side of the participant leaderboard read model."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def refresh_participants(self, participant_ids: Iterable[int]) -> None:
+        """
+        Recompute leaderboard rows for the given participants.
+
+        Only the jury scores of the affected participants are aggregated, so the cost
+        of a refresh does not depend on the size of the whole leaderboard.
+
+        The participant rows are locked first, in ID order, by a statement of their own:
+        a transaction that scores the same participant concurrently waits until this one
+        commits, and its aggregate then starts from a snapshot that includes this score
+        instead of overwriting the total with a stale sum. ``FOR NO KEY UPDATE`` does not
+        conflict with the key-share locks that inserting jury scores takes on participants.
+
+        Args:
+            participant_ids: IDs of participants whose scores were written
+        """
+        ids = sorted({participant_id for participant_id in participant_ids if participant_id is not None})
+        if not ids:
+            return
+
+        await self._session.execute(
+            select(Participant.id)
+            .where(Participant.id.in_(ids))
+            .order_by(Participant.id)
+            .with_for_update(key_share=True)
+        )
+        await self._session.execute(self._build_upsert(self._build_aggregate().where(Participant.id.in_(ids))))
+
+    async def rebuild(self) -> int:
+        """
+        Drop and recompute the whole leaderboard from jury scores.
+
+        Intended for disaster recovery, see ``app.commands.rebuild_leaderboard``.
+
+        Returns:
+            Number of leaderboard rows written
+        """
+        await self._session.execute(delete(ParticipantLeaderboard))
+        result = await self._session.execute(self._build_upsert(self._build_aggregate()))
+        return result.rowcount
+
+    @staticmethod
+    def _build_aggregate() -> Select:
+        # Only the generated total is read, so the covering index answers without the heap
+        return (
+            select(
+                Participant.id,
+                func.coalesce(func.sum(JuryScore.total), 0.0),
+                func.count(JuryScore.total),
+            )
+            .select_from(Participant)
+            .outerjoin(JuryScore, JuryScore.participant_id == Participant.id)
+            .group_by(Participant.id)
+        )
+
+    @staticmethod
+    def _build_upsert(aggregate: Select):
+        stmt = insert(ParticipantLeaderboard).from_select(
+            ["participant_id", "total_score", "scores_count"],
+            aggregate,
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[ParticipantLeaderboard.participant_id],
+            set_={
+                "total_score": stmt.excluded.total_score,
+                "scores_count": stmt.excluded.scores_count,
+                "updated_at": func.now(),
+            },
+        )
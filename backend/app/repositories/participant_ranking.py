@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    FromClause,
+    Numeric,
+    Select,
+    and_,
+    cast,
+    distinct,
+    false,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import JuryScore, Participant, Person, Section, SectionJury
-from app.schemas import ParticipantRankingSortField, SortOrder
+from app.models import JuryScore, Participant, ParticipantLeaderboard, Person, Section, SectionJury
+from app.schemas import ParticipantRankingSortField, RankingNormalization, SortOrder
+
+# Normalized totals are rounded in SQL so that keyset cursors compare equal across executions
+NORMALIZED_TOTAL_SCALE = 6
 
 
 @dataclass(slots=True)
@@ -27,8 +44,26 @@ class ParticipantRankingRecord:
     rank: int
 
 
+@dataclass(slots=True)
+class ParticipantRankingPage:
+    """One page of the leaderboard; ``total`` is None when counting was not requested."""
+
+    items: list[ParticipantRankingRecord]
+    total: int | None
+    has_next: bool
+
+
+@dataclass(slots=True, frozen=True)
+class SortKey:
+    """Single ORDER BY component, also used to build keyset predicates."""
+
+    field: str
+    descending: bool
+    nulls_last: bool
+
+
 class ParticipantRankingRepository:
-    """Aggregated read-model for participant leaderboard."""
+    """Read side of the participant leaderboard backed by ``participant_leaderboard``."""
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -38,35 +73,113 @@ class ParticipantRankingRepository:
         *,
         section_id: int | None = None,
         jury_id: int | None = None,
-        participant_id: int | None = None,
         page: int,
         page_size: int,
         sort_by: ParticipantRankingSortField,
         sort_order: SortOrder,
-    ) -> tuple[list[ParticipantRankingRecord], int]:
+        after: Sequence[Any] | None = None,
+        include_total: bool = True,
+        normalization: RankingNormalization = RankingNormalization.NONE,
+    ) -> ParticipantRankingPage:
         """
         Return aggregated scores for participants ordered by the requested sorting strategy.
-        """
 
-        base_stmt = self._build_base_statement(section_id=section_id, jury_id=jury_id, participant_id=participant_id)
-        leaderboard_subquery = base_stmt.subquery()
-        ranked_subquery = select(
-            leaderboard_subquery,
-            func.dense_rank().over(order_by=leaderboard_subquery.c.total_score.desc()).label("rank"),
-        ).subquery()
+        Args:
+            after: Sort key values of the last row already seen (see ``sort_keys``). When
+                provided, the page starts right after that row (keyset pagination) and
+                ``page`` is ignored; otherwise the page is selected with OFFSET.
+            include_total: If False, the total number of rows is not counted
+            normalization: Rescale every jury member's scores before summing, see ``_build_totals``
+        """
 
-        stmt = select(ranked_subquery)
-        stmt = self._apply_sorting(stmt, ranked_subquery, sort_by=sort_by, sort_order=sort_order)
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        ranked_subquery = self._build_ranked_subquery(
+            section_id=section_id,
+            jury_id=jury_id,
+            include_total=include_total,
+            normalization=normalization,
+        )
 
-        total_stmt = select(func.count()).select_from(leaderboard_subquery)
+        keys = self.sort_keys(sort_by=sort_by, sort_order=sort_order)
+        stmt = select(ranked_subquery).order_by(*self._order_clauses(ranked_subquery, keys))
+        if after is not None:
+            stmt = stmt.where(self._keyset_predicate(ranked_subquery, keys, after))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        # One extra row tells whether a next page exists without counting
+        stmt = stmt.limit(page_size + 1)
 
         result = await self._session.execute(stmt)
         rows: Sequence[dict] = result.mappings().all()
-        total_result = await self._session.execute(total_stmt)
-        total = int(total_result.scalar_one())
 
-        return [self._map_row(row) for row in rows], total
+        total = None
+        if include_total:
+            if rows:
+                total = int(rows[0]["total_count"])
+            elif after is None and page == 1:
+                total = 0
+            else:
+                # Past the last row the window has nothing to report, count separately
+                total = await self.count_rankings(section_id=section_id, jury_id=jury_id)
+
+        return ParticipantRankingPage(
+            items=[self._map_row(row) for row in rows[:page_size]],
+            total=total,
+            has_next=len(rows) > page_size,
+        )
+
+    async def stream_rankings(
+        self,
+        *,
+        section_id: int | None = None,
+        jury_id: int | None = None,
+        sort_by: ParticipantRankingSortField,
+        sort_order: SortOrder,
+        batch_size: int = 500,
+        normalization: RankingNormalization = RankingNormalization.NONE,
+    ) -> AsyncIterator[ParticipantRankingRecord]:
+        """
+        Yield the whole leaderboard through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory does not grow with the number
+        of participants.
+        """
+        ranked_subquery = self._build_ranked_subquery(
+            section_id=section_id,
+            jury_id=jury_id,
+            include_total=False,
+            normalization=normalization,
+        )
+        keys = self.sort_keys(sort_by=sort_by, sort_order=sort_order)
+        stmt = (
+            select(ranked_subquery)
+            .order_by(*self._order_clauses(ranked_subquery, keys))
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await self._session.stream(stmt)
+        async for row in result.mappings():
+            yield self._map_row(row)
+
+    async def list_scope_rankings(self, *, section_id: int | None = None) -> list[ParticipantRankingRecord]:
+        """Return every entry of the section (or of the whole board) with its dense rank, in one query."""
+        ranked_subquery = self._build_ranked_subquery(
+            section_id=section_id,
+            jury_id=None,
+            include_total=False,
+            normalization=RankingNormalization.NONE,
+        )
+        result = await self._session.execute(select(ranked_subquery))
+        return [self._map_row(row) for row in result.mappings()]
+
+    async def count_rankings(self, *, section_id: int | None = None, jury_id: int | None = None) -> int:
+        """Return the number of participants in the section/jury scope."""
+        stmt = self._apply_scope(
+            select(func.count()).select_from(Participant),
+            section_id=section_id,
+            jury_id=jury_id,
+        )
+        result = await self._session.execute(stmt)
+        return int(result.scalar_one())
 
     async def get_ranking_by_participant(
         self,
@@ -74,17 +187,68 @@ class ParticipantRankingRepository:
         *,
         section_id: int | None = None,
         jury_id: int | None = None,
+        normalization: RankingNormalization = RankingNormalization.NONE,
     ) -> ParticipantRankingRecord | None:
-        rankings, _ = await self.list_rankings(
+        """
+        Return a single leaderboard entry with its dense rank inside the section/jury scope.
+
+        The rank is ``1 + number of distinct totals above the participant's total``, so for raw
+        totals the lookup is a range scan over the ``total_score`` index instead of ranking the
+        whole board.
+        """
+        target = self._build_base_statement(
             section_id=section_id,
             jury_id=jury_id,
             participant_id=participant_id,
-            page=1,
-            page_size=1,
-            sort_by=ParticipantRankingSortField.TOTAL_SCORE,
-            sort_order=SortOrder.DESC,
-        )
-        return rankings[0] if rankings else None
+            normalization=normalization,
+        ).subquery("target")
+
+        if normalization is RankingNormalization.NONE:
+            higher_totals = (
+                select(func.count(distinct(ParticipantLeaderboard.total_score)))
+                .select_from(ParticipantLeaderboard)
+                .join(Participant, Participant.id == ParticipantLeaderboard.participant_id)
+                .where(ParticipantLeaderboard.total_score > target.c.total_score)
+            )
+        else:
+            # Normalized totals can be negative, so unscored participants (0) may rank above
+            totals = self._build_totals(normalization, section_id=section_id, jury_id=jury_id)
+            total_score = func.coalesce(totals.c.total_score, 0.0)
+            higher_totals = (
+                select(func.count(distinct(total_score)))
+                .select_from(Participant)
+                .outerjoin(totals, totals.c.participant_id == Participant.id)
+                .where(total_score > target.c.total_score)
+            )
+        higher_totals = self._apply_scope(higher_totals, section_id=section_id, jury_id=jury_id)
+
+        stmt = select(target, (higher_totals.scalar_subquery() + 1).label("rank"))
+        result = await self._session.execute(stmt)
+        row = result.mappings().one_or_none()
+        return self._map_row(row) if row is not None else None
+
+    def _build_ranked_subquery(
+        self,
+        *,
+        section_id: int | None,
+        jury_id: int | None,
+        include_total: bool,
+        normalization: RankingNormalization,
+    ):
+        leaderboard_subquery = self._build_base_statement(
+            section_id=section_id,
+            jury_id=jury_id,
+            participant_id=None,
+            normalization=normalization,
+        ).subquery()
+        ranked_columns = [
+            leaderboard_subquery,
+            func.dense_rank().over(order_by=leaderboard_subquery.c.total_score.desc()).label("rank"),
+        ]
+        if include_total:
+            # Counted over the whole scope before keyset filtering and LIMIT, in the same statement
+            ranked_columns.append(func.count().over().label("total_count"))
+        return select(*ranked_columns).subquery()
 
     def _build_base_statement(
         self,
@@ -92,15 +256,9 @@ class ParticipantRankingRepository:
         section_id: int | None,
         jury_id: int | None,
         participant_id: int | None,
+        normalization: RankingNormalization = RankingNormalization.NONE,
     ) -> Select:
-        score_total = (
-            func.coalesce(JuryScore.organization_score, 0.0)
-            + func.coalesce(JuryScore.content, 0.0)
-            + func.coalesce(JuryScore.visuals, 0.0)
-            + func.coalesce(JuryScore.mechanics, 0.0)
-            + func.coalesce(JuryScore.delivery, 0.0)
-        )
-
+        totals = self._build_totals(normalization, section_id=section_id, jury_id=jury_id)
         stmt = (
             select(
                 Participant.id.label("participant_id"),
@@ -111,18 +269,76 @@ class ParticipantRankingRepository:
                 Participant.section_id.label("section_id"),
                 Section.name.label("section_name"),
                 Participant.presentation_topic.label("presentation_topic"),
-                func.coalesce(func.sum(score_total), 0.0).label("total_score"),
-                func.count(JuryScore.id).label("scores_count"),
+                func.coalesce(totals.c.total_score, 0.0).label("total_score"),
+                func.coalesce(totals.c.scores_count, 0).label("scores_count"),
             )
             .select_from(Participant)
             .join(Person, Participant.person_id == Person.id, isouter=True)
             .join(Section, Participant.section_id == Section.id, isouter=True)
-            .outerjoin(JuryScore, JuryScore.participant_id == Participant.id)
+            .outerjoin(totals, totals.c.participant_id == Participant.id)
         )
 
         if participant_id is not None:
             stmt = stmt.where(Participant.id == participant_id)
 
+        return self._apply_scope(stmt, section_id=section_id, jury_id=jury_id)
+
+    @classmethod
+    def _build_totals(
+        cls,
+        normalization: RankingNormalization,
+        *,
+        section_id: int | None,
+        jury_id: int | None,
+    ) -> FromClause:
+        """
+        Per-participant ``(participant_id, total_score, scores_count)``.
+
+        Raw totals come from the ``participant_leaderboard`` read model. Normalized totals are
+        computed from the scores in the section/jury scope: every score total is rescaled with
+        window aggregates over the scores of the same jury member, then summed per participant.
+        A jury member whose scores are all equal contributes 0 (zscore) or 0.5 (minmax).
+        """
+        if normalization is RankingNormalization.NONE:
+            return ParticipantLeaderboard.__table__
+
+        scoped_scores = cls._apply_scope(
+            select(JuryScore.participant_id, JuryScore.jury_id, JuryScore.total).join(
+                Participant, Participant.id == JuryScore.participant_id
+            ),
+            section_id=section_id,
+            jury_id=jury_id,
+        ).subquery("scoped_scores")
+        by_jury = {"partition_by": scoped_scores.c.jury_id}
+        total = scoped_scores.c.total
+        if normalization is RankingNormalization.ZSCORE:
+            spread = func.nullif(func.stddev_pop(total).over(**by_jury), 0)
+            normalized = func.coalesce((total - func.avg(total).over(**by_jury)) / spread, 0.0)
+        else:
+            lowest = func.min(total).over(**by_jury)
+            spread = func.nullif(func.max(total).over(**by_jury) - lowest, 0)
+            normalized = func.coalesce((total - lowest) / spread, 0.5)
+
+        normalized_scores = select(
+            scoped_scores.c.participant_id,
+            normalized.label("normalized_total"),
+        ).subquery("normalized_scores")
+        return (
+            select(
+                normalized_scores.c.participant_id,
+                cast(
+                    func.round(cast(func.sum(normalized_scores.c.normalized_total), Numeric), NORMALIZED_TOTAL_SCALE),
+                    Float,
+                ).label("total_score"),
+                func.count().label("scores_count"),
+            )
+            .group_by(normalized_scores.c.participant_id)
+            .subquery("normalized_totals")
+        )
+
+    @staticmethod
+    def _apply_scope(stmt: Select, *, section_id: int | None, jury_id: int | None) -> Select:
+        """Restrict participants to a section and/or to the sections a jury member is assigned to."""
         if section_id is not None:
             stmt = stmt.where(Participant.section_id == section_id)
 
@@ -131,49 +347,66 @@ class ParticipantRankingRepository:
                 SectionJury.jury_id == jury_id
             )
 
-        stmt = stmt.group_by(
-            Participant.id,
-            Participant.person_id,
-            Person.first_name,
-            Person.last_name,
-            Person.middle_name,
-            Participant.section_id,
-            Section.name,
-            Participant.presentation_topic,
-        )
-
         return stmt
 
-    def _apply_sorting(
-        self,
-        stmt: Select,
-        ranked_subquery,
-        *,
-        sort_by: ParticipantRankingSortField,
-        sort_order: SortOrder,
-    ) -> Select:
-        column_map = {
-            ParticipantRankingSortField.TOTAL_SCORE: ranked_subquery.c.total_score,
-            ParticipantRankingSortField.LAST_NAME: ranked_subquery.c.last_name,
-            ParticipantRankingSortField.FIRST_NAME: ranked_subquery.c.first_name,
-            ParticipantRankingSortField.RANK: ranked_subquery.c.rank,
-            ParticipantRankingSortField.SCORES_COUNT: ranked_subquery.c.scores_count,
-        }
+    @staticmethod
+    def sort_keys(*, sort_by: ParticipantRankingSortField, sort_order: SortOrder) -> list[SortKey]:
+        """
+        Full ORDER BY of the leaderboard: the requested field followed by the tie-breakers.
 
-        primary_column = column_map.get(sort_by)
-        if primary_column is None:
-            primary_column = ranked_subquery.c.total_score
+        Field names match ``ParticipantRankingRecord`` attributes, so a cursor can be built
+        from the last returned record.
+        """
+        descending = sort_order == SortOrder.DESC
+        return [
+            # Keep PostgreSQL's default null placement for the requested field
+            SortKey(field=sort_by.value, descending=descending, nulls_last=not descending),
+            # Ensure a deterministic order for ties to satisfy the alphabetical requirement.
+            SortKey(field="total_score", descending=True, nulls_last=False),
+            SortKey(field="last_name", descending=False, nulls_last=True),
+            SortKey(field="first_name", descending=False, nulls_last=True),
+            SortKey(field="participant_id", descending=False, nulls_last=True),
+        ]
 
-        primary_order = primary_column.desc() if sort_order == SortOrder.DESC else primary_column.asc()
+    @staticmethod
+    def _order_clauses(ranked_subquery, keys: Sequence[SortKey]) -> list[ColumnElement]:
+        clauses = []
+        for key in keys:
+            column = ranked_subquery.c[key.field]
+            clause = column.desc() if key.descending else column.asc()
+            clauses.append(clause.nulls_last() if key.nulls_last else clause.nulls_first())
+        return clauses
+
+    @staticmethod
+    def _keyset_predicate(ranked_subquery, keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+        """
+        Build ``(k1, k2, ...) > (v1, v2, ...)`` for mixed sort directions and null placements.
+
+        Row-value comparison cannot express per-column directions, so the predicate is expanded
+        into ``k1 after v1 OR (k1 = v1 AND k2 after v2) OR ...``.
+        """
+        if len(values) != len(keys):
+            raise ValueError("Cursor does not match the sort keys")
 
-        order_clauses = [primary_order]
+        branches = []
+        equal_prefix: list[ColumnElement[bool]] = []
+        for key, value in zip(keys, values, strict=True):
+            column = ranked_subquery.c[key.field]
+            if value is None:
+                # Non-null values only follow a null when nulls are sorted first
+                after = None if key.nulls_last else column.is_not(None)
+                equal = column.is_(None)
+            else:
+                after = column < value if key.descending else column > value
+                if key.nulls_last:
+                    after = or_(after, column.is_(None))
+                equal = column == value
 
-        # Ensure a deterministic order for ties to satisfy the alphabetical requirement.
-        order_clauses.append(ranked_subquery.c.total_score.desc())
-        order_clauses.append(ranked_subquery.c.last_name.asc().nullslast())
-        order_clauses.append(ranked_subquery.c.first_name.asc().nullslast())
+            if after is not None:
+                branches.append(and_(*equal_prefix, after))
+            equal_prefix.append(equal)
 
-        return stmt.order_by(*order_clauses)
+        return or_(false(), *branches)
 
     @staticmethod
     def _map_row(row: dict) -> ParticipantRankingRecord:
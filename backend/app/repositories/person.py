@@ -1,7 +1,7 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Person
+from app.repositories.base import get_by_pk
 
 
 class PersonRepository:
@@ -11,6 +11,4 @@ class PersonRepository:
         self._session = session
 
     async def get_person_by_id(self, person_id: int) -> Person | None:
-        stmt = select(Person).where(Person.id == person_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, Person, person_id)
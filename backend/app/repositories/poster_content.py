@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import PosterContent
+from app.repositories.base import get_by_pk, insert_returning, update_returning
 from app.schemas import PosterContentCreate, PosterContentUpdate
 
 
@@ -29,21 +30,19 @@ class PosterContentRepository:
         Returns:
             PosterContent instance or None if not found
         """
-        stmt = select(PosterContent).where(PosterContent.id == content_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, PosterContent, content_id)
 
     async def create_poster_content(self, data: PosterContentCreate) -> PosterContent:
         """Create new poster content."""
-        content = PosterContent(
-            technical_requirements_id=data.technical_requirements_id,
-            words_amount=data.words_amount,
-            images_amount=data.images_amount,
+        return await insert_returning(
+            self._session,
+            PosterContent,
+            {
+                "technical_requirements_id": data.technical_requirements_id,
+                "words_amount": data.words_amount,
+                "images_amount": data.images_amount,
+            },
         )
-        self._session.add(content)
-        await self._session.flush()
-        await self._session.refresh(content)
-        return content
 
     async def update_poster_content(self, content: PosterContent, data: PosterContentUpdate) -> PosterContent:
         """
@@ -56,13 +55,7 @@ class PosterContentRepository:
         Returns:
             Updated PosterContent instance
         """
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(content, field, value)
-
-        await self._session.flush()
-        await self._session.refresh(content)
-        return content
+        return await update_returning(self._session, content, data.model_dump(exclude_unset=True))
 
     async def delete_poster_content(self, content: PosterContent) -> None:
         """Delete poster content."""
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import JuryScore, Participant
+
+CRITERIA_FIELDS = ("organization_score", "content", "visuals", "mechanics", "delivery")
+
+
+@dataclass(slots=True)
+class ScoreStatsRecord:
+    """Aggregates of one group of scores; ``jury_id`` is meaningless for the section-wide row."""
+
+    is_overall: bool
+    jury_id: int | None
+    scores_count: int
+    participants_count: int
+    mean: float | None
+    median: float | None
+    stddev: float | None
+    min: float | None
+    max: float | None
+    criteria: dict[str, float | None]
+
+
+class ScoreStatsRepository:
+    """Statistics over the jury scores of a section."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_section_stats(self, section_id: int) -> list[ScoreStatsRecord]:
+        """
+        Aggregate the scores of a section per jury member and over the whole section.
+
+        ``GROUP BY ROLLUP(jury_id)`` yields every per-jury row plus the section-wide row in a
+        single pass over the scores; ``GROUPING()`` tells the section-wide row apart from the
+        group of scores whose jury member was deleted (``jury_id`` is NULL in both).
+
+        Returns:
+            The section-wide record first (always present, zero counts without scores),
+            then one record per jury member ordered by ``jury_id``
+        """
+        is_overall = func.grouping(JuryScore.jury_id) == 1
+        stmt = (
+            select(
+                is_overall.label("is_overall"),
+                JuryScore.jury_id,
+                func.count(JuryScore.id).label("scores_count"),
+                func.count(distinct(JuryScore.participant_id)).label("participants_count"),
+                func.avg(JuryScore.total).label("mean"),
+                func.percentile_cont(0.5).within_group(JuryScore.total).label("median"),
+                func.stddev_samp(JuryScore.total).label("stddev"),
+                func.min(JuryScore.total).label("min"),
+                func.max(JuryScore.total).label("max"),
+                *(func.avg(getattr(JuryScore, field)).label(field) for field in CRITERIA_FIELDS),
+            )
+            .join(Participant, Participant.id == JuryScore.participant_id)
+            .where(Participant.section_id == section_id)
+            .group_by(func.rollup(JuryScore.jury_id))
+            .order_by(is_overall.desc(), JuryScore.jury_id.asc().nulls_last())
+        )
+        result = await self._session.execute(stmt)
+        return [
+            ScoreStatsRecord(
+                is_overall=row["is_overall"],
+                jury_id=row["jury_id"],
+                scores_count=row["scores_count"],
+                participants_count=row["participants_count"],
+                mean=row["mean"],
+                median=row["median"],
+                stddev=row["stddev"],
+                min=row["min"],
+                max=row["max"],
+                criteria={field: row[field] for field in CRITERIA_FIELDS},
+            )
+            for row in result.mappings()
+        ]
@@ -1,9 +1,10 @@
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import EventSection, OrganizerSectionChange, Section
+from app.repositories.base import get_by_pk, insert_returning, update_returning
 from app.schemas import SectionCreate, SectionUpdate
 
 
@@ -21,25 +22,21 @@ class SectionRepository:
 
     async def get_section_by_id(self, section_id: int) -> Section | None:
         """Get a specific section by ID."""
-        stmt = select(Section).where(Section.id == section_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, Section, section_id)
 
     async def create_section(self, data: SectionCreate) -> Section:
         """
         Create a new section.
         If event_id is provided, creates a link in event_sections table.
         """
-        section = Section(name=data.name, lecture_hall=data.lecture_hall, time=data.time)
-        self._session.add(section)
-        await self._session.flush()
+        section = await insert_returning(
+            self._session, Section, {"name": data.name, "lecture_hall": data.lecture_hall, "time": data.time}
+        )
 
         if data.event_id:
-            event_link = EventSection(event_id=data.event_id, section_id=section.id)
-            self._session.add(event_link)
+            await self._session.execute(insert(EventSection).values(event_id=data.event_id, section_id=section.id))
 
         await self._session.commit()
-        await self._session.refresh(section)
         return section
 
     async def update_section(self, section_id: int, data: SectionUpdate) -> Section | None:
@@ -57,15 +54,12 @@ class SectionRepository:
         if not update_values:
             return section
 
-        for key, value in update_values.items():
-            setattr(section, key, value)
-
+        change_log = None
         if organizer_id is not None:
-            change_log = OrganizerSectionChange(section_id=section.id, organizer_id=organizer_id)
-            self._session.add(change_log)
+            change_log = insert(OrganizerSectionChange).values(section_id=section.id, organizer_id=organizer_id)
 
+        section = await update_returning(self._session, section, update_values, audit=change_log)
         await self._session.commit()
-        await self._session.refresh(section)
         return section
 
     async def delete_section(self, section_id: int) -> bool:
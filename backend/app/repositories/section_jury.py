@@ -1,9 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import SectionJury
+from app.models import Jury, JuryScore, Participant, Person, SectionJury
+from app.repositories.base import get_by_pk, insert_returning, update_returning
 
 
 class SectionJuryRepository:
@@ -30,9 +33,7 @@ class SectionJuryRepository:
 
     async def get_assignment_by_id(self, assignment_id: int) -> SectionJury | None:
         """Return assignment by its primary key."""
-        stmt = select(SectionJury).where(SectionJury.id == assignment_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, SectionJury, assignment_id)
 
     async def get_assignment_by_pair(self, *, section_id: int, jury_id: int) -> SectionJury | None:
         """Return assignment for the provided section/jury pair."""
@@ -42,19 +43,11 @@ class SectionJuryRepository:
 
     async def create_assignment(self, *, section_id: int, jury_id: int) -> SectionJury:
         """Persist new section/jury mapping."""
-        assignment = SectionJury(section_id=section_id, jury_id=jury_id)
-        self._session.add(assignment)
-        await self._session.flush()
-        await self._session.refresh(assignment)
-        return assignment
+        return await insert_returning(self._session, SectionJury, {"section_id": section_id, "jury_id": jury_id})
 
     async def update_assignment(self, assignment: SectionJury, *, section_id: int, jury_id: int) -> SectionJury:
         """Update mapping values."""
-        assignment.section_id = section_id
-        assignment.jury_id = jury_id
-        await self._session.flush()
-        await self._session.refresh(assignment)
-        return assignment
+        return await update_returning(self._session, assignment, {"section_id": section_id, "jury_id": jury_id})
 
     async def delete_assignment(self, assignment: SectionJury) -> None:
         """Delete the provided assignment."""
@@ -75,3 +68,69 @@ class SectionJuryRepository:
         stmt = select(SectionJury).where(SectionJury.jury_id == jury_id, SectionJury.section_id == section_id)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
+
+    async def list_assigned_pairs(self, pairs: Collection[tuple[int, int]]) -> set[tuple[int, int]]:
+        """
+        Return which of the provided ``(jury_id, section_id)`` pairs are assigned, in one query.
+
+        Args:
+            pairs: Candidate ``(jury_id, section_id)`` pairs
+
+        Returns:
+            Subset of ``pairs`` present in ``section_juries``
+        """
+        if not pairs:
+            return set()
+
+        stmt = select(SectionJury.jury_id, SectionJury.section_id).where(
+            tuple_(SectionJury.jury_id, SectionJury.section_id).in_(list(pairs))
+        )
+        result = await self._session.execute(stmt)
+        return {(jury_id, section_id) for jury_id, section_id in result.all()}
+
+    async def get_section_progress(self, section_id: int) -> Sequence[RowMapping]:
+        """
+        Grading status of every jury member of a section for every participant, in one query.
+
+        Assignments are joined with the section's participants and their scores, then folded
+        into one row per jury member; the ``graded`` bitmap has a "1"/"0" per participant in
+        ``participant_ids`` order.
+
+        Args:
+            section_id: ID of the section
+
+        Returns:
+            Rows with ``jury_id``, ``first_name``, ``last_name``, ``participant_ids``,
+            ``graded_count`` and ``graded``, ordered by ``jury_id``; empty if nobody is assigned
+        """
+        stmt = (
+            select(
+                SectionJury.jury_id,
+                Person.first_name,
+                Person.last_name,
+                func.array_agg(aggregate_order_by(Participant.id, Participant.id))
+                .filter(Participant.id.is_not(None))
+                .label("participant_ids"),
+                func.count(JuryScore.id).label("graded_count"),
+                func.coalesce(
+                    func.string_agg(
+                        case((JuryScore.id.is_(None), "0"), else_="1"),
+                        aggregate_order_by(literal_column("''"), Participant.id),
+                    ).filter(Participant.id.is_not(None)),
+                    "",
+                ).label("graded"),
+            )
+            .select_from(SectionJury)
+            .join(Jury, Jury.id == SectionJury.jury_id)
+            .outerjoin(Person, Person.id == Jury.person_id)
+            .outerjoin(Participant, Participant.section_id == SectionJury.section_id)
+            .outerjoin(
+                JuryScore,
+                and_(JuryScore.jury_id == SectionJury.jury_id, JuryScore.participant_id == Participant.id),
+            )
+            .where(SectionJury.section_id == section_id)
+            .group_by(SectionJury.jury_id, Person.first_name, Person.last_name)
+            .order_by(SectionJury.jury_id)
+        )
+        result = await self._session.execute(stmt)
+        return result.mappings().all()
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import TechnicalRequirement
+from app.repositories.base import get_by_pk, insert_returning, update_returning
 from app.schemas import TechnicalRequirementCreate, TechnicalRequirementUpdate
 
 
@@ -35,26 +36,25 @@ class TechnicalRequirementRepository:
         Returns:
             TechnicalRequirement instance or None if not found
         """
-        stmt = select(TechnicalRequirement).where(TechnicalRequirement.id == requirement_id)
-
-        if with_content:
-            # Eager loading using selectinload to avoid N+1 queries
-            stmt = stmt.options(selectinload(TechnicalRequirement.posters_content))
-
+        if not with_content:
+            return await get_by_pk(self._session, TechnicalRequirement, requirement_id)
+
+        # Eager loading using selectinload to avoid N+1 queries
+        stmt = (
+            select(TechnicalRequirement)
+            .where(TechnicalRequirement.id == requirement_id)
+            .options(selectinload(TechnicalRequirement.posters_content))
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def create_technical_requirement(self, data: TechnicalRequirementCreate) -> TechnicalRequirement:
         """Create a new technical requirement."""
-        requirement = TechnicalRequirement(
-            topic_id=data.topic_id,
-            format=data.format,
-            sizes=data.sizes,
+        return await insert_returning(
+            self._session,
+            TechnicalRequirement,
+            {"topic_id": data.topic_id, "format": data.format, "sizes": data.sizes},
         )
-        self._session.add(requirement)
-        await self._session.flush()
-        await self._session.refresh(requirement)
-        return requirement
 
     async def update_technical_requirement(
         self,
@@ -71,13 +71,7 @@ class TechnicalRequirementRepository:
         Returns:
             Updated TechnicalRequirement instance
         """
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(requirement, field, value)
-
-        await self._session.flush()
-        await self._session.refresh(requirement)
-        return requirement
+        return await update_returning(self._session, requirement, data.model_dump(exclude_unset=True))
 
     async def delete_technical_requirement(self, requirement: TechnicalRequirement) -> None:
         """Delete a technical requirement."""
@@ -1,9 +1,10 @@
-from openapi_server.models.topic_create import TopicCreate
-from openapi_server.models.topic_update import TopicUpdate
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Topic
+from app.repositories.base import get_by_pk, insert_returning, update_returning
+from openapi_server.models.topic_create import TopicCreate
+from openapi_server.models.topic_update import TopicUpdate
 
 
 class TopicRepository:
@@ -22,9 +23,7 @@ class TopicRepository:
         Returns:
             Topic instance or None if not found
         """
-        stmt = select(Topic).where(Topic.id == topic_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, Topic, topic_id)
 
     async def list_by_section(self, section_id: int) -> list[Topic]:
         stmt = select(Topic).where(Topic.section_id == section_id)
@@ -32,18 +31,12 @@ class TopicRepository:
         return res.scalars().all()
 
     async def create(self, section_id: int, data: TopicCreate) -> Topic:
-        topic = Topic(section_id=section_id, name=data.name.strip())
-        self._session.add(topic)
-        await self._session.flush()
-        await self._session.refresh(topic)
+        topic = await insert_returning(self._session, Topic, {"section_id": section_id, "name": data.name.strip()})
         await self._session.commit()
         return topic
 
     async def update(self, topic: Topic, data: TopicUpdate) -> Topic:
-        for k, v in data.model_dump(exclude_unset=True).items():
-            setattr(topic, k, v)
-        await self._session.flush()
-        await self._session.refresh(topic)
+        topic = await update_returning(self._session, topic, data.model_dump(exclude_unset=True))
         await self._session.commit()
         return topic
 
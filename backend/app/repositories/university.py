@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import University
+from app.repositories.base import get_by_pk, insert_returning
 from app.schemas import UniversityCreate
 
 
@@ -19,12 +20,7 @@ class UniversityRepository:
         return result.scalars().all()
 
     async def get_university_by_id(self, university_id: int) -> University | None:
-        stmt = select(University).where(University.id == university_id)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_by_pk(self._session, University, university_id)
 
     async def create_university(self, data: UniversityCreate) -> University:
-        university = University(name=data.name)
-        self._session.add(university)
-        await self._session.flush()
-        return university
+        return await insert_returning(self._session, University, {"name": data.name})
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, constr, field_validator
@@ -324,6 +324,7 @@ class JuryScoreCreate(JuryScoreBase):
 
 class JuryScoreRead(ORMModelMixin, JuryScoreBase):
     id: int
+    total: float
 
 
 class JuryScoreUpdate(BaseModel):
@@ -343,6 +344,37 @@ class JuryScoreUpdate(BaseModel):
         return v
 
 
+class JuryScoreUpsert(JuryScoreUpdate):
+    """Full replacement of one jury member's score; omitted criteria are stored as empty."""
+
+
+class JuryScoreBulkCreate(BaseModel):
+    """Many scores at once, e.g. a whole paper sheet; ``participant_id`` is required per item."""
+
+    items: list[JuryScoreCreate] = Field(min_length=1, max_length=1000)
+    atomic: bool = True  # False: store the valid items even if others are rejected
+
+
+class JuryScoreBulkItemStatus(StrEnum):
+    CREATED = "created"
+    REJECTED = "rejected"
+    SKIPPED = "skipped"  # Valid, but not stored because the atomic batch failed
+
+
+class JuryScoreBulkItemResult(BaseModel):
+    index: int  # Position of the item in the request
+    status: JuryScoreBulkItemStatus
+    score: JuryScoreRead | None = None
+    error: str | None = None
+
+
+class JuryScoreBulkResult(BaseModel):
+    atomic: bool
+    created: int
+    rejected: int
+    items: list[JuryScoreBulkItemResult]
+
+
 class ParticipantScoreSummary(BaseModel):
     """Summary of all scores for a participant with calculated average."""
 
@@ -382,6 +414,19 @@ class ParticipantRankingSortField(str, Enum):
     SCORES_COUNT = "scores_count"
 
 
+class RankingNormalization(StrEnum):
+    """How each jury member's scores are rescaled before they are summed per participant."""
+
+    NONE = "none"  # raw sums of the criteria
+    ZSCORE = "zscore"  # (total - jury mean) / jury standard deviation
+    MINMAX = "minmax"  # (total - jury min) / (jury max - jury min), 0..1
+
+
+class RankingExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class ParticipantRankingRead(BaseModel):
     """Single row from the aggregated leaderboard."""
 
@@ -401,15 +446,85 @@ class ParticipantRankingRead(BaseModel):
 class ParticipantRankingList(BaseModel):
     """Paginated leaderboard response."""
 
-    total: int
+    total: int | None  # None if include_total=false
     page: int
     page_size: int
-    pages: int
+    pages: int | None
     has_next: bool
     has_previous: bool
+    next_cursor: str | None = None  # Pass as `cursor` to fetch the following page
     items: list[ParticipantRankingRead]
 
 
+class ParticipantRankingDelta(BaseModel):
+    """Live-feed event: participants whose rank or total changed in the subscribed section or whole board."""
+
+    section_id: int | None
+    items: list[ParticipantRankingRead]
+
+
+class CriteriaAveragesRead(BaseModel):
+    """Mean of each criterion over the scores where it was set."""
+
+    organization_score: float | None
+    content: float | None
+    visuals: float | None
+    mechanics: float | None
+    delivery: float | None
+
+
+class ScoreStatsRead(BaseModel):
+    """Distribution of score totals (sum of the five criteria of one jury score)."""
+
+    scores_count: int
+    participants_count: int
+    mean: float | None  # None if no scores exist
+    median: float | None
+    stddev: float | None  # None for fewer than two scores
+    min: float | None
+    max: float | None
+    criteria: CriteriaAveragesRead
+
+
+class JuryScoreStatsRead(ScoreStatsRead):
+    jury_id: int | None  # None groups scores of deleted jury members
+
+
+class SectionScoreStatsRead(BaseModel):
+    section_id: int
+    overall: ScoreStatsRead
+    juries: list[JuryScoreStatsRead]
+
+
+class CacheStatsRead(BaseModel):
+    """Hit/miss counters of the in-process leaderboard cache."""
+
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+
+class PoolStatsRead(BaseModel):
+    """Live state of this worker's database connection pool."""
+
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    timeout_seconds: float
+    checkouts: int
+    checkout_timeouts: int
+    wait_seconds_total: float
+    wait_seconds_avg: float
+    wait_seconds_max: float
+
+
 class JuryScoreChangeBase(BaseModel):
     jury_scores_id: int
     jury_id: int | None = None
@@ -424,6 +539,14 @@ class JuryScoreChangeRead(ORMModelMixin, JuryScoreChangeBase):
     id: int
 
 
+class JuryScoreHistoryPage(BaseModel):
+    """Audit trail of one score, newest change first."""
+
+    score_id: int
+    items: list[JuryScoreChangeRead]
+    next_before_id: int | None = None  # Pass as `before_id` to fetch older changes
+
+
 class JuryProgressItem(BaseModel):
     participant_id: int
     participant_name: str
@@ -432,6 +555,22 @@ class JuryProgressItem(BaseModel):
     current_score: float | None = None  # Average score or amount, if you have already assessed it
 
 
+class SectionJuryProgressItem(BaseModel):
+    jury_id: int
+    jury_name: str
+    graded_count: int
+    completion: float  # Percent of the section's participants this jury member has scored
+    graded: str  # One character per entry of `participant_ids`: "1" scored, "0" not yet
+
+
+class SectionJuryProgressRead(BaseModel):
+    """Jury member x participant grading matrix of one section."""
+
+    section_id: int
+    participant_ids: list[int]  # Column order of every `graded` bitmap
+    juries: list[SectionJuryProgressItem]
+
+
 class OrganizerSectionChangeBase(BaseModel):
     section_id: int
     organizer_id: int | None = None
@@ -519,6 +658,41 @@ class PosterContentUpdate(BaseModel):
     images_amount: int | None = None
 
 
+# Deliberately loose: the mail server is the final judge of an address
+EmailAddress = constr(strip_whitespace=True, max_length=255, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class DrawResultsNotificationRequest(BaseModel):
+    """Draw results for one group; field names follow ``resources/api/v1/notifications.yaml``."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    event_name: constr(min_length=1, max_length=255) = Field(alias="eventName")
+    event_year: int = Field(alias="eventYear")
+    group_name: constr(min_length=1, max_length=255) = Field(alias="groupName")
+    assigned_topic: str = Field(alias="assignedTopic")
+    technical_requirements: str = Field(alias="technicalRequirements")
+    participant_emails: list[EmailAddress] = Field(alias="participantEmails", min_length=1, max_length=1000)
+    supervisor_email: EmailAddress | None = Field(default=None, alias="supervisorEmail")
+
+
+class NotificationRecipientStatus(BaseModel):
+    recipient: str
+    status: Literal["QUEUED"] = "QUEUED"  # Stored in the outbox, sent by the notification dispatcher
+
+
+class NotificationDelivery(BaseModel):
+    email: list[NotificationRecipientStatus]
+
+
+class NotificationResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    success: bool
+    message: str
+    delivery_status: NotificationDelivery = Field(alias="deliveryStatus")
+
+
 __all__ = [
     "ORMModelMixin",
     "UniversityBase",
@@ -583,14 +757,31 @@ __all__ = [
     "JuryScoreCreate",
     "JuryScoreRead",
     "JuryScoreUpdate",
+    "JuryScoreUpsert",
+    "JuryScoreBulkCreate",
+    "JuryScoreBulkItemStatus",
+    "JuryScoreBulkItemResult",
+    "JuryScoreBulkResult",
     "ParticipantScoreSummary",
     "SortOrder",
     "ParticipantRankingSortField",
+    "RankingNormalization",
+    "RankingExportFormat",
     "ParticipantRankingRead",
     "ParticipantRankingList",
+    "ParticipantRankingDelta",
+    "CriteriaAveragesRead",
+    "ScoreStatsRead",
+    "JuryScoreStatsRead",
+    "SectionScoreStatsRead",
+    "CacheStatsRead",
+    "PoolStatsRead",
     "JuryScoreChangeBase",
     "JuryScoreChangeCreate",
     "JuryScoreChangeRead",
+    "JuryScoreHistoryPage",
+    "SectionJuryProgressItem",
+    "SectionJuryProgressRead",
     "OrganizerSectionChangeBase",
     "OrganizerSectionChangeCreate",
     "OrganizerSectionChangeRead",
@@ -607,4 +798,8 @@ __all__ = [
     "PosterContentRead",
     "PosterContentUpdate",
     "JuryProgressItem",
+    "DrawResultsNotificationRequest",
+    "NotificationRecipientStatus",
+    "NotificationDelivery",
+    "NotificationResponse",
 ]
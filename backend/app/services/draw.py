@@ -0,0 +1,193 @@
+import hashlib
+import secrets
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from itertools import groupby
+
+from fastapi import HTTPException, status
+
+from app.repositories.draw import DrawRepository
+from app.services.draw_solver import DrawGroup, DrawInfeasibleError, DrawTopic, solve_assignment
+from openapi_server.models.draw import Draw
+from openapi_server.models.draw_result import DrawResult
+from openapi_server.models.draw_result_topics_inner import DrawResultTopicsInner
+from openapi_server.models.draw_verification import DrawVerification
+
+# Recorded with every draw; bump when solve_assignment or inputs_digest changes
+DRAW_ALGORITHM = "sha256-dinic-v2"
+
+
+def new_seed() -> str:
+    """128 bits from the OS CSPRNG as hex."""
+    return secrets.token_hex(16)
+
+
+def inputs_digest(topics: Iterable[DrawTopic], groups: Iterable[DrawGroup]) -> str:
+    """SHA-256 of the topics and groups (with their constraints) a draw was computed from."""
+    topic_part = ",".join(f"{topic.id}:{int(topic.needs_poster)}" for topic in sorted(topics, key=lambda t: t.id))
+    group_part = ",".join(
+        f"{group.id}:{group.member_count or 0}:{group.university_id or 0}:{int(group.has_poster_participants)}"
+        for group in sorted(groups, key=lambda g: g.id)
+    )
+    return hashlib.sha256(f"topics:{topic_part};groups:{group_part}".encode()).hexdigest()
+
+
+def _topics_by_section(rows: Sequence) -> dict[int, list[DrawTopic]]:
+    topics: dict[int, list[DrawTopic]] = defaultdict(list)
+    for row in rows:
+        topics[row.section_id].append(DrawTopic(id=row.id, needs_poster=bool(row.needs_poster)))
+    return topics
+
+
+def _groups_by_section(rows: Sequence) -> dict[int, list[DrawGroup]]:
+    groups: dict[int, list[DrawGroup]] = defaultdict(list)
+    for row in rows:
+        groups[row.section_id].append(
+            DrawGroup(
+                id=row.id,
+                member_count=row.member_count,
+                university_id=row.university_id,
+                has_poster_participants=bool(row.has_poster_participants),
+            )
+        )
+    return groups
+
+
+def _draw_read(draw) -> Draw:
+    return Draw(
+        id=draw.id,
+        section_id=draw.section_id,
+        seed=draw.seed,
+        algorithm=draw.algorithm,
+        inputs_digest=draw.inputs_digest,
+        created_at=draw.created_at,
+    )
+
+
+class DrawService:
+    """
+    Seeded, constraint-aware assignment of section topics to groups (see ``draw_solver``).
+
+    Every draw records its seed, algorithm and inputs in ``draws``; the assignment itself is
+    stored in ``group_topics`` and can be recomputed from that record (see ``verify_draw``).
+    """
+
+    def __init__(self, repository: DrawRepository, seed_factory: Callable[[], str] = new_seed) -> None:
+        self._repository = repository
+        self._seed_factory = seed_factory
+
+    async def run_draw(self, section_id: int) -> Draw:
+        """
+        Draw the topics of one section, replacing its previous draw.
+
+        Raises:
+            HTTPException: 404 if the section does not exist, 409 if it has no topics or
+                no groups, or the constraints leave no valid assignment
+        """
+        section_ids = await self._repository.lock_sections([section_id])
+        if not section_ids:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Секция не найдена")
+
+        draws = await self._draw_sections(section_ids, no_topics_detail="Нет тем для распределения в секции")
+        return draws[0]
+
+    async def run_event_draw(self, event_id: int) -> list[Draw]:
+        """
+        Draw every section of an event that has topics, with one seed and in one transaction.
+
+        All sections are read with two queries and written with one DELETE and two
+        multi-row INSERTs, however many sections the event has.
+
+        Raises:
+            HTTPException: 404 if the event does not exist, 409 if none of its sections has
+                topics or the topics of one of them cannot be assigned
+        """
+        section_ids = await self._repository.lock_event_sections(event_id)
+        if not section_ids and not await self._repository.event_exists(event_id):
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Мероприятие не найдено")
+
+        return await self._draw_sections(
+            section_ids, no_topics_detail="Нет тем для распределения в секциях мероприятия"
+        )
+
+    async def _draw_sections(self, section_ids: list[int], *, no_topics_detail: str) -> list[Draw]:
+        topics = _topics_by_section(await self._repository.list_topics(section_ids)) if section_ids else {}
+        drawn = [section_id for section_id in section_ids if topics.get(section_id)]
+        if not drawn:
+            raise HTTPException(status.HTTP_409_CONFLICT, no_topics_detail)
+
+        groups = _groups_by_section(await self._repository.list_groups(drawn))
+        seed = self._seed_factory()
+        assignments = []
+        records = []
+        for section_id in drawn:
+            if not groups[section_id]:
+                raise HTTPException(status.HTTP_409_CONFLICT, f"Нет групп для распределения тем в секции {section_id}")
+            try:
+                assignments += solve_assignment(seed, section_id, topics[section_id], groups[section_id])
+            except DrawInfeasibleError as error:
+                raise HTTPException(
+                    status.HTTP_409_CONFLICT,
+                    f"Темы секции {section_id} нельзя распределить с учётом ограничений: "
+                    f"занято {error.assigned} из {error.required} мест",
+                ) from error
+            records.append(
+                {
+                    "section_id": section_id,
+                    "seed": seed,
+                    "algorithm": DRAW_ALGORITHM,
+                    "inputs_digest": inputs_digest(topics[section_id], groups[section_id]),
+                }
+            )
+
+        await self._repository.replace_assignments(drawn, assignments)
+        draws = await self._repository.create_draws(records)
+        await self._repository.commit()
+        return [_draw_read(draw) for draw in draws]
+
+    async def verify_draw(self, section_id: int) -> DrawVerification:
+        """
+        Recompute the latest draw of a section from its seed and compare it with the stored results.
+
+        Raises:
+            HTTPException: 404 if the section does not exist or has never been drawn
+        """
+        draw = await self._repository.get_latest_draw(section_id)
+        if draw is None:
+            if not await self._repository.section_exists(section_id):
+                raise HTTPException(status.HTTP_404_NOT_FOUND, "Секция не найдена")
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Жеребьёвка в секции не проводилась")
+
+        topics = _topics_by_section(await self._repository.list_topics([section_id]))[section_id]
+        groups = _groups_by_section(await self._repository.list_groups([section_id]))[section_id]
+        stored = sorted((row.group_id, row.topic_id) for row in await self._repository.list_results(section_id))
+
+        # draws of older algorithm versions cannot be recomputed and never verify
+        inputs_unchanged = inputs_digest(topics, groups) == draw.inputs_digest
+        verified = (
+            inputs_unchanged
+            and draw.algorithm == DRAW_ALGORITHM
+            and solve_assignment(draw.seed, section_id, topics, groups) == stored
+        )
+        return DrawVerification(draw=_draw_read(draw), verified=verified, inputs_unchanged=inputs_unchanged)
+
+    async def get_results(self, section_id: int) -> list[DrawResult]:
+        """
+        Topics drawn for each group of the section.
+
+        Raises:
+            HTTPException: 404 if the section does not exist
+        """
+        rows = await self._repository.list_results(section_id)
+        # Without results the join cannot tell a section without a draw from a missing one
+        if not rows and not await self._repository.section_exists(section_id):
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Секция не найдена")
+
+        return [
+            DrawResult(
+                group_id=group_id,
+                group_name=group_name or f"Группа {group_id}",
+                topics=[DrawResultTopicsInner(topic_id=row.topic_id, topic_name=row.topic_name) for row in group_rows],
+            )
+            for (group_id, group_name), group_rows in groupby(rows, key=lambda row: (row.group_id, row.group_name))
+        ]
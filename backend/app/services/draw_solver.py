@@ -0,0 +1,279 @@
+"""
+Constraint-aware assignment of section topics to groups.
+
+The draw is a flow network::
+
+    source -> group g             capacity: topics the group has to take (by member count)
+    group g -> topic t            capacity 1, only if the group may take the topic
+    topic t -> sink               capacity: how many groups may share the topic
+
+When topics are shared and the group's university is known, the group -> topic edge goes
+through a (topic, university) node with capacity 1, so a topic is never given to two groups
+of the same university. Poster topics (with technical requirements) only get edges from
+groups that have poster participants.
+
+A maximum flow (Dinic) that saturates every source edge is a valid draw. The seed decides
+the order in which groups and topics are tried, so every seed gives a different but
+reproducible assignment.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+_RANDOM_BITS = 64
+# extra candidate topics per group in the sparse network
+_WINDOW_SLACK = 4
+_WINDOW_GROWTH = 4
+
+
+@dataclass(frozen=True, slots=True)
+class DrawTopic:
+    id: int
+    # a topic with technical requirements is presented as a poster
+    needs_poster: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class DrawGroup:
+    id: int
+    member_count: int | None = None
+    university_id: int | None = None
+    has_poster_participants: bool = False
+
+
+class DrawInfeasibleError(ValueError):
+    """The constraints leave no assignment that gives every group its topics."""
+
+    def __init__(self, assigned: int, required: int) -> None:
+        super().__init__(f"only {assigned} of {required} topic slots can be filled")
+        self.assigned = assigned
+        self.required = required
+
+
+class SeededStream:
+    """
+    Uniform integers derived from a seed with SHA-256, independent of the Python version.
+
+    The n-th draw hashes ``f"{seed}:{section_id}:{n}"`` and takes the first 8 bytes
+    (big-endian); values above the largest multiple of the range are rejected.
+    """
+
+    def __init__(self, seed: str, section_id: int) -> None:
+        self._prefix = f"{seed}:{section_id}:"
+        self._counter = 0
+
+    def below(self, bound: int) -> int:
+        limit = (1 << _RANDOM_BITS) - (1 << _RANDOM_BITS) % bound
+        while True:
+            digest = hashlib.sha256(f"{self._prefix}{self._counter}".encode()).digest()
+            self._counter += 1
+            value = int.from_bytes(digest[: _RANDOM_BITS // 8], "big")
+            if value < limit:
+                return value % bound
+
+    def shuffle(self, items: list) -> None:
+        """Fisher-Yates shuffle in place."""
+        for index in range(len(items) - 1, 0, -1):
+            swap = self.below(index + 1)
+            items[index], items[swap] = items[swap], items[index]
+
+
+class MaxFlow:
+    """Dinic's maximum flow on an adjacency list of paired forward/backward edges."""
+
+    def __init__(self, nodes: int) -> None:
+        self._adjacency: list[list[int]] = [[] for _ in range(nodes)]
+        self._target: list[int] = []
+        self._capacity: list[int] = []
+
+    def add_node(self) -> int:
+        self._adjacency.append([])
+        return len(self._adjacency) - 1
+
+    def add_edge(self, tail: int, head: int, capacity: int) -> int:
+        """Returns the edge ID; ``flow(edge)`` reads its flow after ``solve``."""
+        edge = len(self._target)
+        self._target += [head, tail]
+        self._capacity += [capacity, 0]
+        self._adjacency[tail].append(edge)
+        self._adjacency[head].append(edge + 1)
+        return edge
+
+    def flow(self, edge: int) -> int:
+        # the backward edge holds what was pushed through the forward one
+        return self._capacity[edge + 1]
+
+    def solve(self, source: int, sink: int) -> int:
+        total = 0
+        while (level := self._levels(source, sink)) is not None:
+            next_edge = [0] * len(self._adjacency)
+            while pushed := self._augment(source, sink, level, next_edge):
+                total += pushed
+        return total
+
+    def _levels(self, source: int, sink: int) -> list[int] | None:
+        level = [-1] * len(self._adjacency)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for edge in self._adjacency[node]:
+                head = self._target[edge]
+                if self._capacity[edge] > 0 and level[head] < 0:
+                    level[head] = level[node] + 1
+                    queue.append(head)
+        return level if level[sink] >= 0 else None
+
+    def _augment(self, source: int, sink: int, level: list[int], next_edge: list[int]) -> int:
+        # iterative DFS along the level graph; dead ends are skipped for the rest of the phase
+        target, capacity, adjacency = self._target, self._capacity, self._adjacency
+        path: list[int] = []
+        node = source
+        while node != sink:
+            edges = adjacency[node]
+            while next_edge[node] < len(edges):
+                edge = edges[next_edge[node]]
+                if capacity[edge] > 0 and level[target[edge]] == level[node] + 1:
+                    break
+                next_edge[node] += 1
+            else:
+                if not path:
+                    return 0
+                level[node] = -1
+                node = target[path.pop() ^ 1]
+                next_edge[node] += 1
+                continue
+            path.append(edge)
+            node = target[edge]
+
+        pushed = min(capacity[edge] for edge in path)
+        for edge in path:
+            capacity[edge] -= pushed
+            capacity[edge ^ 1] += pushed
+        return pushed
+
+
+def group_demands(groups: Sequence[DrawGroup], topic_count: int) -> dict[int, int]:
+    """
+    Number of topics every group takes.
+
+    ``max(topics, groups)`` slots are shared out in proportion to the member count (largest
+    remainder, at least one slot per group), so with more topics than groups every topic is
+    used and bigger groups take more of them.
+    """
+    slots = max(topic_count, len(groups))
+    demands = {group.id: 1 for group in groups}
+    spare = slots - len(groups)
+    if not spare:
+        return demands
+
+    weights = {group.id: max(group.member_count or 1, 1) for group in groups}
+    total_weight = sum(weights.values())
+    quotas = {group_id: spare * weight / total_weight for group_id, weight in weights.items()}
+    for group_id, quota in quotas.items():
+        demands[group_id] += math.floor(quota)
+    leftover = slots - sum(demands.values())
+    by_remainder = sorted(quotas, key=lambda group_id: (-(quotas[group_id] % 1), group_id))
+    for group_id in by_remainder[:leftover]:
+        demands[group_id] += 1
+    return demands
+
+
+def topic_capacity(groups: Sequence[DrawGroup], topic_count: int) -> int:
+    """How many groups may share one topic: as few as the number of slots allows."""
+    return math.ceil(max(topic_count, len(groups)) / topic_count)
+
+
+def _build_network(
+    topics: list[DrawTopic],
+    groups: list[DrawGroup],
+    demands: dict[int, int],
+    capacity: int,
+    offsets: list[int],
+    window: int,
+) -> tuple[MaxFlow, list[tuple[int, int, int]]]:
+    """
+    Build the flow network with up to ``window`` candidate topics per group.
+
+    Group i considers the topics from ``offsets[i]`` on (wrapping around) in the shuffled order.
+
+    Returns:
+        The network (source 0, sink 1) and the ``(edge, group_id, topic_id)`` candidate edges
+    """
+    network = MaxFlow(2 + len(groups) + len(topics))
+    group_nodes = {group.id: 2 + index for index, group in enumerate(groups)}
+    topic_nodes = {topic.id: 2 + len(groups) + index for index, topic in enumerate(topics)}
+    for topic in topics:
+        network.add_edge(topic_nodes[topic.id], 1, capacity)
+    university_nodes: dict[tuple[int, int], int] = {}
+
+    candidates = []
+    for group, offset in zip(groups, offsets, strict=True):
+        network.add_edge(0, group_nodes[group.id], demands[group.id])
+        limit = max(window, demands[group.id])
+        for topic in topics[offset:] + topics[:offset]:
+            if topic.needs_poster and not group.has_poster_participants:
+                continue
+            head = topic_nodes[topic.id]
+            if group.university_id is not None and capacity > 1:
+                key = (topic.id, group.university_id)
+                if key not in university_nodes:
+                    university_nodes[key] = network.add_node()
+                    network.add_edge(university_nodes[key], head, 1)
+                head = university_nodes[key]
+            candidates.append((network.add_edge(group_nodes[group.id], head, 1), group.id, topic.id))
+            limit -= 1
+            if not limit:
+                break
+    return network, candidates
+
+
+def solve_assignment(
+    seed: str, section_id: int, topics: Sequence[DrawTopic], groups: Sequence[DrawGroup]
+) -> list[tuple[int, int]]:
+    """
+    Assign the topics of a section to its groups under the draw constraints.
+
+    Every group first gets a short window of candidate topics, with the windows spread evenly
+    over the shuffled topics so that each topic is a candidate of a few groups. That network
+    has O(groups + topics) edges and usually has a full flow; if it does not, the windows
+    grow until they span all topics, so infeasibility is only reported by the complete
+    network.
+
+    Returns:
+        ``(group_id, topic_id)`` pairs ordered by group and topic
+
+    Raises:
+        DrawInfeasibleError: if some group cannot get all of its topics
+    """
+    if not topics or not groups:
+        return []
+
+    stream = SeededStream(seed, section_id)
+    topics = sorted(topics, key=lambda topic: topic.id)
+    groups = sorted(groups, key=lambda group: group.id)
+    stream.shuffle(topics)
+    stream.shuffle(groups)
+
+    demands = group_demands(groups, len(topics))
+    capacity = topic_capacity(groups, len(topics))
+    required = sum(demands.values())
+    start = stream.below(len(topics))
+    offsets = [(start + index * len(topics) // len(groups)) % len(topics) for index in range(len(groups))]
+
+    # twice as many candidate edges as slots plus slack for the constraints, widened until it fits
+    window = math.ceil(2 * required / len(groups)) + _WINDOW_SLACK
+    while True:
+        window = min(window, len(topics))
+        network, candidates = _build_network(topics, groups, demands, capacity, offsets, window)
+        assigned = network.solve(0, 1)
+        if assigned == required:
+            return sorted((group_id, topic_id) for edge, group_id, topic_id in candidates if network.flow(edge))
+        if window == len(topics):
+            raise DrawInfeasibleError(assigned, required)
+        window *= _WINDOW_GROWTH
@@ -1,11 +1,31 @@
+from collections.abc import Iterable
+
 from fastapi import HTTPException, status
 
+from app.core.cache import TTLCache, section_invalidation_tags
+from app.core.events import RankingBroadcaster, ServerSentEvent
 from app.models import JuryScore
 from app.repositories.jury import JuryRepository
 from app.repositories.jury_score import JuryScoreRepository
 from app.repositories.participant import ParticipantRepository
+from app.repositories.participant_leaderboard import ParticipantLeaderboardRepository
+from app.repositories.participant_ranking import ParticipantRankingRepository
 from app.repositories.section_jury import SectionJuryRepository
-from app.schemas import JuryScoreCreate, JuryScoreRead, JuryScoreUpdate, ParticipantScoreSummary
+from app.schemas import (
+    JuryScoreBulkCreate,
+    JuryScoreBulkItemResult,
+    JuryScoreBulkItemStatus,
+    JuryScoreBulkResult,
+    JuryScoreChangeRead,
+    JuryScoreCreate,
+    JuryScoreHistoryPage,
+    JuryScoreRead,
+    JuryScoreUpdate,
+    JuryScoreUpsert,
+    ParticipantRankingDelta,
+    ParticipantScoreSummary,
+)
+from app.services.participant_ranking import to_ranking_read
 
 
 class JuryScoreService:
@@ -17,11 +37,19 @@ class JuryScoreService:
         participant_repository: ParticipantRepository,
         jury_repository: JuryRepository,
         section_jury_repository: SectionJuryRepository,
+        leaderboard_repository: ParticipantLeaderboardRepository,
+        ranking_repository: ParticipantRankingRepository,
+        cache: TTLCache,
+        broadcaster: RankingBroadcaster,
     ) -> None:
         self._score_repo = jury_score_repository
         self._participant_repo = participant_repository
         self._jury_repo = jury_repository
         self._section_jury_repo = section_jury_repository
+        self._leaderboard_repo = leaderboard_repository
+        self._ranking_repo = ranking_repository
+        self._cache = cache
+        self._broadcaster = broadcaster
 
     async def list_scores_for_participant(self, participant_id: int) -> ParticipantScoreSummary:
         """
@@ -139,19 +167,147 @@ class JuryScoreService:
                 detail=f"Jury member {payload.jury_id} is not assigned to section {participant.section_id}",
             )
 
-        # 4. Check for duplicate scoring (uniqueness constraint)
-        existing_score = await self._score_repo.get_score_by_jury_and_participant(
-            jury_id=payload.jury_id, participant_id=participant_id
-        )
-        if existing_score is not None:
+        # 4. Insert unless this jury member has already scored the participant (uniqueness constraint)
+        score = await self._score_repo.create_score(payload)
+        if score is None:
+            existing_score = await self._score_repo.get_score_by_jury_and_participant(
+                jury_id=payload.jury_id, participant_id=participant_id
+            )
+            existing_id = existing_score.id if existing_score is not None else None
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"Jury member {payload.jury_id} has already scored participant {participant_id}. "
-                f"Use PATCH to update existing score (id: {existing_score.id})",
+                f"Use PATCH to update existing score (id: {existing_id})",
+            )
+
+        # Keep the leaderboard in sync
+        await self._leaderboard_repo.refresh_participants([participant_id])
+        await self._score_repo.commit()
+        await self._after_scores_committed([participant.section_id])
+        return score
+
+    async def create_scores_bulk(self, payload: JuryScoreBulkCreate) -> JuryScoreBulkResult:
+        """
+        Create many jury scores with set-based validation.
+
+        Items are validated with the same rules as ``create_score``, but with one ``IN`` query
+        per rule for the whole batch, and stored with a single multi-row INSERT.
+
+        Args:
+            payload: Items and the ``atomic`` flag. Atomic batches are stored only if every
+                item is valid; otherwise the valid items are stored and the rest rejected.
+
+        Returns:
+            Per-item results in request order
+
+        Raises:
+            HTTPException: 422 with the per-item results if an atomic batch has invalid items
+        """
+        items = payload.items
+        participants = await self._participant_repo.get_participants_by_ids(item.participant_id for item in items)
+        section_by_participant = {pid: participant.section_id for pid, participant in participants.items()}
+        existing_juries = set(await self._jury_repo.get_juries_by_ids(item.jury_id for item in items))
+        assignable_pairs = {
+            (item.jury_id, section_by_participant[item.participant_id])
+            for item in items
+            if item.jury_id in existing_juries and section_by_participant.get(item.participant_id) is not None
+        }
+        assigned_pairs = await self._section_jury_repo.list_assigned_pairs(assignable_pairs)
+        existing_scores = await self._score_repo.list_existing_pairs(
+            {
+                (item.jury_id, item.participant_id)
+                for item in items
+                if (item.jury_id, section_by_participant.get(item.participant_id)) in assigned_pairs
+            }
+        )
+
+        errors: dict[int, str] = {}
+        first_index_by_pair: dict[tuple[int, int], int] = {}
+        for index, item in enumerate(items):
+            error = self._validate_bulk_item(
+                item,
+                section_by_participant=section_by_participant,
+                existing_juries=existing_juries,
+                assigned_pairs=assigned_pairs,
+                existing_scores=existing_scores,
+            )
+            pair = (item.jury_id, item.participant_id)
+            if error is None and pair in first_index_by_pair:
+                error = f"Duplicate of item {first_index_by_pair[pair]} in this request"
+            if error is not None:
+                errors[index] = error
+            else:
+                first_index_by_pair[pair] = index
+
+        if payload.atomic and errors:
+            self._raise_bulk_rejected(payload, errors)
+
+        valid_items = [items[index] for index in first_index_by_pair.values()]
+        created = {
+            (score.jury_id, score.participant_id): score for score in await self._score_repo.create_scores(valid_items)
+        }
+        for pair, index in first_index_by_pair.items():
+            if pair not in created:
+                # Scored concurrently between validation and insert
+                errors[index] = f"Jury member {pair[0]} has already scored participant {pair[1]}"
+
+        if payload.atomic and errors:
+            await self._score_repo.rollback()
+            self._raise_bulk_rejected(payload, errors)
+
+        await self._leaderboard_repo.refresh_participants(participant_id for _, participant_id in created)
+        await self._score_repo.commit()
+        if created:
+            await self._after_scores_committed(
+                {section_by_participant[participant_id] for _, participant_id in created}
             )
 
-        # All validations passed, create the score
-        return await self._score_repo.create_score(payload)
+        results = []
+        for index, item in enumerate(items):
+            if index in errors:
+                results.append(
+                    JuryScoreBulkItemResult(index=index, status=JuryScoreBulkItemStatus.REJECTED, error=errors[index])
+                )
+            else:
+                score = created[(item.jury_id, item.participant_id)]
+                results.append(
+                    JuryScoreBulkItemResult(
+                        index=index,
+                        status=JuryScoreBulkItemStatus.CREATED,
+                        score=JuryScoreRead.model_validate(score),
+                    )
+                )
+        return JuryScoreBulkResult(atomic=payload.atomic, created=len(created), rejected=len(errors), items=results)
+
+    async def upsert_score(
+        self, participant_id: int, jury_id: int, payload: JuryScoreUpsert
+    ) -> tuple[JuryScoreRead, bool]:
+        """
+        Create or replace the score of a jury member for a participant (idempotent).
+
+        The write, the section assignment check and the audit trail entry (when an existing
+        score is replaced) happen in one statement; the entities are only looked up again to
+        explain a rejected write.
+
+        Args:
+            participant_id: ID of the participant (from URL)
+            jury_id: ID of the jury member (from URL)
+            payload: All criteria and the comment
+
+        Returns:
+            Stored score and whether it was newly created
+
+        Raises:
+            HTTPException: 404 for missing entities, 422 if the jury member may not score the participant
+        """
+        upserted = await self._score_repo.upsert_score(participant_id=participant_id, jury_id=jury_id, data=payload)
+        if upserted is None:
+            await self._raise_upsert_rejected(participant_id, jury_id)
+
+        await self._leaderboard_repo.refresh_participants([participant_id])
+        await self._score_repo.commit()
+        await self._after_scores_committed([upserted.section_id])
+        return upserted.score, upserted.inserted
 
     async def update_score(
         self, participant_id: int, score_id: int, payload: JuryScoreUpdate, jury_id: int
@@ -171,8 +327,8 @@ class JuryScoreService:
         Raises:
             HTTPException: 404 if not found, 422 for validation failures
         """
-        # Retrieve the score
-        score = await self._score_repo.get_score_by_id(score_id)
+        # Retrieve the score; parents are joined in, so the jury/participant lookups below hit the identity map
+        score = await self._score_repo.get_score_by_id(score_id, with_parents=True)
         if score is None:
             return None
 
@@ -191,14 +347,48 @@ class JuryScoreService:
                 detail=f"Jury member with id {jury_id} not found",
             )
 
-        # Update the score
-        updated_score = await self._score_repo.update_score(score, payload)
+        # Read the section from the joined participant now: the RETURNING row below resets the
+        # score's relationships, after which the participant would have to be queried again
+        section_id = score.participant.section_id
 
-        # Create audit trail entry
-        await self._score_repo.create_score_change(jury_score_id=updated_score.id, jury_id=jury_id)
+        # Update the score and create the audit trail entry in one statement
+        updated_score = await self._score_repo.update_score(score, payload, changed_by=jury_id)
 
+        await self._leaderboard_repo.refresh_participants([participant_id])
+        await self._score_repo.commit()
+        await self._after_scores_committed([section_id])
         return updated_score
 
+    async def list_score_history(
+        self, participant_id: int, score_id: int, *, limit: int, before_id: int | None = None
+    ) -> JuryScoreHistoryPage:
+        """
+        Retrieve one page of the audit trail of a jury score, newest change first.
+
+        Args:
+            participant_id: ID of the participant (for validation)
+            score_id: ID of the score
+            limit: Page size
+            before_id: ``next_before_id`` of the previous page
+
+        Returns:
+            JuryScoreHistoryPage with the changes and the cursor of the next page
+
+        Raises:
+            HTTPException: 404 if score not found or doesn't belong to participant
+        """
+        if await self.get_score_by_id(participant_id, score_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Score with id {score_id} not found for participant {participant_id}",
+            )
+
+        # One extra row tells whether an older page exists
+        changes = await self._score_repo.list_score_changes(score_id, limit=limit + 1, before_id=before_id)
+        items = [JuryScoreChangeRead.model_validate(change) for change in changes[:limit]]
+        next_before_id = items[-1].id if len(changes) > limit else None
+        return JuryScoreHistoryPage(score_id=score_id, items=items, next_before_id=next_before_id)
+
     async def delete_score(self, participant_id: int, score_id: int) -> bool:
         """
         Delete a jury score.
@@ -210,7 +400,8 @@ class JuryScoreService:
         Returns:
             True if deleted, False if not found
         """
-        score = await self._score_repo.get_score_by_id(score_id)
+        # Participant is joined in, so the lookup after commit hits the identity map
+        score = await self._score_repo.get_score_by_id(score_id, with_parents=True)
         if score is None:
             return False
 
@@ -219,4 +410,95 @@ class JuryScoreService:
             return False
 
         await self._score_repo.delete_score(score)
+        await self._leaderboard_repo.refresh_participants([participant_id])
+        await self._score_repo.commit()
+        await self._after_participant_scores_committed(participant_id)
         return True
+
+    async def _raise_upsert_rejected(self, participant_id: int, jury_id: int) -> None:
+        participant = await self._participant_repo.get_participant_by_id(participant_id)
+        if participant is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Participant with id {participant_id} not found",
+            )
+        if participant.section_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Participant {participant_id} is not assigned to any section",
+            )
+
+        jury = await self._jury_repo.get_jury_by_id(jury_id)
+        if jury is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Jury member with id {jury_id} not found",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Jury member {jury_id} is not assigned to section {participant.section_id}",
+        )
+
+    @staticmethod
+    def _validate_bulk_item(
+        item: JuryScoreCreate,
+        *,
+        section_by_participant: dict[int, int | None],
+        existing_juries: set[int],
+        assigned_pairs: set[tuple[int, int]],
+        existing_scores: set[tuple[int, int]],
+    ) -> str | None:
+        """Return why the item cannot be stored, mirroring the checks of ``create_score``."""
+        if item.participant_id is None:
+            return "participant_id is required"
+        if item.participant_id not in section_by_participant:
+            return f"Participant with id {item.participant_id} not found"
+        section_id = section_by_participant[item.participant_id]
+        if section_id is None:
+            return f"Participant {item.participant_id} is not assigned to any section"
+        if item.jury_id is None:
+            return "jury_id is required"
+        if item.jury_id not in existing_juries:
+            return f"Jury member with id {item.jury_id} not found"
+        if (item.jury_id, section_id) not in assigned_pairs:
+            return f"Jury member {item.jury_id} is not assigned to section {section_id}"
+        if (item.jury_id, item.participant_id) in existing_scores:
+            return f"Jury member {item.jury_id} has already scored participant {item.participant_id}"
+        return None
+
+    @staticmethod
+    def _raise_bulk_rejected(payload: JuryScoreBulkCreate, errors: dict[int, str]) -> None:
+        results = [
+            JuryScoreBulkItemResult(index=index, status=JuryScoreBulkItemStatus.REJECTED, error=errors[index])
+            if index in errors
+            else JuryScoreBulkItemResult(index=index, status=JuryScoreBulkItemStatus.SKIPPED)
+            for index in range(len(payload.items))
+        ]
+        result = JuryScoreBulkResult(atomic=True, created=0, rejected=len(errors), items=results)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=result.model_dump(mode="json"),
+        )
+
+    async def _after_participant_scores_committed(self, participant_id: int) -> None:
+        participant = await self._participant_repo.get_participant_by_id(participant_id)
+        section_id = participant.section_id if participant is not None else None
+        await self._after_scores_committed([section_id])
+
+    async def _after_scores_committed(self, section_ids: Iterable[int | None]) -> None:
+        """Drop cached leaderboard pages of the sections and push the changed ranks to live-feed clients."""
+        section_ids = set(section_ids)
+        for section_id in section_ids:
+            self._cache.invalidate(*section_invalidation_tags(section_id))
+
+        # Every write moves the whole-board ranks too; each scope is ranked with one query,
+        # and only when somebody is listening to it
+        for scope in [*section_ids - {None}, None]:
+            if not self._broadcaster.has_subscribers(scope):
+                continue
+            records = await self._ranking_repo.list_scope_rankings(section_id=scope)
+            board = {record.participant_id: to_ranking_read(record) for record in records}
+            items = self._broadcaster.changed_rows(scope, board)
+            if items:
+                delta = ParticipantRankingDelta(section_id=scope, items=items)
+                self._broadcaster.publish(scope, ServerSentEvent(event="ranking", data=delta.model_dump_json()))
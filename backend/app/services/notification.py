@@ -0,0 +1,210 @@
+"""
+E-mail notifications through the ``notification_outbox`` table.
+
+Requests only insert rows, so notifying hundreds of groups costs the API one INSERT per
+group. ``NotificationDispatcher`` drains the outbox in the background: it claims a batch,
+sends it over one SMTP connection at a limited rate and retries temporary failures with
+exponential backoff.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import Settings
+from app.core.mailer import RateLimiter, SmtpMailer, build_message, is_connection_lost, is_permanent_failure
+from app.repositories.notification import NotificationOutboxRepository
+from app.schemas import (
+    DrawResultsNotificationRequest,
+    NotificationDelivery,
+    NotificationRecipientStatus,
+    NotificationResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+DRAW_RESULTS_KIND = "draw_results"
+
+
+def utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def draw_results_subject(request: DrawResultsNotificationRequest) -> str:
+    return f"[{request.event_name} {request.event_year}] [{request.group_name}] - Результаты жеребьевки"
+
+
+def draw_results_body(request: DrawResultsNotificationRequest) -> str:
+    return (
+        "Здравствуйте!\n\n"
+        f"По результатам жеребьевки мероприятия «{request.event_name}» группе «{request.group_name}» "
+        f"назначена тема:\n{request.assigned_topic}\n\n"
+        f"Технические требования:\n{request.technical_requirements}\n"
+    )
+
+
+class NotificationService:
+    def __init__(self, repository: NotificationOutboxRepository) -> None:
+        self._repository = repository
+
+    async def enqueue_draw_results(self, request: DrawResultsNotificationRequest) -> NotificationResponse:
+        """Queue the draw results of a group for every participant and the supervisor, one message each."""
+        recipients: dict[str, str] = {}
+        for email in [*request.participant_emails, request.supervisor_email]:
+            # the same person listed twice gets one letter
+            if email and email.lower() not in recipients:
+                recipients[email.lower()] = email
+
+        subject = draw_results_subject(request)
+        body = draw_results_body(request)
+        await self._repository.enqueue(
+            [
+                {"kind": DRAW_RESULTS_KIND, "recipient": recipient, "subject": subject, "body": body}
+                for recipient in recipients.values()
+            ]
+        )
+        await self._repository.commit()
+
+        return NotificationResponse(
+            success=True,
+            message=f"Уведомление поставлено в очередь отправки: {len(recipients)} получателей",
+            delivery_status=NotificationDelivery(
+                email=[NotificationRecipientStatus(recipient=recipient) for recipient in recipients.values()]
+            ),
+        )
+
+
+class NotificationDispatcher:
+    """
+    Background sender for the outbox.
+
+    A message the server refuses with a 5xx code fails at once; other errors are retried
+    after ``retry_base_seconds * 2 ** (attempt - 1)`` (capped at ``retry_max_seconds``)
+    until ``max_attempts`` is reached. When the connection breaks, the unsent rest of the
+    batch is retried the same way.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        mailer: SmtpMailer,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 30.0,
+        retry_max_seconds: float = 3600.0,
+        lease_seconds: float = 300.0,
+        poll_seconds: float = 5.0,
+        clock: Callable[[], datetime] = utcnow,
+    ) -> None:
+        self._session_maker = session_maker
+        self._mailer = mailer
+        self._rate_limiter = rate_limiter or RateLimiter(0)
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        self._lease = timedelta(seconds=lease_seconds)
+        self._poll_seconds = poll_seconds
+        self._clock = clock
+
+    @classmethod
+    def from_settings(
+        cls, session_maker: async_sessionmaker[AsyncSession], settings: Settings
+    ) -> "NotificationDispatcher":
+        return cls(
+            session_maker,
+            SmtpMailer.from_settings(settings),
+            rate_limiter=RateLimiter(settings.notification_rate_per_second),
+            batch_size=settings.notification_batch_size,
+            max_attempts=settings.notification_max_attempts,
+            retry_base_seconds=settings.notification_retry_base_seconds,
+            retry_max_seconds=settings.notification_retry_max_seconds,
+            lease_seconds=settings.notification_lease_seconds,
+            poll_seconds=settings.notification_poll_seconds,
+        )
+
+    async def dispatch_batch(self) -> int:
+        """
+        Claim one batch of due messages, send it and record the outcome.
+
+        Returns:
+            Number of messages claimed (sent or not)
+        """
+        now = self._clock()
+        async with self._session_maker() as session:
+            repository = NotificationOutboxRepository(session)
+            messages = await repository.claim_due(now, now + self._lease, self._batch_size)
+            # commit before sending: the claim must not hold row locks during SMTP round-trips
+            await repository.commit()
+        if not messages:
+            return 0
+
+        outcomes = await self._send(messages)
+        async with self._session_maker() as session:
+            repository = NotificationOutboxRepository(session)
+            await repository.finish(outcomes)
+            await repository.commit()
+        return len(messages)
+
+    async def _send(self, messages: Sequence[Row]) -> list[dict]:
+        outcomes: list[dict] = []
+        try:
+            async with self._mailer.connect() as connection:
+                for message in messages:
+                    await self._rate_limiter.wait()
+                    try:
+                        await connection.send(
+                            build_message(self._mailer.sender, message.recipient, message.subject, message.body)
+                        )
+                    except OSError as error:  # smtplib.SMTPException included
+                        if is_connection_lost(error):
+                            raise
+                        outcomes.append(self._failed(message, error, permanent=is_permanent_failure(error)))
+                    else:
+                        outcomes.append(self._sent(message))
+        except OSError as error:
+            logger.warning("SMTP session failed after %d of %d messages: %r", len(outcomes), len(messages), error)
+            outcomes += [self._failed(message, error, permanent=False) for message in messages[len(outcomes) :]]
+        return outcomes
+
+    def _sent(self, message: Row) -> dict:
+        now = self._clock()
+        return {"id": message.id, "status": "sent", "next_attempt_at": now, "last_error": None, "sent_at": now}
+
+    def _failed(self, message: Row, error: Exception, *, permanent: bool) -> dict:
+        now = self._clock()
+        if permanent or message.attempts >= self._max_attempts:
+            return {
+                "id": message.id,
+                "status": "failed",
+                "next_attempt_at": now,
+                "last_error": repr(error),
+                "sent_at": None,
+            }
+        delay = min(self._retry_base * 2 ** (message.attempts - 1), self._retry_max)
+        return {
+            "id": message.id,
+            "status": "pending",
+            "next_attempt_at": now + timedelta(seconds=delay),
+            "last_error": repr(error),
+            "sent_at": None,
+        }
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Dispatch batches until ``stop`` is set; waits ``poll_seconds`` whenever the outbox runs dry."""
+        while not stop.is_set():
+            try:
+                claimed = await self.dispatch_batch()
+            except Exception:
+                logger.exception("Notification dispatch failed")
+                claimed = 0
+            if claimed < self._batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self._poll_seconds)
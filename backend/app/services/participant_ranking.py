@@ -1,24 +1,84 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
 from math import ceil
+from typing import Any
 
+from fastapi import HTTPException, status
+
+from app.core.cache import TTLCache, section_tags
 from app.repositories.participant_ranking import (
     ParticipantRankingRecord,
     ParticipantRankingRepository,
 )
 from app.schemas import (
+    CacheStatsRead,
     ParticipantRankingList,
     ParticipantRankingRead,
     ParticipantRankingSortField,
+    RankingExportFormat,
+    RankingNormalization,
     SortOrder,
 )
 
+EXPORT_BATCH_SIZE = 500
+
+# JSON types a cursor value may have for each sort key; anything else is a forged cursor
+CURSOR_VALUE_TYPES: dict[str, tuple[type, ...]] = {
+    "total_score": (int, float),
+    "rank": (int,),
+    "scores_count": (int,),
+    "participant_id": (int,),
+    "last_name": (str,),
+    "first_name": (str,),
+}
+# integer keys are bound as PostgreSQL integer
+CURSOR_INT_RANGE = range(-(2**31), 2**31)
+
+
+def _is_cursor_value(field: str, value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, bool) or not isinstance(value, CURSOR_VALUE_TYPES[field]):
+        return False
+    return not isinstance(value, int) or value in CURSOR_INT_RANGE
+
+
+def to_ranking_read(record: ParticipantRankingRecord) -> ParticipantRankingRead:
+    return ParticipantRankingRead(
+        participant_id=record.participant_id,
+        person_id=record.person_id,
+        first_name=record.first_name,
+        last_name=record.last_name,
+        middle_name=record.middle_name,
+        section_id=record.section_id,
+        section_name=record.section_name,
+        presentation_topic=record.presentation_topic,
+        total_score=round(record.total_score, 2),
+        scores_count=record.scores_count,
+        rank=record.rank,
+    )
+
 
 class ParticipantRankingService:
     """Business logic wrapper around leaderboard aggregation."""
 
-    def __init__(self, repository: ParticipantRankingRepository) -> None:
+    def __init__(
+        self,
+        repository: ParticipantRankingRepository,
+        cache: TTLCache,
+        *,
+        bypass_cache: bool = False,
+    ) -> None:
         self._repository = repository
+        self._cache = cache
+        # read-your-writes: query fresh data but still share the result with other clients
+        self._bypass_cache = bypass_cache
 
     async def list_rankings(
         self,
@@ -29,29 +89,81 @@ class ParticipantRankingService:
         page_size: int,
         sort_by: ParticipantRankingSortField,
         sort_order: SortOrder,
+        cursor: str | None = None,
+        include_total: bool = True,
+        normalization: RankingNormalization = RankingNormalization.NONE,
     ) -> ParticipantRankingList:
-        rows, total = await self._repository.list_rankings(
+        # Normalized boards rank the whole scope with window functions; every page of them is
+        # cached under the section tag, so only the first request after a score write pays for it
+        cache_key = (
+            "rankings",
+            section_id,
+            jury_id,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            cursor,
+            include_total,
+            normalization,
+        )
+        tags = section_tags(section_id)
+        cached = None if self._bypass_cache else self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # a score committed while the page is read invalidates it before it is stored
+        version = self._cache.version(tags)
+        after = (
+            self._decode_cursor(
+                cursor,
+                section_id=section_id,
+                jury_id=jury_id,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                normalization=normalization,
+            )
+            if cursor
+            else None
+        )
+        result_page = await self._repository.list_rankings(
             section_id=section_id,
             jury_id=jury_id,
             page=page,
             page_size=page_size,
-            participant_id=None,
             sort_by=sort_by,
             sort_order=sort_order,
+            after=after,
+            include_total=include_total,
+            normalization=normalization,
         )
 
-        items = [self._to_schema(row) for row in rows]
-        pages = ceil(total / page_size) if page_size else 0
+        items = [to_ranking_read(row) for row in result_page.items]
+        total = result_page.total
+        pages = ceil(total / page_size) if total is not None else None
+        next_cursor = None
+        if result_page.has_next and result_page.items:
+            next_cursor = self._encode_cursor(
+                result_page.items[-1],
+                section_id=section_id,
+                jury_id=jury_id,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                normalization=normalization,
+            )
 
-        return ParticipantRankingList(
+        result = ParticipantRankingList(
             total=total,
             page=page,
             page_size=page_size,
             pages=pages,
-            has_next=page < pages,
-            has_previous=page > 1 and total > 0,
+            has_next=result_page.has_next,
+            has_previous=cursor is not None or (page > 1 and total != 0),
+            next_cursor=next_cursor,
             items=items,
         )
+        self._cache.set(cache_key, result, tags=tags, version=version)
+        return result
 
     async def get_ranking(
         self,
@@ -59,28 +171,138 @@ class ParticipantRankingService:
         *,
         section_id: int | None,
         jury_id: int | None,
+        normalization: RankingNormalization = RankingNormalization.NONE,
     ) -> ParticipantRankingRead | None:
+        cache_key = ("ranking", participant_id, section_id, jury_id, normalization)
+        tags = section_tags(section_id)
+        cached = None if self._bypass_cache else self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = self._cache.version(tags)
         record = await self._repository.get_ranking_by_participant(
             participant_id,
             section_id=section_id,
             jury_id=jury_id,
+            normalization=normalization,
         )
         if record is None:
             return None
-        return self._to_schema(record)
 
-    @staticmethod
-    def _to_schema(record: ParticipantRankingRecord) -> ParticipantRankingRead:
-        return ParticipantRankingRead(
-            participant_id=record.participant_id,
-            person_id=record.person_id,
-            first_name=record.first_name,
-            last_name=record.last_name,
-            middle_name=record.middle_name,
-            section_id=record.section_id,
-            section_name=record.section_name,
-            presentation_topic=record.presentation_topic,
-            total_score=round(record.total_score, 2),
-            scores_count=record.scores_count,
-            rank=record.rank,
+        result = to_ranking_read(record)
+        self._cache.set(cache_key, result, tags=tags, version=version)
+        return result
+
+    async def export_rankings(
+        self,
+        *,
+        section_id: int | None,
+        jury_id: int | None,
+        sort_by: ParticipantRankingSortField,
+        sort_order: SortOrder,
+        export_format: RankingExportFormat,
+        normalization: RankingNormalization = RankingNormalization.NONE,
+    ) -> AsyncIterator[str]:
+        """Yield the whole leaderboard as CSV or NDJSON text, one batch of lines per chunk."""
+        records = self._repository.stream_rankings(
+            section_id=section_id,
+            jury_id=jury_id,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            batch_size=EXPORT_BATCH_SIZE,
+            normalization=normalization,
         )
+        fields = list(ParticipantRankingRead.model_fields)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator="\n")
+        if export_format is RankingExportFormat.CSV:
+            writer.writeheader()
+
+        rows_in_buffer = 0
+        async for record in records:
+            item = to_ranking_read(record)
+            if export_format is RankingExportFormat.CSV:
+                writer.writerow(item.model_dump())
+            else:
+                buffer.write(item.model_dump_json())
+                buffer.write("\n")
+            rows_in_buffer += 1
+            if rows_in_buffer >= EXPORT_BATCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows_in_buffer = 0
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def get_cache_stats(self) -> CacheStatsRead:
+        stats = self._cache.stats()
+        lookups = stats.hits + stats.misses
+        return CacheStatsRead(
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_ratio=round(stats.hits / lookups, 4) if lookups else 0.0,
+            evictions=stats.evictions,
+            invalidations=stats.invalidations,
+            size=stats.size,
+            max_entries=stats.max_entries,
+            ttl_seconds=stats.ttl_seconds,
+        )
+
+    @staticmethod
+    def _encode_cursor(
+        record: ParticipantRankingRecord,
+        *,
+        section_id: int | None,
+        jury_id: int | None,
+        sort_by: ParticipantRankingSortField,
+        sort_order: SortOrder,
+        normalization: RankingNormalization,
+    ) -> str:
+        keys = ParticipantRankingRepository.sort_keys(sort_by=sort_by, sort_order=sort_order)
+        payload = {
+            "scope": [section_id, jury_id],
+            "sort_by": sort_by.value,
+            "sort_order": sort_order.value,
+            "normalization": normalization.value,
+            "after": [getattr(record, key.field) for key in keys],
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(
+        cursor: str,
+        *,
+        section_id: int | None,
+        jury_id: int | None,
+        sort_by: ParticipantRankingSortField,
+        sort_order: SortOrder,
+        normalization: RankingNormalization,
+    ) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            after = payload["after"]
+            # cursors issued before normalization existed are for raw totals
+            issued_for = (
+                payload.get("scope"),
+                payload["sort_by"],
+                payload["sort_order"],
+                payload.get("normalization", "none"),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+        keys = ParticipantRankingRepository.sort_keys(sort_by=sort_by, sort_order=sort_order)
+        expected = ([section_id, jury_id], sort_by.value, sort_order.value, normalization.value)
+        if issued_for != expected or not isinstance(after, list) or len(after) != len(keys):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor was issued for a different section_id/jury_id/sort_by/sort_order/normalization",
+            )
+        # the values are bound into the keyset predicate, a wrong type would fail in the database
+        if not all(_is_cursor_value(key.field, value) for key, value in zip(keys, after, strict=True)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        return after
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from fastapi import HTTPException, status
+
+from app.core.cache import TTLCache, section_tags
+from app.repositories.score_stats import ScoreStatsRecord, ScoreStatsRepository
+from app.repositories.section import SectionRepository
+from app.schemas import (
+    CriteriaAveragesRead,
+    JuryScoreStatsRead,
+    ScoreStatsRead,
+    SectionScoreStatsRead,
+)
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+def to_score_stats_fields(record: ScoreStatsRecord) -> dict:
+    return {
+        "scores_count": record.scores_count,
+        "participants_count": record.participants_count,
+        "mean": _round(record.mean),
+        "median": _round(record.median),
+        "stddev": _round(record.stddev),
+        "min": _round(record.min),
+        "max": _round(record.max),
+        "criteria": CriteriaAveragesRead(**{field: _round(value) for field, value in record.criteria.items()}),
+    }
+
+
+class ScoreStatsService:
+    """Per-section score statistics, cached until the next score write in the section."""
+
+    def __init__(
+        self,
+        repository: ScoreStatsRepository,
+        section_repository: SectionRepository,
+        cache: TTLCache,
+        *,
+        bypass_cache: bool = False,
+    ) -> None:
+        self._repository = repository
+        self._section_repository = section_repository
+        self._cache = cache
+        self._bypass_cache = bypass_cache
+
+    async def get_section_stats(self, section_id: int) -> SectionScoreStatsRead:
+        cache_key = ("score-stats", section_id)
+        tags = section_tags(section_id)
+        cached = None if self._bypass_cache else self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = self._cache.version(tags)
+        overall, *juries = await self._repository.get_section_stats(section_id)
+        # Without scores the aggregate cannot tell an empty section from a missing one
+        if overall.scores_count == 0 and await self._section_repository.get_section_by_id(section_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Section with id {section_id} not found",
+            )
+
+        result = SectionScoreStatsRead(
+            section_id=section_id,
+            overall=ScoreStatsRead(**to_score_stats_fields(overall)),
+            juries=[JuryScoreStatsRead(jury_id=record.jury_id, **to_score_stats_fields(record)) for record in juries],
+        )
+        self._cache.set(cache_key, result, tags=tags, version=version)
+        return result
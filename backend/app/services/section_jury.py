@@ -8,7 +8,12 @@ from app.models import SectionJury
 from app.repositories.jury import JuryRepository
 from app.repositories.section import SectionRepository
 from app.repositories.section_jury import SectionJuryRepository
-from app.schemas import SectionJuryCreate, SectionJuryUpdate
+from app.schemas import (
+    SectionJuryCreate,
+    SectionJuryProgressItem,
+    SectionJuryProgressRead,
+    SectionJuryUpdate,
+)
 
 
 class SectionJuryService:
@@ -89,6 +94,27 @@ class SectionJuryService:
         await self._repository.delete_assignment(assignment)
         return True
 
+    async def get_section_progress(self, section_id: int) -> SectionJuryProgressRead:
+        """Who has scored whom in a section: one bitmap and completion percentage per jury member."""
+        rows = await self._repository.get_section_progress(section_id)
+        if not rows:
+            # Nobody is assigned; still report a missing section as such
+            await self._validate_section_exists(section_id)
+            return SectionJuryProgressRead(section_id=section_id, participant_ids=[], juries=[])
+
+        participant_ids = list(rows[0]["participant_ids"] or [])
+        juries = [
+            SectionJuryProgressItem(
+                jury_id=row["jury_id"],
+                jury_name=f"{row['last_name'] or ''} {row['first_name'] or ''}".strip(),
+                graded_count=row["graded_count"],
+                completion=(round(100 * row["graded_count"] / len(participant_ids), 1) if participant_ids else 100.0),
+                graded=row["graded"],
+            )
+            for row in rows
+        ]
+        return SectionJuryProgressRead(section_id=section_id, participant_ids=participant_ids, juries=juries)
+
     async def _validate_section_exists(self, section_id: int) -> None:
         section = await self._section_repository.get_section_by_id(section_id)
         if section is None:
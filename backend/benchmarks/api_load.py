@@ -0,0 +1,224 @@
+"""
+Load-test the HTTP API with concurrent clients on a deterministic dataset.
+
+Every scenario (leaderboard pages, score writes, jury progress, section jury progress, topic
+listing) is first driven on its own, then all of them interleaved. Throughput and latency
+percentiles are printed as JSON, so runs on different commits can be compared.
+
+By default the app runs in-process (httpx ASGI transport) on the database of the DB_*
+settings; pass ``--base-url`` to load a running server instead (e.g. with several workers).
+
+Usage (seeds a throwaway database, see ``--reset``):
+    uv run python -m benchmarks.api_load --reset --participants 5000 --concurrency 16
+    uv run python -m benchmarks.api_load --base-url http://localhost:8000 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.core.config import settings
+from benchmarks.common import create_benchmark_engine, summarize
+from benchmarks.seed import DatasetSpec, SeededDataset, load_dataset, reset_database, seed_dataset
+
+# (method, path relative to the API prefix, JSON body)
+Request = tuple[str, str, dict | None]
+
+
+@dataclass(slots=True)
+class Scenario:
+    name: str
+    build: Callable[[random.Random], Request]
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=None, help="Running server to load; defaults to the in-process app")
+    parser.add_argument(
+        "--database-url", default=None, help="Database to seed with --base-url; defaults to the DB_* settings"
+    )
+    parser.add_argument("--reset", action="store_true", help="Truncate and reseed the benchmark tables")
+    parser.add_argument("--participants", type=int, default=5000)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--universities", type=int, default=10)
+    parser.add_argument("--juries-per-section", type=int, default=5)
+    parser.add_argument("--topics-per-section", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario (and per mixed scenario)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per scenario")
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.database_url and not args.base_url:
+        parser.error("the in-process app always uses the DB_* settings; --database-url needs --base-url")
+    return args
+
+
+def build_scenarios(dataset: SeededDataset, page_size: int) -> list[Scenario]:
+    sections = [section_id for section_id in dataset.section_ids if dataset.participants_by_section.get(section_id)]
+    scored_sections = [section_id for section_id in sections if dataset.juries_by_section.get(section_id)]
+    if not scored_sections:
+        raise SystemExit("The database has no section with participants and jury members; run with --reset")
+
+    def rankings(rng: random.Random) -> Request:
+        section_id = rng.choice(sections)
+        pages = max(1, len(dataset.participants_by_section[section_id]) // page_size)
+        return "GET", f"/participant-rankings/?section_id={section_id}&page={rng.randint(1, pages)}", None
+
+    def score_write(rng: random.Random) -> Request:
+        section_id = rng.choice(scored_sections)
+        participant_id = rng.choice(dataset.participants_by_section[section_id])
+        jury_id = rng.choice(dataset.juries_by_section[section_id])
+        body = {
+            criterion: round(rng.uniform(0, 10), 1)
+            for criterion in ("organization_score", "content", "visuals", "mechanics", "delivery")
+        }
+        # idempotent upsert: repeated pairs replace the score instead of failing
+        return "PUT", f"/participants/{participant_id}/scores/by-jury/{jury_id}", body
+
+    def jury_progress(rng: random.Random) -> Request:
+        return "GET", f"/juries/{rng.choice(dataset.juries_by_section[rng.choice(scored_sections)])}/progress", None
+
+    def section_jury_progress(rng: random.Random) -> Request:
+        return "GET", f"/sections/{rng.choice(scored_sections)}/jury-progress", None
+
+    def topics(rng: random.Random) -> Request:
+        return "GET", f"/topics?sectionId={rng.choice(dataset.section_ids)}", None
+
+    return [
+        Scenario("rankings", rankings),
+        Scenario("score_write", score_write),
+        Scenario("jury_progress", jury_progress),
+        Scenario("section_jury_progress", section_jury_progress),
+        Scenario("topics", topics),
+    ]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    *,
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> tuple[dict[str, ScenarioResult], float]:
+    """
+    Send ``requests`` requests of every scenario from ``concurrency`` clients.
+
+    The requests are generated up front from ``seed`` with the scenarios interleaved in a
+    fixed order, so the same arguments always send the same requests in the same order.
+
+    Returns:
+        Per-scenario results and the wall-clock duration in seconds
+    """
+    rng = random.Random(seed)
+    schedule = [(scenario.name, scenario.build(rng)) for _ in range(requests) for scenario in scenarios]
+    results = {scenario.name: ScenarioResult() for scenario in scenarios}
+    pending = iter(schedule)
+
+    async def client_loop() -> None:
+        for name, (method, path, body) in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            results[name].latencies_ms.append((time.perf_counter() - started) * 1000)
+            if failed:
+                results[name].errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return results, time.perf_counter() - started
+
+
+def report(results: dict[str, ScenarioResult], elapsed: float) -> dict:
+    total = sum(len(result.latencies_ms) for result in results.values())
+    return {
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "errors": sum(result.errors for result in results.values()),
+        "scenarios": {
+            name: {"errors": result.errors, **summarize(result.latencies_ms)} for name, result in results.items()
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    engine, session_maker = create_benchmark_engine(args.database_url)
+    spec = DatasetSpec(
+        universities=args.universities,
+        sections=args.sections,
+        participants=args.participants,
+        juries_per_section=args.juries_per_section,
+        topics_per_section=args.topics_per_section,
+        seed=args.seed,
+    )
+    try:
+        async with session_maker() as session:
+            if args.reset:
+                await reset_database(session)
+                await seed_dataset(session, spec)
+                await session.commit()
+            dataset = await load_dataset(session)
+    finally:
+        await engine.dispose()
+
+    scenarios = build_scenarios(dataset, args.page_size)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url.rstrip("/") + settings.api_v1_prefix, timeout=60)
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url=f"http://benchmark{settings.api_v1_prefix}")
+
+    phases = {}
+    async with client:
+        if args.warmup:
+            await drive(client, scenarios, requests=args.warmup, concurrency=args.concurrency, seed=args.seed + 1)
+        for index, scenario in enumerate(scenarios):
+            results, elapsed = await drive(
+                client, [scenario], requests=args.requests, concurrency=args.concurrency, seed=args.seed + index
+            )
+            phases[scenario.name] = report(results, elapsed)
+        results, elapsed = await drive(
+            client, scenarios, requests=args.requests, concurrency=args.concurrency, seed=args.seed
+        )
+        phases["mixed"] = report(results, elapsed)
+
+    return {
+        "dataset": {
+            "participants": len(dataset.participant_ids),
+            "sections": len(dataset.section_ids),
+            "juries": len(dataset.jury_ids),
+            "scores": dataset.scores,
+            "seed": spec.seed if args.reset else None,
+        },
+        "target": args.base_url or "in-process",
+        "concurrency": args.concurrency,
+        "requests_per_scenario": args.requests,
+        "phases": phases,
+    }
+
+
+def main() -> None:
+    print(json.dumps(asyncio.run(run(parse_args())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Time the constraint-aware draw solver on generated sections of different sizes.
+
+Runs in memory (no database): every case builds a section with random member counts,
+universities and poster topics/participants and solves it ``--iterations`` times with
+different draw seeds.
+
+Usage:
+    uv run python -m benchmarks.draw_solver
+    uv run python -m benchmarks.draw_solver --cases 500x100 2000x400 --universities 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import Counter
+
+from app.services.draw_solver import DrawGroup, DrawTopic, group_demands, solve_assignment
+from benchmarks.common import summarize
+
+DEFAULT_CASES = ("50x10", "200x40", "500x100", "500x500", "300x1000", "1000x200")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", default=DEFAULT_CASES, help="Sections as <groups>x<topics>")
+    parser.add_argument("--universities", type=int, default=30)
+    parser.add_argument("--poster-topics", type=float, default=0.2, help="Share of topics with poster requirements")
+    parser.add_argument("--poster-groups", type=float, default=0.6, help="Share of groups with poster participants")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def build_section(
+    rng: random.Random, groups: int, topics: int, args: argparse.Namespace
+) -> tuple[list[DrawTopic], list[DrawGroup]]:
+    return (
+        [DrawTopic(id=topic_id, needs_poster=rng.random() < args.poster_topics) for topic_id in range(1, topics + 1)],
+        [
+            DrawGroup(
+                id=group_id,
+                member_count=rng.randint(2, 8),
+                university_id=rng.randint(1, args.universities),
+                has_poster_participants=rng.random() < args.poster_groups,
+            )
+            for group_id in range(1, groups + 1)
+        ],
+    )
+
+
+def run_case(case: str, args: argparse.Namespace) -> dict:
+    group_count, topic_count = map(int, case.split("x"))
+    rng = random.Random(args.seed)
+    topics, groups = build_section(rng, group_count, topic_count, args)
+
+    samples = []
+    assignment: list[tuple[int, int]] = []
+    for iteration in range(args.iterations):
+        started = time.perf_counter()
+        assignment = solve_assignment(f"benchmark-{iteration}", 1, topics, groups)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    usage = Counter(topic_id for _, topic_id in assignment)
+    return {
+        "groups": group_count,
+        "topics": topic_count,
+        "slots": sum(group_demands(groups, topic_count).values()),
+        "max_groups_per_topic": max(usage.values()),
+        **summarize(samples),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    print(json.dumps({case: run_case(case, args) for case in args.cases}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
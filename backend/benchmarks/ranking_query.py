@@ -0,0 +1,88 @@
+"""
+Compare leaderboard page latency with a separate count query vs. ``count(*) OVER ()``.
+
+Usage (seeds a throwaway database, see ``--reset``):
+    uv run python -m benchmarks.ranking_query --reset --participants 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+
+from app.repositories.participant_ranking import ParticipantRankingRepository
+from app.schemas import ParticipantRankingSortField, SortOrder
+from benchmarks.common import create_benchmark_engine, measure, summarize
+from benchmarks.seed import DatasetSpec, reset_database, seed_dataset
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="Defaults to the DB_* settings")
+    parser.add_argument("--reset", action="store_true", help="Truncate and reseed the benchmark tables")
+    parser.add_argument("--participants", type=int, default=5000)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--juries-per-section", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    engine, session_maker = create_benchmark_engine(args.database_url)
+    spec = DatasetSpec(
+        participants=args.participants,
+        sections=args.sections,
+        juries_per_section=args.juries_per_section,
+        seed=args.seed,
+    )
+
+    try:
+        if args.reset:
+            async with session_maker() as session:
+                await reset_database(session)
+                await seed_dataset(session, spec)
+                await session.commit()
+
+        async with session_maker() as session:
+            repository = ParticipantRankingRepository(session)
+            pages = max(1, args.participants // args.page_size)
+            rng = random.Random(args.seed)
+
+            def page_kwargs() -> dict:
+                return {
+                    "page": rng.randint(1, pages),
+                    "page_size": args.page_size,
+                    "sort_by": ParticipantRankingSortField.TOTAL_SCORE,
+                    "sort_order": SortOrder.DESC,
+                }
+
+            async def two_round_trips() -> None:
+                await repository.list_rankings(**page_kwargs(), include_total=False)
+                await repository.count_rankings()
+
+            async def single_round_trip() -> None:
+                await repository.list_rankings(**page_kwargs(), include_total=True)
+
+            separate_count = await measure(two_round_trips, iterations=args.iterations)
+            windowed_count = await measure(single_round_trip, iterations=args.iterations)
+    finally:
+        await engine.dispose()
+
+    return {
+        "dataset": {"participants": spec.participants, "sections": spec.sections, "seed": spec.seed},
+        "page_size": args.page_size,
+        "separate_count_query": summarize(separate_count),
+        "windowed_count": summarize(windowed_count),
+    }
+
+
+def main() -> None:
+    print(json.dumps(asyncio.run(run(parse_args())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
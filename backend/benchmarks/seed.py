@@ -0,0 +1,181 @@
+"""
+Deterministic dataset generator for benchmarks.
+
+The same ``DatasetSpec`` always produces the same rows, so numbers measured on
+different commits are comparable. Rows are written through the application models.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Jury, JuryScore, Participant, Person, Section, SectionJury, Topic, University
+from app.repositories.participant_leaderboard import ParticipantLeaderboardRepository
+
+SEEDED_TABLES = (
+    "universities",
+    "people",
+    "sections",
+    "topics",
+    "participants",
+    "juries",
+    "section_juries",
+    "jury_scores",
+    "jury_scores_changes",
+    "participant_leaderboard",
+)
+
+
+@dataclass(slots=True)
+class DatasetSpec:
+    universities: int = 10
+    sections: int = 20
+    participants: int = 5000
+    juries_per_section: int = 5
+    topics_per_section: int = 5
+    scored_ratio: float = 0.8
+    seed: int = 42
+
+
+@dataclass(slots=True)
+class SeededDataset:
+    section_ids: list[int] = field(default_factory=list)
+    participant_ids: list[int] = field(default_factory=list)
+    jury_ids: list[int] = field(default_factory=list)
+    juries_by_section: dict[int, list[int]] = field(default_factory=dict)
+    topics_by_section: dict[int, list[int]] = field(default_factory=dict)
+    participants_by_section: dict[int, list[int]] = field(default_factory=dict)
+    scores: int = 0
+
+
+async def reset_database(session: AsyncSession) -> None:
+    """Remove every row the generator writes. Never point this at a real event database."""
+    await session.execute(text(f"TRUNCATE {', '.join(SEEDED_TABLES)} RESTART IDENTITY CASCADE"))
+
+
+async def seed_dataset(session: AsyncSession, spec: DatasetSpec) -> SeededDataset:
+    rng = random.Random(spec.seed)
+    dataset = SeededDataset()
+
+    university_ids = list(
+        await session.scalars(
+            insert(University).returning(University.id),
+            [{"name": f"University {index + 1}"} for index in range(spec.universities)],
+        )
+    )
+    dataset.section_ids = list(
+        await session.scalars(
+            insert(Section).returning(Section.id),
+            [{"name": f"Section {index + 1}", "lecture_hall": f"{100 + index}"} for index in range(spec.sections)],
+        )
+    )
+    topic_rows = [
+        {"section_id": section_id, "name": f"Topic {index + 1} of section {section_id}"}
+        for section_id in dataset.section_ids
+        for index in range(spec.topics_per_section)
+    ]
+    topic_ids = list(await session.scalars(insert(Topic).returning(Topic.id), topic_rows)) if topic_rows else []
+    for topic_id, row in zip(topic_ids, topic_rows, strict=True):
+        dataset.topics_by_section.setdefault(row["section_id"], []).append(topic_id)
+
+    jury_count = spec.sections * spec.juries_per_section
+    person_ids = list(
+        await session.scalars(
+            insert(Person).returning(Person.id),
+            [
+                {
+                    "first_name": f"First{rng.randrange(500)}",
+                    "last_name": f"Last{rng.randrange(2000)}",
+                    "email": f"person{index}@example.com",
+                }
+                for index in range(spec.participants + jury_count)
+            ],
+        )
+    )
+
+    participant_rows = [
+        {
+            "person_id": person_ids[index],
+            "section_id": dataset.section_ids[index % spec.sections],
+            "presentation_topic": f"Topic {index % 97}",
+        }
+        for index in range(spec.participants)
+    ]
+    dataset.participant_ids = list(
+        await session.scalars(insert(Participant).returning(Participant.id), participant_rows)
+    )
+    for participant_id, row in zip(dataset.participant_ids, participant_rows, strict=True):
+        dataset.participants_by_section.setdefault(row["section_id"], []).append(participant_id)
+
+    dataset.jury_ids = list(
+        await session.scalars(
+            insert(Jury).returning(Jury.id),
+            [
+                {
+                    "person_id": person_ids[spec.participants + index],
+                    "university_id": university_ids[index % spec.universities],
+                    "is_chairman": index % spec.juries_per_section == 0,
+                }
+                for index in range(jury_count)
+            ],
+        )
+    )
+    section_jury_rows = []
+    for index, jury_id in enumerate(dataset.jury_ids):
+        section_id = dataset.section_ids[index // spec.juries_per_section]
+        dataset.juries_by_section.setdefault(section_id, []).append(jury_id)
+        section_jury_rows.append({"section_id": section_id, "jury_id": jury_id})
+    await session.execute(insert(SectionJury), section_jury_rows)
+
+    score_rows = []
+    for section_id, participant_ids in dataset.participants_by_section.items():
+        for participant_id in participant_ids:
+            for jury_id in dataset.juries_by_section[section_id]:
+                if rng.random() >= spec.scored_ratio:
+                    continue
+                score_rows.append(
+                    {
+                        "jury_id": jury_id,
+                        "participant_id": participant_id,
+                        "organization_score": round(rng.uniform(0, 10), 1),
+                        "content": round(rng.uniform(0, 10), 1),
+                        "visuals": round(rng.uniform(0, 10), 1),
+                        "mechanics": round(rng.uniform(0, 10), 1),
+                        "delivery": round(rng.uniform(0, 10), 1),
+                    }
+                )
+    if score_rows:
+        await session.execute(insert(JuryScore), score_rows)
+    dataset.scores = len(score_rows)
+
+    await ParticipantLeaderboardRepository(session).rebuild()
+    await session.execute(text("ANALYZE"))
+    return dataset
+
+
+async def load_dataset(session: AsyncSession) -> SeededDataset:
+    """Read back the ids of a database seeded earlier, to benchmark it again without ``--reset``."""
+    dataset = SeededDataset()
+    dataset.section_ids = list(await session.scalars(select(Section.id).order_by(Section.id)))
+    for section_id, participant_id in await session.execute(
+        select(Participant.section_id, Participant.id)
+        .where(Participant.section_id.is_not(None))
+        .order_by(Participant.id)
+    ):
+        dataset.participants_by_section.setdefault(section_id, []).append(participant_id)
+        dataset.participant_ids.append(participant_id)
+    for section_id, jury_id in await session.execute(
+        select(SectionJury.section_id, SectionJury.jury_id).order_by(SectionJury.id)
+    ):
+        dataset.juries_by_section.setdefault(section_id, []).append(jury_id)
+        dataset.jury_ids.append(jury_id)
+    for section_id, topic_id in await session.execute(
+        select(Topic.section_id, Topic.id).where(Topic.section_id.is_not(None)).order_by(Topic.id)
+    ):
+        dataset.topics_by_section.setdefault(section_id, []).append(topic_id)
+    dataset.scores = await session.scalar(select(func.count()).select_from(JuryScore))
+    return dataset
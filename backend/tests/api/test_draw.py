@@ -0,0 +1,193 @@
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.draw import DRAW_ALGORITHM, DrawService, inputs_digest
+from app.services.draw_solver import DrawGroup, DrawTopic
+
+
+def topic_row(section_id, topic_id, needs_poster=False):
+    return SimpleNamespace(section_id=section_id, id=topic_id, needs_poster=needs_poster)
+
+
+def group_row(section_id, group_id, university_id=None, has_poster_participants=False):
+    return SimpleNamespace(
+        section_id=section_id,
+        id=group_id,
+        member_count=3,
+        university_id=university_id,
+        has_poster_participants=has_poster_participants,
+    )
+
+
+@pytest.fixture
+def repository():
+    """Фикстура с замоканным репозиторием жеребьёвки: секция 5 с тремя темами и четырьмя группами"""
+    repo = MagicMock()
+    repo.lock_sections = AsyncMock(return_value=[5])
+    repo.lock_event_sections = AsyncMock(return_value=[5, 6])
+    repo.event_exists = AsyncMock(return_value=True)
+    repo.section_exists = AsyncMock(return_value=True)
+    repo.list_topics = AsyncMock(return_value=[topic_row(5, topic_id) for topic_id in (1, 2, 3)])
+    repo.list_groups = AsyncMock(return_value=[group_row(5, group_id) for group_id in (10, 20, 30, 40)])
+    repo.list_results = AsyncMock(return_value=[])
+    repo.get_latest_draw = AsyncMock(return_value=None)
+    repo.commit = AsyncMock()
+
+    async def replace_assignments(_section_ids, assignments):
+        repo.assignments = list(assignments)
+
+    async def create_draws(records):
+        return [
+            SimpleNamespace(id=index, created_at=datetime(2026, 5, 1, tzinfo=UTC), **record)
+            for index, record in enumerate(records, start=1)
+        ]
+
+    repo.replace_assignments = AsyncMock(side_effect=replace_assignments)
+    repo.create_draws = AsyncMock(side_effect=create_draws)
+    return repo
+
+
+def make_service(repository):
+    return DrawService(repository, seed_factory=lambda: "seed")
+
+
+# Тест запуска жеребьёвки
+def test_run_draw_records_seed(repository):
+    """Тест: распределение сохраняется вместе с зерном, алгоритмом и отпечатком входных данных"""
+    draw = asyncio.run(make_service(repository).run_draw(5))
+
+    # четыре группы на три темы: каждая группа получает тему, одна тема достается двум группам
+    assert repository.assignments == [(10, 2), (20, 3), (30, 3), (40, 1)]
+    assert (draw.section_id, draw.seed, draw.algorithm) == (5, "seed", DRAW_ALGORITHM)
+    assert draw.inputs_digest == inputs_digest(
+        [DrawTopic(topic_id) for topic_id in (1, 2, 3)],
+        [DrawGroup(group_id, member_count=3) for group_id in (10, 20, 30, 40)],
+    )
+    repository.lock_sections.assert_awaited_once_with([5])
+    repository.commit.assert_awaited_once()
+
+
+# Тест жеребьёвки всех секций мероприятия
+def test_run_event_draw_single_pass(repository):
+    """Тест: секции мероприятия разыгрываются одним проходом с общим зерном, секции без тем пропускаются"""
+    repository.lock_event_sections = AsyncMock(return_value=[5, 6, 7])
+    repository.list_topics = AsyncMock(return_value=[topic_row(5, 1), topic_row(6, 2)])
+    repository.list_groups = AsyncMock(return_value=[group_row(5, 10), group_row(6, 20)])
+
+    draws = asyncio.run(make_service(repository).run_event_draw(1))
+
+    assert [(draw.section_id, draw.seed) for draw in draws] == [(5, "seed"), (6, "seed")]
+    assert repository.assignments == [(10, 1), (20, 2)]
+    repository.list_groups.assert_awaited_once_with([5, 6])
+    repository.replace_assignments.assert_awaited_once()
+    repository.create_draws.assert_awaited_once()
+    repository.commit.assert_awaited_once()
+
+
+# Тест запуска жеребьёвки - ошибки
+def test_run_draw_errors(repository):
+    """Тест: 404 для несуществующих секции и мероприятия, 409 без тем, без групп и при невыполнимых ограничениях"""
+    service = make_service(repository)
+
+    # постерную тему некому взять
+    repository.list_topics = AsyncMock(return_value=[topic_row(5, 1), topic_row(5, 2, needs_poster=True)])
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.run_draw(5))
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.detail == "Темы секции 5 нельзя распределить с учётом ограничений: занято 2 из 4 мест"
+
+    repository.list_groups = AsyncMock(return_value=[])
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.run_draw(5))
+    assert exc_info.value.detail == "Нет групп для распределения тем в секции 5"
+
+    repository.list_topics = AsyncMock(return_value=[])
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.run_draw(5))
+    assert exc_info.value.status_code == 409
+
+    repository.lock_sections = AsyncMock(return_value=[])
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.run_draw(99))
+    assert exc_info.value.status_code == 404
+
+    repository.lock_event_sections = AsyncMock(return_value=[])
+    repository.event_exists = AsyncMock(return_value=False)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.run_event_draw(99))
+    assert exc_info.value.detail == "Мероприятие не найдено"
+    repository.replace_assignments.assert_not_called()
+    repository.commit.assert_not_called()
+
+
+# Тест проверки жеребьёвки
+def test_verify_draw(repository):
+    """Тест: пересчет по зерну совпадает с сохраненным распределением, пока его не изменили"""
+    draw = asyncio.run(make_service(repository).run_draw(5))
+    repository.get_latest_draw = AsyncMock(return_value=SimpleNamespace(**draw.model_dump()))
+    repository.list_results = AsyncMock(
+        return_value=[
+            SimpleNamespace(group_id=group_id, topic_id=topic_id) for group_id, topic_id in repository.assignments
+        ]
+    )
+
+    verification = asyncio.run(make_service(repository).verify_draw(5))
+    assert (verification.verified, verification.inputs_unchanged) == (True, True)
+    assert verification.draw.seed == "seed"
+
+    # результаты подменили в обход жеребьёвки
+    repository.list_results.return_value[0].group_id = 20
+    verification = asyncio.run(make_service(repository).verify_draw(5))
+    assert (verification.verified, verification.inputs_unchanged) == (False, True)
+
+    # после жеребьёвки в секции появилась новая тема
+    repository.list_topics.return_value.append(topic_row(5, 4))
+    verification = asyncio.run(make_service(repository).verify_draw(5))
+    assert (verification.verified, verification.inputs_unchanged) == (False, False)
+
+
+# Тест проверки жеребьёвки - жеребьёвка не проводилась
+def test_verify_draw_not_found(repository):
+    """Тест: 404 для секции без жеребьёвки и для несуществующей секции"""
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(make_service(repository).verify_draw(5))
+    assert exc_info.value.detail == "Жеребьёвка в секции не проводилась"
+
+    repository.section_exists = AsyncMock(return_value=False)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(make_service(repository).verify_draw(99))
+    assert exc_info.value.detail == "Секция не найдена"
+
+
+# Тест результатов жеребьёвки
+def test_get_results_groups_rows(repository):
+    """Тест: строки соединения группируются по группам, безымянная группа получает имя по номеру"""
+    repository.list_results = AsyncMock(
+        return_value=[
+            SimpleNamespace(group_id=10, group_name="Альфа", topic_id=1, topic_name="Тема 1"),
+            SimpleNamespace(group_id=10, group_name="Альфа", topic_id=3, topic_name="Тема 3"),
+            SimpleNamespace(group_id=20, group_name=None, topic_id=2, topic_name="Тема 2"),
+        ]
+    )
+
+    results = asyncio.run(make_service(repository).get_results(5))
+
+    assert [(result.group_id, result.group_name) for result in results] == [(10, "Альфа"), (20, "Группа 20")]
+    assert [topic.topic_id for topic in results[0].topics] == [1, 3]
+    repository.section_exists.assert_not_called()
+
+
+# Тест результатов жеребьёвки - секция без результатов
+def test_get_results_without_draw(repository):
+    """Тест: пустой список для секции без жеребьёвки и 404 для несуществующей секции"""
+    assert asyncio.run(make_service(repository).get_results(5)) == []
+
+    repository.section_exists = AsyncMock(return_value=False)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(make_service(repository).get_results(99))
+    assert exc_info.value.status_code == 404
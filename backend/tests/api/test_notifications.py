@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_notification_service
+from app.main import app
+from app.schemas import DrawResultsNotificationRequest
+from app.services.notification import NotificationService
+
+client = TestClient(app)
+
+request_payload = {
+    "eventName": "Плакаты 1",
+    "eventYear": 2026,
+    "groupName": "Группа А",
+    "assignedTopic": "Экологические проблемы современности",
+    "technicalRequirements": "Формат A1",
+    "participantEmails": ["student1@example.com", "Student2@example.com", "student2@example.com"],
+    "supervisorEmail": "student1@example.com",
+}
+
+
+@pytest.fixture
+def repository():
+    """Фикстура с замоканным репозиторием очереди уведомлений"""
+    repo = MagicMock()
+    repo.enqueue = AsyncMock()
+    repo.commit = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def override_notification_service(repository):
+    """Переопределяем зависимость FastAPI: сервис работает с замоканным репозиторием"""
+    app.dependency_overrides[get_notification_service] = lambda: NotificationService(repository)
+    yield
+    app.dependency_overrides.clear()
+
+
+# Тест постановки письма в очередь
+def test_enqueue_draw_results_deduplicates_recipients(repository):
+    """Тест: каждый адрес получает одно письмо, тема письма собирается по формату из спецификации"""
+    request = DrawResultsNotificationRequest.model_validate(request_payload)
+
+    response = asyncio.run(NotificationService(repository).enqueue_draw_results(request))
+
+    (messages,) = repository.enqueue.call_args.args
+    assert [message["recipient"] for message in messages] == ["student1@example.com", "Student2@example.com"]
+    assert {message["subject"] for message in messages} == {"[Плакаты 1 2026] [Группа А] - Результаты жеребьевки"}
+    assert "Экологические проблемы современности" in messages[0]["body"]
+    assert [item.status for item in response.delivery_status.email] == ["QUEUED", "QUEUED"]
+    repository.commit.assert_awaited_once()
+
+
+# Тест POST /notifications/draw/results
+@pytest.mark.usefixtures("override_notification_service")
+def test_post_draw_results_is_accepted(repository):
+    """Тест: запрос не ждёт отправки писем и сразу отвечает 202 со статусом QUEUED"""
+    response = client.post("/api/v1/notifications/draw/results", json=request_payload)
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["success"] is True
+    assert body["deliveryStatus"]["email"] == [
+        {"recipient": "student1@example.com", "status": "QUEUED"},
+        {"recipient": "Student2@example.com", "status": "QUEUED"},
+    ]
+    repository.enqueue.assert_awaited_once()
+
+
+# Тест валидации адресов
+@pytest.mark.usefixtures("override_notification_service")
+def test_post_draw_results_rejects_invalid_email(repository):
+    """Тест: некорректный адрес отклоняется до постановки в очередь"""
+    response = client.post(
+        "/api/v1/notifications/draw/results", json={**request_payload, "participantEmails": ["not-an-email"]}
+    )
+
+    assert response.status_code == 422
+    repository.enqueue.assert_not_called()
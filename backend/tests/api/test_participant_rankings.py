@@ -0,0 +1,305 @@
+import asyncio
+import base64
+import csv
+import dataclasses
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import literal_column, select
+
+from app.adapters.api.dependencies import get_participant_ranking_service
+from app.core.cache import TTLCache, section_invalidation_tags
+from app.main import app
+from app.repositories.participant_ranking import (
+    ParticipantRankingPage,
+    ParticipantRankingRecord,
+    ParticipantRankingRepository,
+)
+from app.schemas import ParticipantRankingSortField, RankingNormalization, SortOrder
+from app.services.participant_ranking import ParticipantRankingService
+
+# Создаем тестовый клиент
+client = TestClient(app)
+
+# Мок-данные для тестирования
+mock_records = [
+    ParticipantRankingRecord(
+        participant_id=index,
+        person_id=index,
+        first_name=f"Имя {index}",
+        last_name=f"Фамилия, {index}",
+        middle_name=None,
+        section_id=1,
+        section_name="Section 1",
+        presentation_topic="Topic",
+        total_score=30.0 - index / 3,
+        scores_count=3,
+        rank=index,
+    )
+    for index in range(1, 4)
+]
+
+
+class FakeRankingRepository:
+    """Репозиторий, который отдает записи так же, как серверный курсор"""
+
+    def __init__(self):
+        self.stream_calls = []
+        self.list_calls = []
+        self.lookups = 0
+
+    async def list_rankings(self, **kwargs):
+        self.list_calls.append(kwargs)
+        return ParticipantRankingPage(items=mock_records[:2], total=3, has_next=True)
+
+    async def get_ranking_by_participant(self, participant_id, **_kwargs):
+        self.lookups += 1
+        return mock_records[participant_id - 1]
+
+    async def stream_rankings(self, **kwargs):
+        self.stream_calls.append(kwargs)
+        for record in mock_records:
+            yield record
+
+
+@pytest.fixture
+def fake_repository():
+    return FakeRankingRepository()
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(fake_repository):
+    """Переопределяем зависимости FastAPI для тестов"""
+    service = ParticipantRankingService(fake_repository, TTLCache(max_entries=0, ttl_seconds=0))
+    app.dependency_overrides[get_participant_ranking_service] = lambda: service
+    yield
+    app.dependency_overrides.clear()
+
+
+# Тест GET /export - выгрузка в CSV
+def test_export_rankings_csv(fake_repository):
+    """Тест выгрузки рейтинга в CSV с заголовком и экранированием"""
+    response = client.get("/api/v1/participant-rankings/export?section_id=1&sort_by=last_name&sort_order=asc")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "participant-rankings.csv" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["participant_id"] for row in rows] == ["1", "2", "3"]
+    assert rows[0]["last_name"] == "Фамилия, 1"
+    assert rows[1]["total_score"] == "29.33"
+    assert fake_repository.stream_calls[0]["section_id"] == 1
+    assert fake_repository.stream_calls[0]["sort_by"].value == "last_name"
+
+
+# Тест GET /export - выгрузка в NDJSON
+def test_export_rankings_ndjson():
+    """Тест выгрузки рейтинга в NDJSON: один JSON-объект на строку"""
+    response = client.get("/api/v1/participant-rankings/export?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert len(items) == 3
+    assert items[2]["rank"] == 3
+    assert items[0]["middle_name"] is None
+
+
+# Тест GET /export - неизвестный формат
+def test_export_rankings_invalid_format():
+    """Тест ошибки валидации для неподдерживаемого формата"""
+    response = client.get("/api/v1/participant-rankings/export?format=xml")
+
+    assert response.status_code == 422
+
+
+# Тест чтения своих записей мимо кэша
+def test_bypass_cache_reads_fresh_data_and_refills_cache(fake_repository):
+    """Тест: сервис с bypass_cache не читает кэш, но кладет в него свежий результат"""
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cached_service = ParticipantRankingService(fake_repository, cache)
+    fresh_service = ParticipantRankingService(fake_repository, cache, bypass_cache=True)
+
+    async def scenario():
+        await cached_service.get_ranking(1, section_id=1, jury_id=None)
+        await fresh_service.get_ranking(1, section_id=1, jury_id=None)
+        return await cached_service.get_ranking(1, section_id=1, jury_id=None)
+
+    ranking = asyncio.run(scenario())
+    assert ranking.participant_id == 1
+    assert fake_repository.lookups == 2
+
+
+# Тест GET / - нормализация оценок жюри
+def test_list_rankings_normalization_is_part_of_cursor():
+    """Тест: режим нормализации передается в репозиторий и закреплен в курсоре"""
+    url = "/api/v1/participant-rankings/?section_id=1&page_size=2"
+    first = client.get(f"{url}&normalization=zscore")
+
+    assert first.status_code == 200
+    cursor = first.json()["next_cursor"]
+    assert client.get(f"{url}&normalization=zscore&cursor={cursor}").status_code == 200
+
+    response = client.get(f"{url}&normalization=minmax&cursor={cursor}")
+    assert response.status_code == 400
+    assert (
+        response.json()["detail"]
+        == "Cursor was issued for a different section_id/jury_id/sort_by/sort_order/normalization"
+    )
+
+
+# Тест кэша по режиму нормализации
+def test_normalized_pages_are_cached_separately(fake_repository):
+    """Тест: страницы с разной нормализацией не подменяют друг друга в кэше"""
+    service = ParticipantRankingService(fake_repository, TTLCache(max_entries=10, ttl_seconds=60))
+    page_kwargs = {
+        "section_id": 1,
+        "jury_id": None,
+        "page": 1,
+        "page_size": 2,
+        "sort_by": ParticipantRankingSortField.TOTAL_SCORE,
+        "sort_order": SortOrder.DESC,
+    }
+
+    async def scenario():
+        for normalization in (RankingNormalization.ZSCORE, RankingNormalization.ZSCORE, RankingNormalization.NONE):
+            await service.list_rankings(**page_kwargs, normalization=normalization)
+
+    asyncio.run(scenario())
+    assert [call["normalization"] for call in fake_repository.list_calls] == [
+        RankingNormalization.ZSCORE,
+        RankingNormalization.NONE,
+    ]
+
+
+# Тест гонки чтения и записи оценки
+def test_page_read_during_score_write_is_not_cached(fake_repository):
+    """Тест: страница, чтение которой пересеклось с записью оценки, не остается в кэше устаревшей"""
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    service = ParticipantRankingService(fake_repository, cache)
+    read_page = fake_repository.list_rankings
+
+    async def list_rankings_during_write(**kwargs):
+        page = await read_page(**kwargs)
+        # оценка секции 1 зафиксирована после того, как запрос прочитал страницу
+        cache.invalidate(*section_invalidation_tags(1))
+        return page
+
+    page_kwargs = {
+        "section_id": 1,
+        "jury_id": None,
+        "page": 1,
+        "page_size": 2,
+        "sort_by": ParticipantRankingSortField.TOTAL_SCORE,
+        "sort_order": SortOrder.DESC,
+    }
+
+    async def scenario():
+        fake_repository.list_rankings = list_rankings_during_write
+        await service.list_rankings(**page_kwargs)
+        fake_repository.list_rankings = read_page
+        await service.list_rankings(**page_kwargs)
+        await service.list_rankings(**page_kwargs)
+
+    asyncio.run(scenario())
+    # второй запрос не получил устаревшую страницу, третий уже берет ее из кэша
+    assert len(fake_repository.list_calls) == 2
+
+
+def encode(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+cursor_scope = {
+    "section_id": 1,
+    "jury_id": None,
+    "sort_by": ParticipantRankingSortField.LAST_NAME,
+    "sort_order": SortOrder.ASC,
+    "normalization": RankingNormalization.NONE,
+}
+
+
+# Тест кодирования курсора
+def test_cursor_round_trip():
+    """Тест: курсор декодируется в значения ключей сортировки последней записи"""
+    record = dataclasses.replace(mock_records[1], first_name=None)
+    cursor = ParticipantRankingService._encode_cursor(record, **cursor_scope)
+
+    assert "=" not in cursor
+    assert ParticipantRankingService._decode_cursor(cursor, **cursor_scope) == [
+        "Фамилия, 2",
+        record.total_score,
+        "Фамилия, 2",
+        None,
+        2,
+    ]
+
+
+# Тест испорченного курсора
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "%%%",
+        encode([1, 2]),
+        encode({"scope": [1, None], "sort_by": "total_score"}),
+        # значение неподходящего типа не должно дойти до базы
+        encode(
+            {
+                "scope": [1, None],
+                "sort_by": "total_score",
+                "sort_order": "desc",
+                "normalization": "none",
+                "after": ["много", 1, "a", "b", 1],
+            }
+        ),
+        encode(
+            {
+                "scope": [1, None],
+                "sort_by": "total_score",
+                "sort_order": "desc",
+                "normalization": "none",
+                "after": [1, 1, "a", "b", 2**40],
+            }
+        ),
+    ],
+)
+def test_list_rankings_rejects_invalid_cursor(cursor, fake_repository):
+    """Тест: испорченный или поддельный курсор дает 400, а не 500"""
+    response = client.get("/api/v1/participant-rankings/", params={"section_id": 1, "cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+    assert fake_repository.list_calls == []
+
+
+# Тест курсора другой выборки
+@pytest.mark.parametrize(
+    "params",
+    [{"section_id": 2}, {"section_id": 1, "jury_id": 1}, {"section_id": 1, "sort_by": "last_name"}, {}],
+)
+def test_list_rankings_rejects_cursor_of_other_scope(params):
+    """Тест: курсор, выданный для другой секции, жюри или сортировки, отклоняется"""
+    first = client.get("/api/v1/participant-rankings/", params={"section_id": 1, "page_size": 2})
+    cursor = first.json()["next_cursor"]
+
+    response = client.get("/api/v1/participant-rankings/", params={**params, "page_size": 2, "cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Cursor was issued for a different")
+
+
+# Тест предиката по ключам сортировки
+def test_keyset_predicate_requires_value_per_key():
+    """Тест: число значений курсора должно совпадать с числом ключей сортировки"""
+    keys = ParticipantRankingRepository.sort_keys(
+        sort_by=ParticipantRankingSortField.TOTAL_SCORE, sort_order=SortOrder.DESC
+    )
+    subquery = select(*(literal_column(key.field) for key in keys)).subquery()
+
+    with pytest.raises(ValueError):
+        ParticipantRankingRepository._keyset_predicate(subquery, keys, [1.0])
@@ -0,0 +1,114 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_jury_score_read_service, get_jury_score_service
+from app.main import app
+from app.schemas import JuryScoreRead
+from app.services.jury_score import JuryScoreService
+
+# Создаем тестовый клиент
+client = TestClient(app)
+
+# Мок-данные для тестирования
+mock_score = JuryScoreRead(id=7, jury_id=3, participant_id=1, content=8.0, visuals=6.5, total=14.5)
+
+
+@pytest.fixture
+def mock_jury_score_service():
+    """Фикстура для мокирования JuryScoreService"""
+    service = MagicMock()
+    service.upsert_score = AsyncMock(return_value=(mock_score, True))
+    return service
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(mock_jury_score_service):
+    """Переопределяем зависимости FastAPI для тестов"""
+    app.dependency_overrides[get_jury_score_service] = lambda: mock_jury_score_service
+    yield
+    app.dependency_overrides.clear()
+
+
+# Тест PUT /by-jury/{jury_id} - создание оценки
+def test_upsert_score_created(mock_jury_score_service):
+    """Тест: первая запись оценки возвращает 201"""
+    response = client.put("/api/v1/participants/1/scores/by-jury/3", json={"content": 8.0, "visuals": 6.5})
+
+    assert response.status_code == 201
+    assert response.json()["id"] == 7
+    participant_id, jury_id, payload = mock_jury_score_service.upsert_score.await_args.args
+    assert (participant_id, jury_id) == (1, 3)
+    assert payload.content == 8.0
+    assert payload.delivery is None
+
+
+# Тест PUT /by-jury/{jury_id} - повторная запись
+def test_upsert_score_replaced(mock_jury_score_service):
+    """Тест: повторная запись той же оценки возвращает 200"""
+    mock_jury_score_service.upsert_score.return_value = (mock_score, False)
+
+    response = client.put("/api/v1/participants/1/scores/by-jury/3", json={"content": 8.0, "visuals": 6.5})
+
+    assert response.status_code == 200
+    assert response.json()["content"] == 8.0
+
+
+# Тест PUT /by-jury/{jury_id} - валидация диапазона
+def test_upsert_score_out_of_range():
+    """Тест: оценка вне диапазона 0-10 отклоняется"""
+    response = client.put("/api/v1/participants/1/scores/by-jury/3", json={"content": 11})
+
+    assert response.status_code == 422
+
+
+def make_history_service(changes):
+    """Сервис с замоканным репозиторием: оценка 7 участника 1 и ее история изменений"""
+    score_repo = MagicMock()
+    score_repo.get_score_by_id = AsyncMock(return_value=SimpleNamespace(id=7, participant_id=1))
+    score_repo.list_score_changes = AsyncMock(return_value=changes)
+    return JuryScoreService(
+        jury_score_repository=score_repo,
+        participant_repository=MagicMock(),
+        jury_repository=MagicMock(),
+        section_jury_repository=MagicMock(),
+        leaderboard_repository=MagicMock(),
+        ranking_repository=MagicMock(),
+        cache=MagicMock(),
+        broadcaster=MagicMock(),
+    )
+
+
+# Тест GET /{score_id}/history - постраничная история изменений
+def test_score_history_pages():
+    """Тест: лишняя строка от репозитория означает, что есть более старая страница"""
+    changes = [
+        SimpleNamespace(id=change_id, jury_scores_id=7, jury_id=3, update_time=datetime(2026, 5, 1, tzinfo=UTC))
+        for change_id in (9, 8, 5)
+    ]
+    service = make_history_service(changes)
+    app.dependency_overrides[get_jury_score_read_service] = lambda: service
+
+    response = client.get("/api/v1/participants/1/scores/7/history", params={"limit": 2, "before_id": 10})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [9, 8]
+    assert body["next_before_id"] == 8
+    service._score_repo.list_score_changes.assert_awaited_once_with(7, limit=3, before_id=10)
+
+
+# Тест GET /{score_id}/history - оценка другого участника
+def test_score_history_wrong_participant():
+    """Тест: история чужой оценки возвращает 404"""
+    service = make_history_service([])
+    app.dependency_overrides[get_jury_score_read_service] = lambda: service
+
+    response = client.get("/api/v1/participants/2/scores/7/history")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Score with id 7 not found for participant 2"
+    service._score_repo.list_score_changes.assert_not_called()
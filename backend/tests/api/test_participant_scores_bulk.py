@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_jury_score_service
+from app.core.cache import TTLCache
+from app.core.events import RankingBroadcaster
+from app.main import app
+from app.services.jury_score import JuryScoreService
+
+# Создаем тестовый клиент
+client = TestClient(app)
+
+BULK_URL = "/api/v1/participants/scores:bulk"
+
+# Участники 1 и 2 в секции 10, участник 3 без секции; жюри 5 закреплено за секцией 10
+SECTIONS = {1: 10, 2: 10, 3: None}
+
+
+def stored_total(item):
+    """Сумма критериев, которую база хранит в генерируемой колонке total"""
+    criteria = (item.organization_score, item.content, item.visuals, item.mechanics, item.delivery)
+    return sum(value or 0 for value in criteria)
+
+
+@pytest.fixture
+def repositories():
+    """Фикстура с замоканными репозиториями, которые отвечают на пакетные запросы"""
+    score_repo = MagicMock()
+    score_repo.list_existing_pairs = AsyncMock(return_value={(5, 2)})
+    score_repo.create_scores = AsyncMock(
+        side_effect=lambda items: [
+            SimpleNamespace(id=100 + index, total=stored_total(item), **item.model_dump())
+            for index, item in enumerate(items)
+        ]
+    )
+    score_repo.commit = AsyncMock()
+    score_repo.rollback = AsyncMock()
+
+    participant_repo = MagicMock()
+    participant_repo.get_participants_by_ids = AsyncMock(
+        side_effect=lambda ids: {pid: SimpleNamespace(section_id=SECTIONS[pid]) for pid in ids if pid in SECTIONS}
+    )
+    jury_repo = MagicMock()
+    jury_repo.get_juries_by_ids = AsyncMock(
+        side_effect=lambda ids: {jid: SimpleNamespace(id=jid) for jid in ids if jid in {5, 6}}
+    )
+    section_jury_repo = MagicMock()
+    section_jury_repo.list_assigned_pairs = AsyncMock(side_effect=lambda pairs: set(pairs) & {(5, 10)})
+    leaderboard_repo = MagicMock()
+    leaderboard_repo.refresh_participants = AsyncMock()
+
+    return SimpleNamespace(
+        score=score_repo,
+        participant=participant_repo,
+        jury=jury_repo,
+        section_jury=section_jury_repo,
+        leaderboard=leaderboard_repo,
+    )
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(repositories):
+    """Переопределяем зависимости FastAPI для тестов"""
+    service = JuryScoreService(
+        jury_score_repository=repositories.score,
+        participant_repository=repositories.participant,
+        jury_repository=repositories.jury,
+        section_jury_repository=repositories.section_jury,
+        leaderboard_repository=repositories.leaderboard,
+        ranking_repository=MagicMock(),
+        cache=TTLCache(max_entries=0, ttl_seconds=0),
+        broadcaster=RankingBroadcaster(queue_size=1, heartbeat_seconds=1),
+    )
+    app.dependency_overrides[get_jury_score_service] = lambda: service
+    yield
+    app.dependency_overrides.clear()
+
+
+invalid_batch = [
+    {"participant_id": 1, "jury_id": 5, "content": 7.5},
+    {"participant_id": 1, "jury_id": 5, "content": 1.0},  # дубликат внутри запроса
+    {"participant_id": 2, "jury_id": 5},  # уже оценен
+    {"participant_id": 3, "jury_id": 5},  # без секции
+    {"participant_id": 1, "jury_id": 6},  # жюри не закреплено за секцией
+    {"participant_id": 1, "jury_id": 7},  # жюри не существует
+    {"participant_id": 42, "jury_id": 5},  # участник не существует
+    {"jury_id": 5},  # нет participant_id
+]
+
+
+# Тест POST /scores:bulk - атомарный режим
+def test_bulk_atomic_rejects_whole_batch(repositories):
+    """Тест: при ошибке в атомарном пакете ничего не сохраняется"""
+    response = client.post(BULK_URL, json={"items": invalid_batch})
+
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["created"] == 0
+    assert detail["rejected"] == 7
+    assert detail["items"][0]["status"] == "skipped"
+    assert [item["error"] for item in detail["items"][1:]] == [
+        "Duplicate of item 0 in this request",
+        "Jury member 5 has already scored participant 2",
+        "Participant 3 is not assigned to any section",
+        "Jury member 6 is not assigned to section 10",
+        "Jury member with id 7 not found",
+        "Participant with id 42 not found",
+        "participant_id is required",
+    ]
+    repositories.score.create_scores.assert_not_called()
+    repositories.score.commit.assert_not_called()
+
+
+# Тест POST /scores:bulk - частичный режим
+def test_bulk_partial_stores_valid_items(repositories):
+    """Тест: в частичном режиме валидные элементы сохраняются одной вставкой"""
+    response = client.post(BULK_URL, json={"items": invalid_batch, "atomic": False})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["rejected"]) == (1, 7)
+    assert body["items"][0]["status"] == "created"
+    assert body["items"][0]["score"]["id"] == 100
+    assert body["items"][0]["score"]["content"] == 7.5
+    assert body["items"][0]["score"]["total"] == 7.5
+    assert all(item["status"] == "rejected" for item in body["items"][1:])
+
+    repositories.score.create_scores.assert_awaited_once()
+    repositories.score.commit.assert_awaited_once()
+    refreshed = repositories.leaderboard.refresh_participants.await_args.args[0]
+    assert list(refreshed) == [1]
+
+
+# Тест POST /scores:bulk - вставка потеряла гонку с параллельной записью
+def test_bulk_atomic_rolls_back_on_concurrent_conflict(repositories):
+    """Тест: если строка не вставилась из-за конфликта, атомарный пакет откатывается"""
+    repositories.score.create_scores = AsyncMock(return_value=[])
+
+    response = client.post(BULK_URL, json={"items": [{"participant_id": 1, "jury_id": 5}]})
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["items"][0]["error"] == "Jury member 5 has already scored participant 1"
+    repositories.score.rollback.assert_awaited_once()
+    repositories.score.commit.assert_not_called()
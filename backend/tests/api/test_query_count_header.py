@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_section_service
+from app.core.config import settings
+from app.main import create_app
+
+
+def make_client():
+    """Тестовый клиент нового приложения с замоканным сервисом секций"""
+    application = create_app()
+    service = MagicMock()
+    service.list_sections = AsyncMock(return_value=[])
+    application.dependency_overrides[get_section_service] = lambda: service
+    return TestClient(application)
+
+
+def test_response_reports_query_count(monkeypatch):
+    """При DB_QUERY_COUNT_HEADER=true каждый ответ содержит число SQL-запросов, выполненных за запрос"""
+    monkeypatch.setattr(settings, "db_query_count_header", True)
+
+    response = make_client().get("/api/v1/sections/")
+
+    assert response.status_code == 200
+    assert response.headers["x-query-count"] == "0"
+
+
+@pytest.mark.parametrize("request_metrics", [False, True])
+def test_query_count_is_hidden_by_default(monkeypatch, request_metrics):
+    """По умолчанию заголовок не отдается клиентам, в том числе при включенных метриках"""
+    monkeypatch.setattr(settings, "request_metrics", request_metrics)
+
+    response = make_client().get("/api/v1/sections/")
+
+    assert response.status_code == 200
+    assert "x-query-count" not in response.headers
@@ -0,0 +1,65 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.adapters.api.middleware import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware
+from app.db import session as db_session
+
+
+def make_client(monkeypatch) -> TestClient:
+    """Приложение с двумя «репликами», которое сообщает, какую фабрику сессий получило чтение"""
+    replicas = [object(), object()]
+    monkeypatch.setattr(db_session, "ReplicaSessionMakers", replicas)
+    monkeypatch.setattr(db_session, "_replica_rotation", iter(replicas * 2))
+    names = {id(replicas[0]): "replica-1", id(replicas[1]): "replica-2", id(db_session.AsyncSessionMaker): "primary"}
+
+    application = FastAPI()
+
+    @application.get("/read")
+    async def read() -> dict:
+        return {"target": names[id(db_session.get_read_session_maker())]}
+
+    @application.post("/write")
+    async def write(fail: bool = False) -> dict:
+        if fail:
+            raise HTTPException(status_code=422, detail="invalid")
+        return {}
+
+    application.add_middleware(ReadYourWritesMiddleware, window_seconds=4.5)
+    return TestClient(application)
+
+
+def test_reads_rotate_over_replicas(monkeypatch):
+    """Тест: без записей чтение распределяется по репликам по кругу"""
+    client = make_client(monkeypatch)
+
+    targets = [client.get("/read").json()["target"] for _ in range(3)]
+
+    assert targets == ["replica-1", "replica-2", "replica-1"]
+
+
+def test_successful_write_pins_reads_to_primary(monkeypatch):
+    """Тест: после успешной записи клиент читает с primary, пока жива кука"""
+    client = make_client(monkeypatch)
+
+    rejected = client.post("/write", params={"fail": True})
+    assert "set-cookie" not in rejected.headers
+    assert client.get("/read").json()["target"] == "replica-1"
+
+    response = client.post("/write")
+    assert response.headers["set-cookie"] == f"{READ_PRIMARY_COOKIE}=1; Max-Age=5; Path=/; HttpOnly; SameSite=lax"
+    assert client.get("/read").json()["target"] == "primary"
+
+
+def test_header_pins_reads_to_primary(monkeypatch):
+    """Тест: клиент без кук может запросить чтение с primary заголовком"""
+    client = make_client(monkeypatch)
+
+    assert client.get("/read", headers={"X-Read-Primary": "1"}).json()["target"] == "primary"
+    assert db_session.reads_pinned_to_primary() is False
+
+
+def test_reads_use_primary_without_replicas():
+    """Тест: если реплики не настроены, чтение идет в primary"""
+    assert db_session.ReplicaSessionMakers == []
+    with db_session.read_from_primary(False):
+        assert db_session.get_read_session_maker() is db_session.AsyncSessionMaker
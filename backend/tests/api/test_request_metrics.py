@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main
+from app.adapters.api.dependencies import get_section_service
+from app.adapters.api.metrics import get_request_metrics
+from app.core.config import settings
+from app.core.metrics import RequestMetrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Отдельный реестр метрик и приложение с включенной инструментацией"""
+    registry = RequestMetrics()
+    monkeypatch.setattr(settings, "request_metrics", True)
+    monkeypatch.setattr(settings, "db_query_count_header", True)
+    monkeypatch.setattr(app.main, "request_metrics", registry)
+    return registry
+
+
+@pytest.fixture
+def client(metrics):
+    """Тестовый клиент приложения с замоканным сервисом секций"""
+    application = app.main.create_app()
+    service = MagicMock()
+    service.list_sections = AsyncMock(return_value=[])
+    application.dependency_overrides[get_section_service] = lambda: service
+    application.dependency_overrides[get_request_metrics] = lambda: metrics
+    return TestClient(application)
+
+
+# Тест заголовка Server-Timing
+def test_response_reports_server_timing(client):
+    """Каждый ответ содержит время работы с базой, число запросов и общее время"""
+    response = client.get("/api/v1/sections/")
+
+    assert response.status_code == 200
+    db, total = response.headers["server-timing"].split(", ")
+    assert db.startswith("db;dur=") and db.endswith(';desc="0 queries"')
+    assert total.startswith("total;dur=")
+    # счетчик X-Query-Count продолжает работать вместе с инструментацией
+    assert response.headers["x-query-count"] == "0"
+
+
+# Тест GET /metrics
+def test_metrics_are_grouped_by_route_template(client):
+    """Запросы учитываются по шаблону маршрута, а не по конкретному пути"""
+    client.get("/api/v1/sections/")
+    client.get("/api/v1/sections/")
+    client.get("/api/v1/no-such-endpoint")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/api/v1/sections/",status="200"} 2' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/v1/sections/",le="+Inf"} 2' in body
+    assert 'db_statements_total{method="GET",route="/api/v1/sections/"} 0' in body
+    assert "# TYPE db_duration_seconds_total counter" in body
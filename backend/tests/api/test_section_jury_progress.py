@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_section_jury_read_service
+from app.main import app
+from app.services.section_jury import SectionJuryService
+
+# Создаем тестовый клиент
+client = TestClient(app)
+
+PROGRESS_URL = "/api/v1/sections/{section_id}/jury-progress"
+
+# Секция с тремя участниками и двумя членами жюри
+progress_rows = [
+    {
+        "jury_id": 1,
+        "first_name": "Иван",
+        "last_name": "Петров",
+        "participant_ids": [4, 8, 15],
+        "graded_count": 2,
+        "graded": "101",
+    },
+    {
+        "jury_id": 2,
+        "first_name": "Анна",
+        "last_name": None,
+        "participant_ids": [4, 8, 15],
+        "graded_count": 0,
+        "graded": "000",
+    },
+]
+
+
+@pytest.fixture
+def repositories():
+    """Фикстура с замоканными репозиториями"""
+    section_jury_repo = MagicMock()
+    section_jury_repo.get_section_progress = AsyncMock(return_value=progress_rows)
+    section_repo = MagicMock()
+    section_repo.get_section_by_id = AsyncMock(return_value=SimpleNamespace(id=3))
+    return SimpleNamespace(section_jury=section_jury_repo, section=section_repo)
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(repositories):
+    """Переопределяем зависимости FastAPI для тестов"""
+    service = SectionJuryService(
+        section_jury_repository=repositories.section_jury,
+        section_repository=repositories.section,
+        jury_repository=MagicMock(),
+    )
+    app.dependency_overrides[get_section_jury_read_service] = lambda: service
+    yield
+    app.dependency_overrides.clear()
+
+
+# Тест GET /sections/{id}/jury-progress
+def test_section_jury_progress_matrix(repositories):
+    """Тест матрицы оценивания: битовая строка и процент выполнения по каждому члену жюри"""
+    response = client.get(PROGRESS_URL.format(section_id=3))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["participant_ids"] == [4, 8, 15]
+    assert body["juries"][0] == {
+        "jury_id": 1,
+        "jury_name": "Петров Иван",
+        "graded_count": 2,
+        "completion": 66.7,
+        "graded": "101",
+    }
+    assert body["juries"][1]["jury_name"] == "Анна"
+    assert body["juries"][1]["completion"] == 0.0
+    repositories.section.get_section_by_id.assert_not_called()
+
+
+# Тест GET /sections/{id}/jury-progress - за секцией никто не закреплен
+def test_section_jury_progress_without_juries(repositories):
+    """Тест: пустая матрица для существующей секции и 404 для несуществующей"""
+    repositories.section_jury.get_section_progress = AsyncMock(return_value=[])
+
+    response = client.get(PROGRESS_URL.format(section_id=3))
+    assert response.status_code == 200
+    assert response.json() == {"section_id": 3, "participant_ids": [], "juries": []}
+
+    repositories.section.get_section_by_id = AsyncMock(return_value=None)
+    response = client.get(PROGRESS_URL.format(section_id=99))
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Section with id 99 not found"
@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import get_score_stats_service
+from app.core.cache import TTLCache, section_invalidation_tags
+from app.main import app
+from app.repositories.score_stats import CRITERIA_FIELDS, ScoreStatsRecord
+from app.services.score_stats import ScoreStatsService
+
+# Создаем тестовый клиент
+client = TestClient(app)
+
+
+def make_record(jury_id, scores_count, mean, *, is_overall=False, stddev=None):
+    return ScoreStatsRecord(
+        is_overall=is_overall,
+        jury_id=jury_id,
+        scores_count=scores_count,
+        participants_count=scores_count,
+        mean=mean,
+        median=mean,
+        stddev=stddev,
+        min=mean,
+        max=mean,
+        criteria=dict.fromkeys(CRITERIA_FIELDS, mean / 5 if mean is not None else None),
+    )
+
+
+@pytest.fixture
+def repositories():
+    """Фикстура с замоканными репозиториями статистики и секций"""
+    stats_repo = MagicMock()
+    stats_repo.get_section_stats = AsyncMock(
+        return_value=[
+            make_record(None, 3, 21.333333, is_overall=True, stddev=4.041452),
+            make_record(1, 2, 20.0, stddev=5.656854),
+            make_record(2, 1, 24.0),
+        ]
+    )
+    section_repo = MagicMock()
+    section_repo.get_section_by_id = AsyncMock(return_value=None)
+    return stats_repo, section_repo
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(max_entries=10, ttl_seconds=60)
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(repositories, cache):
+    """Переопределяем зависимости FastAPI для тестов"""
+    stats_repo, section_repo = repositories
+    service = ScoreStatsService(stats_repo, section_repo, cache)
+    app.dependency_overrides[get_score_stats_service] = lambda: service
+    yield
+    app.dependency_overrides.clear()
+
+
+# Тест GET /sections/{id}/score-stats
+def test_section_score_stats(repositories):
+    """Тест статистики секции: общая строка и строки по членам жюри с округлением"""
+    response = client.get("/api/v1/sections/1/score-stats")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["section_id"] == 1
+    assert body["overall"]["mean"] == 21.33
+    assert body["overall"]["stddev"] == 4.04
+    assert body["overall"]["criteria"]["content"] == 4.27
+    assert [(jury["jury_id"], jury["scores_count"]) for jury in body["juries"]] == [(1, 2), (2, 1)]
+    assert body["juries"][1]["stddev"] is None
+    # секция с оценками существует, отдельный запрос не нужен
+    repositories[1].get_section_by_id.assert_not_called()
+
+
+# Тест кэширования до следующей записи оценки
+def test_section_score_stats_cached_until_score_write(repositories, cache):
+    """Тест: повторный запрос берется из кэша, запись оценки в секции сбрасывает его"""
+    client.get("/api/v1/sections/1/score-stats")
+    client.get("/api/v1/sections/1/score-stats")
+    assert repositories[0].get_section_stats.await_count == 1
+
+    cache.invalidate(*section_invalidation_tags(1))
+    client.get("/api/v1/sections/1/score-stats")
+    assert repositories[0].get_section_stats.await_count == 2
+
+
+# Тест GET /sections/{id}/score-stats - секция не найдена
+def test_section_score_stats_not_found(repositories):
+    """Тест: без оценок проверяется существование секции"""
+    repositories[0].get_section_stats = AsyncMock(return_value=[make_record(None, 0, None, is_overall=True)])
+
+    response = client.get("/api/v1/sections/99/score-stats")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Section with id 99 not found"
@@ -0,0 +1,173 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from app.core.cache import TTLCache
+from app.core.events import HEARTBEAT, RESYNC_EVENT, RankingBroadcaster, RankingSubscription, ServerSentEvent
+from app.repositories.participant_ranking import ParticipantRankingRecord
+from app.services.jury_score import JuryScoreService
+
+
+def make_event(index: int) -> ServerSentEvent:
+    return ServerSentEvent(event="ranking", data=f'{{"index": {index}}}')
+
+
+def test_event_encoding():
+    """Многострочные данные разбиваются на несколько строк data:"""
+    assert make_event(1).encode() == 'event: ranking\ndata: {"index": 1}\n\n'
+    assert ServerSentEvent(event="x", data="a\nb").encode() == "event: x\ndata: a\ndata: b\n\n"
+
+
+def test_slow_subscriber_gets_resync_instead_of_backlog():
+    """Переполненная очередь очищается и заменяется одним событием resync"""
+    resync = ServerSentEvent(event=RESYNC_EVENT, data="{}")
+
+    async def scenario():
+        subscription = RankingSubscription(section_id=1, queue_size=2)
+        for index in range(4):
+            subscription.push(make_event(index))
+        received = [await subscription.get(timeout=0.1) for _ in range(2)]
+        received.append(await subscription.get(timeout=0.01))  # пусто, вместо события будет keep-alive
+        dropped_first = subscription.dropped
+
+        # Повторный resync не считается потерянным событием
+        for index in range(4, 7):
+            subscription.push(make_event(index))
+        received.append(await subscription.get(timeout=0.1))
+        received.append(await subscription.get(timeout=0.01))
+        return received, dropped_first, subscription.dropped
+
+    received, dropped_first, dropped_total = asyncio.run(scenario())
+    assert received == [resync, make_event(3), None, resync, None]
+    assert (dropped_first, dropped_total) == (2, 4)
+
+
+def test_publish_routes_by_scope_and_unsubscribes_on_close():
+    """События секции доставляются только ее подписчикам, события всей таблицы — подписчикам всей таблицы"""
+
+    async def scenario():
+        broadcaster = RankingBroadcaster(queue_size=10, heartbeat_seconds=0.01)
+        ready = ServerSentEvent(event="ready", data="{}")
+        section_one = broadcaster.listen(1, ready)
+        all_sections = broadcaster.listen(None, ready)
+        assert await anext(section_one) == ready.encode()
+        assert await anext(all_sections) == ready.encode()
+
+        delivered = [
+            broadcaster.publish(2, make_event(2)),
+            broadcaster.publish(1, make_event(1)),
+            broadcaster.publish(None, make_event(0)),
+        ]
+        received_one = [await anext(section_one), await anext(section_one)]
+        received_all = [await anext(all_sections), await anext(all_sections)]
+
+        subscribed = broadcaster.subscriber_count()
+        await section_one.aclose()
+        await all_sections.aclose()
+        return delivered, received_one, received_all, subscribed, broadcaster
+
+    delivered, received_one, received_all, subscribed, broadcaster = asyncio.run(scenario())
+    assert delivered == [0, 1, 1]
+    assert received_one == [make_event(1).encode(), HEARTBEAT]
+    assert received_all == [make_event(0).encode(), HEARTBEAT]
+    assert subscribed == 2
+    assert broadcaster.subscriber_count() == 0
+    assert not broadcaster.has_subscribers(1)
+
+
+def test_changed_rows_since_last_publish():
+    """Первый раз отдается вся таблица, затем только изменившиеся строки; после ухода подписчиков — снова вся"""
+
+    async def scenario():
+        broadcaster = RankingBroadcaster(queue_size=10, heartbeat_seconds=0.01)
+        listener = broadcaster.listen(1, ServerSentEvent(event="ready", data="{}"))
+        await anext(listener)
+        first = broadcaster.changed_rows(1, {1: "a", 2: "b"})
+        second = broadcaster.changed_rows(1, {1: "a", 2: "c", 3: "d"})
+        await listener.aclose()
+        return first, second, broadcaster.changed_rows(1, {1: "a"})
+
+    first, second, after_reconnect = asyncio.run(scenario())
+    assert first == ["a", "b"]
+    assert second == ["c", "d"]
+    assert after_reconnect == ["a"]
+
+
+def ranking_record(participant_id, section_id, total_score, rank):
+    return ParticipantRankingRecord(
+        participant_id=participant_id,
+        person_id=None,
+        first_name=None,
+        last_name=None,
+        middle_name=None,
+        section_id=section_id,
+        section_name=None,
+        presentation_topic=None,
+        total_score=total_score,
+        scores_count=1,
+        rank=rank,
+    )
+
+
+class FakeBoards:
+    """Репозиторий рейтинга: итоги участников {participant_id: (section_id, total)} с плотными рангами"""
+
+    def __init__(self, totals):
+        self.totals = totals
+        self.queries = []
+
+    async def list_scope_rankings(self, *, section_id=None):
+        self.queries.append(section_id)
+        rows = {pid: value for pid, value in self.totals.items() if section_id in (None, value[0])}
+        distinct = sorted({total for _, total in rows.values()}, reverse=True)
+        return [
+            ranking_record(pid, section, total, distinct.index(total) + 1) for pid, (section, total) in rows.items()
+        ]
+
+
+# Тест рассылки изменившихся рангов
+def test_score_write_publishes_every_changed_rank():
+    """Тест: запись оценки рассылает всех участников, чей ранг сдвинулся, отдельно для секции и всей таблицы"""
+    # секция 1: участники 1 и 2, секция 2: участник 3
+    boards = FakeBoards({1: (1, 10.0), 2: (1, 20.0), 3: (2, 15.0)})
+    broadcaster = RankingBroadcaster(queue_size=10, heartbeat_seconds=0.01)
+    service = JuryScoreService(
+        jury_score_repository=MagicMock(),
+        participant_repository=MagicMock(),
+        jury_repository=MagicMock(),
+        section_jury_repository=MagicMock(),
+        leaderboard_repository=MagicMock(),
+        ranking_repository=boards,
+        cache=TTLCache(max_entries=0, ttl_seconds=0),
+        broadcaster=broadcaster,
+    )
+
+    async def next_delta(listener):
+        event = await anext(listener)
+        return {item["participant_id"]: item["rank"] for item in json.loads(event.split("data: ", 1)[1])["items"]}
+
+    async def scenario():
+        ready = ServerSentEvent(event="ready", data="{}")
+        section_one = broadcaster.listen(1, ready)
+        all_sections = broadcaster.listen(None, ready)
+        await anext(section_one)
+        await anext(all_sections)
+
+        await service._after_scores_committed([1])
+        initial = await next_delta(section_one), await next_delta(all_sections)
+
+        # участник 1 обходит обоих: ранги 2 и 3 сдвигаются, хотя их оценки не менялись
+        boards.totals[1] = (1, 30.0)
+        await service._after_scores_committed([1])
+        moved = await next_delta(section_one), await next_delta(all_sections)
+
+        await section_one.aclose()
+        await all_sections.aclose()
+        return initial, moved
+
+    initial, moved = asyncio.run(scenario())
+
+    assert initial == ({2: 1, 1: 2}, {2: 1, 3: 2, 1: 3})
+    assert moved == ({1: 1, 2: 2}, {1: 1, 2: 2, 3: 3})
+    # один запрос на область видимости, а не на участника
+    assert boards.queries == [1, None, 1, None]
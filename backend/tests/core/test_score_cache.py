@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from app.core.cache import TTLCache, section_invalidation_tags, section_tags
+
+
+def test_cache_hit_and_miss_counters():
+    """Тест подсчёта попаданий и промахов"""
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Тест вытеснения самой старой записи при переполнении"""
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_cache_entry_expires_after_ttl():
+    """Тест истечения времени жизни записи"""
+    cache = TTLCache(max_entries=10, ttl_seconds=5)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("app.core.cache.time.monotonic", return_value=104.0):
+        assert cache.get("key") == "value"
+    with patch("app.core.cache.time.monotonic", return_value=106.0):
+        assert cache.get("key") is None
+    assert cache.stats().size == 0
+
+
+def test_score_write_invalidates_section_and_global_entries():
+    """Тест инвалидации: запись оценки сбрасывает страницы своей секции и общий рейтинг"""
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.set("section-1", "s1", tags=section_tags(1))
+    cache.set("section-2", "s2", tags=section_tags(2))
+    cache.set("all", "all", tags=section_tags(None))
+
+    removed = cache.invalidate(*section_invalidation_tags(1))
+
+    assert removed == 2
+    assert cache.get("section-1") is None
+    assert cache.get("all") is None
+    assert cache.get("section-2") == "s2"
+
+
+def test_result_computed_before_invalidation_is_not_stored():
+    """Тест гонки: результат, прочитанный до записи оценки, не попадает в кэш после инвалидации"""
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    version = cache.version(section_tags(1))
+    other_version = cache.version(section_tags(2))
+
+    # оценка секции 1 записана, пока страницы читались из базы
+    cache.invalidate(*section_invalidation_tags(1))
+    cache.set("section-1", "stale", tags=section_tags(1), version=version)
+    cache.set("section-2", "s2", tags=section_tags(2), version=other_version)
+
+    assert cache.get("section-1") is None
+    assert cache.get("section-2") == "s2"
+
+    cache.set("section-1", "fresh", tags=section_tags(1), version=cache.version(section_tags(1)))
+    assert cache.get("section-1") == "fresh"
+
+
+def test_cache_disabled_with_zero_ttl():
+    """Тест отключения кэша нулевым TTL"""
+    cache = TTLCache(max_entries=10, ttl_seconds=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert cache.stats().size == 0
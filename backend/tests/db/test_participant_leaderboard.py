@@ -0,0 +1,149 @@
+import asyncio
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.commands import rebuild_leaderboard
+from app.models import ParticipantLeaderboard
+from app.repositories.participant_leaderboard import ParticipantLeaderboardRepository
+
+# Участник 4 без оценок, участник 3 оценен одним членом жюри
+SEED_SQL = [
+    "INSERT INTO sections (id, name) VALUES (1, 'Section 1')",
+    "INSERT INTO participants (id, section_id) SELECT p, 1 FROM generate_series(1, 4) p",
+    "INSERT INTO juries (id, access_key) VALUES (1, 1), (2, 2)",
+    """
+    INSERT INTO jury_scores (jury_id, participant_id, organization_score, content, visuals, mechanics, delivery)
+    VALUES (1, 1, 5, 5, 5, 5, 5), (2, 1, 4, 4, 4, 4, NULL), (1, 2, 3, 3, 3, 3, 3), (2, 3, 1, 2, 3, 4, 5)
+    """,
+]
+
+
+async def leaderboard(session):
+    """Содержимое таблицы лидеров как {participant_id: (total_score, scores_count)}"""
+    rows = await session.execute(
+        select(
+            ParticipantLeaderboard.participant_id,
+            ParticipantLeaderboard.total_score,
+            ParticipantLeaderboard.scores_count,
+        )
+    )
+    return {participant_id: (total, count) for participant_id, total, count in rows}
+
+
+# Тест полной пересборки
+def test_rebuild_includes_participants_without_scores(postgres_schema):
+    """Тест: пересборка пишет строку для каждого участника, участник без оценок получает 0"""
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine, AsyncSession(engine) as session:
+            written = await ParticipantLeaderboardRepository(session).rebuild()
+            return written, await leaderboard(session)
+
+    written, rows = asyncio.run(scenario())
+
+    assert written == 4
+    assert rows == {1: (41.0, 2), 2: (15.0, 1), 3: (15.0, 1), 4: (0.0, 0)}
+
+
+# Тест инкрементального обновления
+def test_refresh_after_score_write_matches_rebuild(postgres_schema):
+    """Тест: после записи оценки обновление только затронутых участников дает то же, что полная пересборка"""
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine, AsyncSession(engine) as session:
+            repository = ParticipantLeaderboardRepository(session)
+            await repository.rebuild()
+
+            # первая оценка участника 4 и исправление оценки участника 1
+            await session.execute(
+                text(
+                    "INSERT INTO jury_scores (jury_id, participant_id, organization_score, content) "
+                    "VALUES (1, 4, 2, 2)"
+                )
+            )
+            await session.execute(text("UPDATE jury_scores SET delivery = 4 WHERE jury_id = 2 AND participant_id = 1"))
+            await repository.refresh_participants([4, 1, None, 4])
+            refreshed = await leaderboard(session)
+
+            await repository.rebuild()
+            return refreshed, await leaderboard(session)
+
+    refreshed, rebuilt = asyncio.run(scenario())
+
+    assert refreshed == rebuilt
+    assert refreshed[1] == (45.0, 2)
+    assert refreshed[4] == (4.0, 1)
+
+
+# Тест обновления участника без оценок
+def test_refresh_participant_without_scores(postgres_schema):
+    """Тест: обновление участника без оценок создает нулевую строку, пустой список ничего не делает"""
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine, AsyncSession(engine) as session:
+            repository = ParticipantLeaderboardRepository(session)
+            await repository.refresh_participants([])
+            empty = await leaderboard(session)
+            await repository.refresh_participants([4])
+            return empty, await leaderboard(session)
+
+    empty, rows = asyncio.run(scenario())
+
+    assert empty == {}
+    assert rows == {4: (0.0, 0)}
+
+
+# Тест команды пересборки
+def test_rebuild_leaderboard_command(postgres_schema, monkeypatch):
+    """Тест: команда пересобирает и фиксирует таблицу лидеров, устаревшие строки заменяются"""
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine:
+            session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+            monkeypatch.setattr(rebuild_leaderboard, "AsyncSessionMaker", session_maker)
+            async with session_maker() as session:
+                session.add(ParticipantLeaderboard(participant_id=2, total_score=999.0, scores_count=9))
+                await session.commit()
+
+            written = await rebuild_leaderboard.rebuild_leaderboard()
+            # новая сессия видит только зафиксированные данные
+            async with session_maker() as session:
+                return written, await leaderboard(session)
+
+    written, rows = asyncio.run(scenario())
+
+    assert written == 4
+    assert rows[2] == (15.0, 1)
+
+
+# Тест одновременной записи оценок одного участника
+def test_concurrent_refresh_does_not_lose_score(postgres_schema):
+    """Тест: две транзакции оценивают участника одновременно — итог учитывает обе оценки"""
+    insert_score = (
+        "INSERT INTO jury_scores (jury_id, participant_id, organization_score) VALUES ({jury_id}, 4, {score})"
+    )
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine:
+            session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+            async with session_maker() as first, session_maker() as second:
+                await first.execute(text(insert_score.format(jury_id=1, score=3)))
+                await ParticipantLeaderboardRepository(first).refresh_participants([4])
+
+                await second.execute(text(insert_score.format(jury_id=2, score=7)))
+                # второе обновление ждет фиксации первого, а не пишет сумму без его оценки
+                refresh = asyncio.create_task(ParticipantLeaderboardRepository(second).refresh_participants([4]))
+                await asyncio.sleep(0.2)
+                waited = not refresh.done()
+                await first.commit()
+                await refresh
+                await second.commit()
+
+            async with session_maker() as session:
+                return waited, await leaderboard(session)
+
+    waited, rows = asyncio.run(scenario())
+
+    assert waited
+    assert rows[4] == (10.0, 2)
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.repositories.participant_ranking import ParticipantRankingRepository
+from app.schemas import ParticipantRankingSortField, SortOrder
+from app.services.participant_ranking import ParticipantRankingService
+
+# Секция 1: итоги 50, 40, 40, 30 и участник 5 без оценок; секция 2: один участник с итогом 60
+SEED_SQL = [
+    "INSERT INTO sections (id, name) VALUES (1, 'Section 1'), (2, 'Section 2')",
+    """
+    INSERT INTO people (id, first_name, last_name)
+    SELECT p, 'Name ' || p, 'Surname ' || p FROM generate_series(1, 6) p
+    """,
+    """
+    INSERT INTO participants (id, person_id, section_id)
+    SELECT p, p, CASE WHEN p = 6 THEN 2 ELSE 1 END FROM generate_series(1, 6) p
+    """,
+    """
+    INSERT INTO participant_leaderboard (participant_id, total_score, scores_count)
+    VALUES (1, 50, 2), (2, 40, 2), (3, 40, 2), (4, 30, 2), (6, 60, 2)
+    """,
+]
+
+
+async def ranks(session, participant_ids, section_id):
+    repository = ParticipantRankingRepository(session)
+    return {
+        participant_id: (await repository.get_ranking_by_participant(participant_id, section_id=section_id)).rank
+        for participant_id in participant_ids
+    }
+
+
+# Тест плотного ранга (регрессия: ранг всегда был 1)
+def test_single_participant_rank_is_dense(postgres_schema):
+    """Тест: ранг отдельного участника плотный — одинаковые итоги делят место, следующее место не пропускается"""
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine, AsyncSession(engine) as session:
+            in_section = await ranks(session, [1, 2, 3, 4, 5], section_id=1)
+            overall = await ranks(session, [6, 1, 3, 5], section_id=None)
+            repository = ParticipantRankingRepository(session)
+            page = await repository.list_rankings(
+                section_id=1,
+                page=1,
+                page_size=10,
+                sort_by=ParticipantRankingSortField.TOTAL_SCORE,
+                sort_order=SortOrder.DESC,
+            )
+            scopes = {
+                scope: {
+                    record.participant_id: record.rank
+                    for record in await repository.list_scope_rankings(section_id=scope)
+                }
+                for scope in (1, None)
+            }
+            return in_section, overall, {item.participant_id: item.rank for item in page.items}, scopes
+
+    in_section, overall, listed, scopes = asyncio.run(scenario())
+
+    assert in_section == {1: 1, 2: 2, 3: 2, 4: 3, 5: 4}
+    # без секции участник другой секции с итогом 60 сдвигает всех на одно место
+    assert overall == {6: 1, 1: 2, 3: 3, 5: 5}
+    # отдельный запрос совпадает с рангом в списке
+    assert listed == in_section
+    # ранги всей секции и всей таблицы для живой ленты считаются одним запросом и совпадают
+    assert scopes[1] == in_section
+    assert {participant_id: scopes[None][participant_id] for participant_id in overall} == overall
+
+
+# Секция 1: девять участников, итоги повторяются; у участника 9 нет ни фамилии, ни оценок
+TIED_SEED_SQL = [
+    "INSERT INTO sections (id, name) VALUES (1, 'Section 1')",
+    """
+    INSERT INTO people (id, first_name, last_name)
+    SELECT p, 'Name', CASE WHEN p % 2 = 0 THEN 'Same' ELSE 'Surname ' || p END FROM generate_series(1, 8) p
+    """,
+    "INSERT INTO participants (id, person_id, section_id) SELECT p, p, 1 FROM generate_series(1, 8) p",
+    "INSERT INTO participants (id, section_id) VALUES (9, 1)",
+    """
+    INSERT INTO participant_leaderboard (participant_id, total_score, scores_count)
+    VALUES (1, 40, 2), (2, 40, 2), (3, 40, 1), (4, 40, 2), (5, 30, 2), (6, 30, 2), (7, 30, 2), (8, 20, 1)
+    """,
+]
+
+
+async def walk_pages(service, page_size, **kwargs):
+    """Проходит выборку курсорами и возвращает участников в порядке страниц"""
+    seen, cursor = [], None
+    while True:
+        page = await service.list_rankings(
+            section_id=1, jury_id=None, page=1, page_size=page_size, cursor=cursor, **kwargs
+        )
+        seen += [item.participant_id for item in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            return seen
+
+
+# Тест границ страниц при равных итогах
+@pytest.mark.parametrize(
+    ("sort_by", "sort_order"),
+    [
+        (ParticipantRankingSortField.TOTAL_SCORE, SortOrder.DESC),
+        (ParticipantRankingSortField.TOTAL_SCORE, SortOrder.ASC),
+        (ParticipantRankingSortField.LAST_NAME, SortOrder.ASC),
+        (ParticipantRankingSortField.LAST_NAME, SortOrder.DESC),
+        (ParticipantRankingSortField.RANK, SortOrder.ASC),
+        (ParticipantRankingSortField.SCORES_COUNT, SortOrder.DESC),
+    ],
+)
+def test_cursor_pages_with_ties_skip_nothing(postgres_schema, sort_by, sort_order):
+    """Тест: при равных итогах и пустых фамилиях страницы по курсору не пропускают и не повторяют строки"""
+
+    async def scenario():
+        async with postgres_schema(TIED_SEED_SQL) as engine, AsyncSession(engine) as session:
+            service = ParticipantRankingService(
+                ParticipantRankingRepository(session), TTLCache(max_entries=0, ttl_seconds=0)
+            )
+            whole = await walk_pages(service, 100, sort_by=sort_by, sort_order=sort_order)
+            return whole, {
+                size: await walk_pages(service, size, sort_by=sort_by, sort_order=sort_order) for size in (1, 2, 3)
+            }
+
+    whole, paged = asyncio.run(scenario())
+
+    assert sorted(whole) == list(range(1, 10))
+    for pages in paged.values():
+        assert pages == whole
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import exc, text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.adapters.api.dependencies import get_engine  # noqa: E402
+from app.core.config import Settings  # noqa: E402
+from app.db.pool import InstrumentedAsyncPool, engine_options, get_pool_stats  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def test_engine_options_follow_settings():
+    """Параметры пула и asyncpg берутся из настроек"""
+    settings = Settings(db_pool_size=3, db_max_overflow=0, db_statement_cache_size=0, db_command_timeout=15)
+
+    options = engine_options(settings)
+
+    assert options["poolclass"] is InstrumentedAsyncPool
+    assert (options["pool_size"], options["max_overflow"]) == (3, 0)
+    assert options["connect_args"] == {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "command_timeout": 15,
+    }
+
+
+def test_pool_reports_checkouts_and_timeouts(tmp_path):
+    """Пул считает выдачи соединений, время ожидания и таймауты"""
+
+    async def scenario():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncPool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("select 1"))
+                busy = get_pool_stats(engine)
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            return busy, get_pool_stats(engine)
+        finally:
+            await engine.dispose()
+
+    busy, idle = asyncio.run(scenario())
+    assert (busy.checked_out, busy.checkouts) == (1, 1)
+    assert (idle.checked_out, idle.checked_in) == (0, 1)
+    assert (idle.checkouts, idle.checkout_timeouts) == (2, 1)
+    assert idle.wait_seconds_max >= 0.05
+
+
+def test_pool_endpoint(tmp_path):
+    """GET /internal/pool отдает метрики пула"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncPool)
+    app.dependency_overrides[get_engine] = lambda: engine
+    try:
+        response = TestClient(app).get("/api/v1/internal/pool")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["checkouts"] == 0
+    assert response.json()["wait_seconds_avg"] == 0.0
+
+
+def test_pool_counts_retried_checkout_once(tmp_path):
+    """Повторный вызов _do_get после проигранной гонки за место в overflow считается одной выдачей"""
+
+    async def scenario():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncPool,
+            pool_size=1,
+            max_overflow=1,
+        )
+        pool = engine.sync_engine.pool
+        inc_overflow = pool._inc_overflow
+        lost_race = False
+
+        def inc_overflow_losing_once():
+            # место в overflow один раз занимает параллельный запрос, и пул повторяет _do_get
+            nonlocal lost_race
+            if pool.checkedout() and not lost_race:
+                lost_race = True
+                return False
+            return inc_overflow()
+
+        pool._inc_overflow = inc_overflow_losing_once
+        try:
+            async with engine.connect(), engine.connect() as second:
+                await second.execute(text("select 1"))
+                return lost_race, get_pool_stats(engine)
+        finally:
+            await engine.dispose()
+
+    lost_race, stats = asyncio.run(scenario())
+    assert lost_race
+    assert (stats.checked_out, stats.overflow) == (2, 1)
+    assert (stats.checkouts, stats.checkout_timeouts) == (2, 0)
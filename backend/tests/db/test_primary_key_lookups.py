@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.query_count import count_queries, install_query_counter  # noqa: E402
+from app.models import Base, Jury  # noqa: E402
+from app.repositories.base import get_by_pk, get_many_by_pk  # noqa: E402
+
+
+async def run_with_session(scenario):
+    """Запускает сценарий на пустой in-memory SQLite с тремя членами жюри"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_counter(engine)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        async with session_maker() as session:
+            session.add_all([Jury(id=jury_id, access_key=jury_id) for jury_id in (1, 2, 3)])
+            await session.commit()
+
+        async with session_maker() as session:
+            return await scenario(session)
+    finally:
+        await engine.dispose()
+
+
+def test_get_by_pk_uses_identity_map():
+    """Повторный запрос по первичному ключу не обращается к базе"""
+
+    async def scenario(session):
+        with count_queries() as first:
+            jury = await get_by_pk(session, Jury, 1)
+        with count_queries() as second:
+            same_jury = await get_by_pk(session, Jury, 1)
+        missing = await get_by_pk(session, Jury, 42)
+        return jury, same_jury, missing, first.count, second.count
+
+    jury, same_jury, missing, first_count, second_count = asyncio.run(run_with_session(scenario))
+    assert jury is same_jury
+    assert missing is None
+    assert (first_count, second_count) == (1, 0)
+
+
+def test_get_many_by_pk_loads_only_missing_ids_in_one_query():
+    """Пакетная загрузка берет известные объекты из identity map, остальные — одним IN"""
+
+    async def scenario(session):
+        known = await get_by_pk(session, Jury, 2)
+        with count_queries() as batch:
+            found = await get_many_by_pk(session, Jury, [1, 2, 3, 42, None, 1])
+        with count_queries() as repeated:
+            found_again = await get_many_by_pk(session, Jury, [3, 1])
+        return known, found, found_again, batch.count, repeated.count
+
+    known, found, found_again, batch_count, repeated_count = asyncio.run(run_with_session(scenario))
+    assert sorted(found) == [1, 2, 3]
+    assert found[2] is known
+    assert found_again == {3: found[3], 1: found[1]}
+    assert (batch_count, repeated_count) == (1, 0)
@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.db.query_count import count_queries, install_query_counter  # noqa: E402
+
+
+def test_nested_counters_see_statements_and_their_time():
+    """Вложенные блоки count_queries учитывают каждый запрос и время его выполнения"""
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        install_query_counter(engine)
+        try:
+            async with engine.connect() as connection:
+                with count_queries() as outer:
+                    await connection.execute(text("SELECT 1"))
+                    with count_queries() as inner:
+                        await connection.execute(text("SELECT 2"))
+            return outer, inner
+        finally:
+            await engine.dispose()
+
+    outer, inner = asyncio.run(scenario())
+    assert (outer.count, inner.count) == (2, 1)
+    assert outer.duration_seconds > inner.duration_seconds > 0
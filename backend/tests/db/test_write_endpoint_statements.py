@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.api.dependencies import get_read_session, get_session
+from app.core.config import settings
+from app.db.query_count import install_query_counter
+from app.main import create_app
+from app.models import JuryScoreChange, OrganizerSectionChange
+
+# Секция 1 с участниками 1 и 2 и членами жюри 1 и 2, организатор 1
+SEED_SQL = [
+    "INSERT INTO sections (id, name) VALUES (1, 'Section 1')",
+    "INSERT INTO participants (id, section_id) VALUES (1, 1), (2, 1)",
+    "INSERT INTO juries (id, access_key) VALUES (1, 1), (2, 2)",
+    "INSERT INTO section_juries (section_id, jury_id) VALUES (1, 1), (1, 2)",
+    "INSERT INTO organizers (id) VALUES (1)",
+]
+
+# Ожидаемое число SQL-запросов на запрос к API
+EXPECTED_STATEMENTS = {
+    # INSERT ... ON CONFLICT с проверкой закрепления и журналом в CTE,
+    # блокировка участника и пересчет таблицы лидеров
+    "upsert_created": 3,
+    "upsert_replaced": 3,
+    # участник, член жюри, закрепление за секцией, INSERT ... RETURNING, блокировка и пересчет
+    "create": 6,
+    # оценка вместе с участником и членом жюри, UPDATE ... RETURNING с журналом в CTE, блокировка и пересчет
+    "update_by_own_jury": 4,
+    # плюс поиск другого члена жюри, от имени которого записано изменение
+    "update_by_other_jury": 5,
+    # оценка вместе с родителями, DELETE, блокировка и пересчет таблицы лидеров
+    "delete": 4,
+    # проверка организатора, секция, UPDATE ... RETURNING с журналом в CTE
+    "section_update": 3,
+}
+
+
+def make_app(engine):
+    """Приложение с заголовком X-Query-Count, сессии которого открываются во временной схеме"""
+    install_query_counter(engine)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def session():
+        async with session_maker() as db_session:
+            yield db_session
+
+    application = create_app()
+    application.dependency_overrides[get_session] = session
+    application.dependency_overrides[get_read_session] = session
+    return application
+
+
+# Тест числа запросов на запись через API
+def test_write_endpoints_statement_count(postgres_schema, monkeypatch):
+    """Тест: запись оценок и секции через API (с журналом в CTE) укладывается в заявленное число SQL-запросов"""
+    monkeypatch.setattr(settings, "db_query_count_header", True)
+
+    async def scenario():
+        async with postgres_schema(SEED_SQL) as engine:
+            transport = httpx.ASGITransport(app=make_app(engine))
+            async with httpx.AsyncClient(transport=transport, base_url="http://test/api/v1") as client:
+                responses = {
+                    "upsert_created": await client.put("/participants/1/scores/by-jury/1", json={"content": 8}),
+                    "upsert_replaced": await client.put("/participants/1/scores/by-jury/1", json={"content": 9}),
+                    "create": await client.post("/participants/2/scores/", json={"jury_id": 1, "content": 5}),
+                }
+                score_url = f"/participants/2/scores/{responses['create'].json()['id']}"
+                responses["update_by_own_jury"] = await client.patch(
+                    score_url, json={"visuals": 4}, headers={"X-Jury-Id": "1"}
+                )
+                responses["update_by_other_jury"] = await client.patch(
+                    score_url, json={"mechanics": 3}, headers={"X-Jury-Id": "2"}
+                )
+                async with AsyncSession(engine) as session:
+                    score_changes = await session.scalar(select(func.count()).select_from(JuryScoreChange))
+                responses["delete"] = await client.delete(score_url)
+                responses["section_update"] = await client.patch(
+                    "/sections/1", json={"name": "Section A", "organizer_id": 1}
+                )
+
+            async with AsyncSession(engine) as session:
+                section_changes = await session.scalar(select(func.count()).select_from(OrganizerSectionChange))
+            return responses, (score_changes, section_changes)
+
+    responses, logged = asyncio.run(scenario())
+
+    assert {name: response.status_code for name, response in responses.items()} == {
+        "upsert_created": 201,
+        "upsert_replaced": 200,
+        "create": 201,
+        "update_by_own_jury": 200,
+        "update_by_other_jury": 200,
+        "delete": 204,
+        "section_update": 200,
+    }
+    assert responses["update_by_other_jury"].json()["total"] == 12.0
+    assert {name: int(response.headers["x-query-count"]) for name, response in responses.items()} == (
+        EXPECTED_STATEMENTS
+    )
+    # журнал записан тем же запросом, что и изменение: замена оценки, два PATCH и смена организатора
+    assert logged == (3, 1)
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.query_count import count_queries, install_query_counter  # noqa: E402
+from app.models import Base  # noqa: E402
+from app.repositories.base import update_returning  # noqa: E402
+from app.repositories.jury import JuryRepository  # noqa: E402
+from app.repositories.poster_content import PosterContentRepository  # noqa: E402
+from app.repositories.section import SectionRepository  # noqa: E402
+from app.repositories.section_jury import SectionJuryRepository  # noqa: E402
+from app.repositories.technical_requirement import TechnicalRequirementRepository  # noqa: E402
+from app.repositories.university import UniversityRepository  # noqa: E402
+from app.schemas import (  # noqa: E402
+    JuryCreate,
+    JuryUpdate,
+    PosterContentCreate,
+    PosterContentUpdate,
+    SectionCreate,
+    SectionUpdate,
+    TechnicalRequirementCreate,
+    TechnicalRequirementUpdate,
+    UniversityCreate,
+)
+
+
+async def count_write_statements(create, update):
+    """
+    Выполняет создание и изменение объекта на пустой in-memory SQLite
+    и возвращает созданный объект, измененный объект и число запросов каждого шага
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_counter(engine)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        async with session_maker() as session:
+            with count_queries() as created_counter:
+                created = await create(session)
+            created_id = created.id
+            with count_queries() as updated_counter:
+                updated = await update(session, created)
+            return created_id, updated, created_counter.count, updated_counter.count
+    finally:
+        await engine.dispose()
+
+
+WRITES = {
+    "jury": (
+        lambda session: JuryRepository(session).create_jury(JuryCreate(access_key=1234)),
+        lambda session, jury: JuryRepository(session).update_jury(jury, JuryUpdate(is_chairman=True)),
+        ("is_chairman", True),
+    ),
+    "section_jury": (
+        lambda session: SectionJuryRepository(session).create_assignment(section_id=1, jury_id=1),
+        lambda session, assignment: SectionJuryRepository(session).update_assignment(
+            assignment, section_id=2, jury_id=1
+        ),
+        ("section_id", 2),
+    ),
+    "technical_requirement": (
+        lambda session: TechnicalRequirementRepository(session).create_technical_requirement(
+            TechnicalRequirementCreate(format="PDF", sizes="A4")
+        ),
+        lambda session, requirement: TechnicalRequirementRepository(session).update_technical_requirement(
+            requirement, TechnicalRequirementUpdate(sizes="A1")
+        ),
+        ("sizes", "A1"),
+    ),
+    "poster_content": (
+        lambda session: PosterContentRepository(session).create_poster_content(PosterContentCreate(words_amount=300)),
+        lambda session, content: PosterContentRepository(session).update_poster_content(
+            content, PosterContentUpdate(images_amount=4)
+        ),
+        ("images_amount", 4),
+    ),
+    "section": (
+        lambda session: SectionRepository(session).create_section(SectionCreate(name="Секция", lecture_hall="101")),
+        lambda session, section: SectionRepository(session).update_section(
+            section.id, SectionUpdate(name="Секция", lecture_hall="202")
+        ),
+        ("lecture_hall", "202"),
+    ),
+}
+
+
+@pytest.mark.parametrize("entity", WRITES)
+def test_create_and_update_are_single_statements(entity):
+    """Создание и изменение — по одному запросу INSERT/UPDATE ... RETURNING, без повторного чтения"""
+    create, update, (field, expected) = WRITES[entity]
+
+    created_id, updated, created_count, updated_count = asyncio.run(count_write_statements(create, update))
+
+    assert created_id is not None
+    assert updated.id == created_id
+    assert getattr(updated, field) == expected
+    assert (created_count, updated_count) == (1, 1)
+
+
+def test_update_without_changes_sends_nothing():
+    """Создание университета — один запрос, пустое изменение не обращается к базе"""
+    _, updated, created_count, updated_count = asyncio.run(
+        count_write_statements(
+            lambda session: UniversityRepository(session).create_university(UniversityCreate(name="ИТМО")),
+            lambda session, university: update_returning(session, university, {}),
+        )
+    )
+
+    assert updated.name == "ИТМО"
+    assert (created_count, updated_count) == (1, 0)
@@ -0,0 +1,138 @@
+import random
+from collections import Counter
+from itertools import combinations, product
+
+import pytest
+
+from app.services.draw_solver import (
+    DrawGroup,
+    DrawInfeasibleError,
+    DrawTopic,
+    MaxFlow,
+    group_demands,
+    solve_assignment,
+    topic_capacity,
+)
+
+
+def assert_valid(assignment, topics, groups):
+    """Проверяет, что распределение соблюдает все ограничения жеребьёвки"""
+    topics_by_id = {topic.id: topic for topic in topics}
+    groups_by_id = {group.id: group for group in groups}
+    assert len(set(assignment)) == len(assignment)
+
+    taken = Counter(group_id for group_id, _ in assignment)
+    assert taken == Counter(group_demands(groups, len(topics)))
+
+    shared = Counter(topic_id for _, topic_id in assignment)
+    assert max(shared.values()) <= topic_capacity(groups, len(topics))
+
+    universities = Counter(
+        (topic_id, groups_by_id[group_id].university_id)
+        for group_id, topic_id in assignment
+        if groups_by_id[group_id].university_id is not None
+    )
+    assert not universities or max(universities.values()) == 1
+
+    for group_id, topic_id in assignment:
+        assert not topics_by_id[topic_id].needs_poster or groups_by_id[group_id].has_poster_participants
+
+
+def brute_force_feasible(topics, groups):
+    """Перебирает все распределения маленькой секции и ищет допустимое"""
+    demands = group_demands(groups, len(topics))
+    options = []
+    for group in groups:
+        eligible = [topic.id for topic in topics if not topic.needs_poster or group.has_poster_participants]
+        options.append([(group, chosen) for chosen in combinations(eligible, demands[group.id])])
+
+    for choice in product(*options):
+        assignment = [(group.id, topic_id) for group, chosen in choice for topic_id in chosen]
+        try:
+            assert_valid(assignment, topics, groups)
+        except AssertionError:
+            continue
+        return True
+    return False
+
+
+# Тест алгоритма максимального потока
+def test_max_flow():
+    """Тест: поток в классической сети с обратным ребром равен пропускной способности минимального разреза"""
+    network = MaxFlow(4)
+    network.add_edge(0, 1, 3)
+    network.add_edge(0, 2, 2)
+    crossing = network.add_edge(1, 2, 5)
+    network.add_edge(1, 3, 2)
+    network.add_edge(2, 3, 3)
+
+    assert network.solve(0, 3) == 5
+    assert network.flow(crossing) == 1
+
+
+# Тест числа тем на группу
+def test_group_demands_follow_member_count():
+    """Тест: тем больше, чем групп — лишние темы достаются группам пропорционально числу участников"""
+    groups = [DrawGroup(1, member_count=2), DrawGroup(2, member_count=6), DrawGroup(3)]
+
+    assert group_demands(groups, 7) == {1: 2, 2: 4, 3: 1}
+    assert group_demands(groups, 2) == {1: 1, 2: 1, 3: 1}
+    assert topic_capacity(groups, 7) == 1
+    assert topic_capacity(groups, 2) == 2
+
+
+# Тест воспроизводимости
+def test_solve_assignment_is_deterministic():
+    """Тест: распределение зависит только от зерна, секции и входных данных, но не от их порядка"""
+    topics = [DrawTopic(topic_id) for topic_id in (1, 2, 3)]
+    groups = [DrawGroup(group_id) for group_id in (10, 20, 30, 40)]
+
+    assignment = solve_assignment("seed", 5, topics, groups)
+
+    # зафиксированный результат: изменение алгоритма требует новой версии DRAW_ALGORITHM
+    assert assignment == [(10, 2), (20, 3), (30, 3), (40, 1)]
+    assert solve_assignment("seed", 5, topics[::-1], groups[::-1]) == assignment
+    assert solve_assignment("seed", 6, topics, groups) != assignment
+
+
+# Тест ограничений
+@pytest.mark.parametrize(("group_count", "topic_count"), [(40, 10), (10, 40), (120, 120), (300, 60)])
+def test_solve_assignment_respects_constraints(group_count, topic_count):
+    """Тест: размер групп, вместимость тем, постерные темы и правило одного университета соблюдаются"""
+    rng = random.Random(group_count * topic_count)
+    topics = [DrawTopic(topic_id, needs_poster=rng.random() < 0.3) for topic_id in range(1, topic_count + 1)]
+    groups = [
+        DrawGroup(
+            group_id,
+            member_count=rng.randint(1, 8),
+            university_id=rng.choice([None, *range(1, 9)]),
+            has_poster_participants=rng.random() < 0.7,
+        )
+        for group_id in range(1, group_count + 1)
+    ]
+
+    assert_valid(solve_assignment("seed", 1, topics, groups), topics, groups)
+
+
+# Тест полноты: решение находится всегда, когда оно существует
+def test_solve_assignment_matches_brute_force():
+    """Тест: на маленьких секциях решатель отказывает, только если полный перебор тоже не находит распределения"""
+    rng = random.Random(7)
+    for _ in range(150):
+        topics = [DrawTopic(topic_id, needs_poster=rng.random() < 0.4) for topic_id in range(1, rng.randint(1, 4) + 1)]
+        groups = [
+            DrawGroup(
+                group_id,
+                member_count=rng.randint(1, 4),
+                university_id=rng.choice([None, 1, 2]),
+                has_poster_participants=rng.random() < 0.5,
+            )
+            for group_id in range(1, rng.randint(1, 5) + 1)
+        ]
+
+        try:
+            assignment = solve_assignment("seed", 1, topics, groups)
+        except DrawInfeasibleError:
+            assert not brute_force_feasible(topics, groups)
+        else:
+            assert_valid(assignment, topics, groups)
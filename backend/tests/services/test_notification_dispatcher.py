@@ -0,0 +1,245 @@
+import asyncio
+import socket
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+controller_module = pytest.importorskip("aiosmtpd.controller")
+
+from app.core.mailer import RateLimiter, SmtpMailer  # noqa: E402
+from app.models import Base, NotificationOutbox  # noqa: E402
+from app.repositories.notification import NotificationOutboxRepository  # noqa: E402
+from app.services.notification import NotificationDispatcher  # noqa: E402
+
+START = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+
+
+class RecordingHandler:
+    """SMTP-сервер для тестов: считает сессии, принимает письма и отклоняет адреса temp@/bad@"""
+
+    def __init__(self, delay=0.0):
+        self.sessions = 0
+        self.delivered = []
+        self.delay = delay
+
+    async def handle_EHLO(self, _server, session, _envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, _server, _session, envelope, address, _rcpt_options):
+        if address.startswith("temp@"):
+            return "451 Try again later"
+        if address.startswith("bad@"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, _server, _session, envelope):
+        await asyncio.sleep(self.delay)
+        self.delivered.extend(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    """Фикстура: локальный aiosmtpd-сервер в отдельном потоке"""
+
+    def start(delay=0.0):
+        handler = RecordingHandler(delay)
+        controller = controller_module.Controller(handler, hostname="127.0.0.1", port=free_port())
+        controller.start()
+        controllers.append(controller)
+        return handler, controller.port
+
+    controllers = []
+    yield start
+    for controller in controllers:
+        controller.stop()
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """Фикстура: файл SQLite с таблицами приложения"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    asyncio.run(engine.dispose())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+
+def make_dispatcher(session_maker, port, clock, batch_size=50):
+    return NotificationDispatcher(
+        session_maker,
+        SmtpMailer("127.0.0.1", port, security="none", sender="noreply@example.com", timeout=5),
+        batch_size=batch_size,
+        max_attempts=2,
+        retry_base_seconds=30,
+        clock=clock,
+    )
+
+
+async def enqueue(session_maker, recipients):
+    async with session_maker() as session:
+        repository = NotificationOutboxRepository(session)
+        await repository.enqueue(
+            [
+                {
+                    "kind": "draw_results",
+                    "recipient": recipient,
+                    "subject": "Тема",
+                    "body": "Текст",
+                    "next_attempt_at": START,
+                }
+                for recipient in recipients
+            ]
+        )
+        await repository.commit()
+
+
+async def outbox(session_maker):
+    async with session_maker() as session:
+        rows = await session.scalars(select(NotificationOutbox).order_by(NotificationOutbox.id))
+        return {row.recipient: row for row in rows}
+
+
+# Тест отправки пачки через одно соединение
+def test_dispatch_batch_reuses_one_connection(smtp_server, session_maker):
+    """Тест: 120 писем уходят тремя пачками — по одной SMTP-сессии на пачку"""
+    handler, port = smtp_server()
+    recipients = [f"student{index}@example.com" for index in range(120)]
+    dispatcher = make_dispatcher(session_maker, port, FakeClock())
+
+    async def scenario():
+        await enqueue(session_maker, recipients)
+        return [await dispatcher.dispatch_batch() for _ in range(4)], await outbox(session_maker)
+
+    claimed, rows = asyncio.run(scenario())
+
+    assert claimed == [50, 50, 20, 0]
+    assert handler.sessions == 3
+    assert sorted(handler.delivered) == sorted(recipients)
+    assert {row.status for row in rows.values()} == {"sent"}
+    assert {row.attempts for row in rows.values()} == {1}
+
+
+# Тест повторов и постоянных ошибок
+def test_dispatch_batch_retries_with_backoff(smtp_server, session_maker):
+    """Тест: 4xx откладывает письмо с экспоненциальной задержкой, 5xx и исчерпанные попытки — failed"""
+    handler, port = smtp_server()
+    clock = FakeClock()
+    dispatcher = make_dispatcher(session_maker, port, clock)
+
+    async def scenario():
+        await enqueue(session_maker, ["ok@example.com", "temp@example.com", "bad@example.com"])
+        await dispatcher.dispatch_batch()
+        first = await outbox(session_maker)
+        # до окончания задержки письмо не берётся повторно
+        clock.now = START + timedelta(seconds=29)
+        early = await dispatcher.dispatch_batch()
+        clock.now = START + timedelta(seconds=31)
+        await dispatcher.dispatch_batch()
+        return first, early, await outbox(session_maker)
+
+    first, early, final = asyncio.run(scenario())
+
+    assert handler.delivered == ["ok@example.com"]
+    assert first["ok@example.com"].status == "sent"
+    assert first["bad@example.com"].status == "failed"
+    assert "550" in first["bad@example.com"].last_error
+    assert first["temp@example.com"].status == "pending"
+    assert first["temp@example.com"].next_attempt_at.replace(tzinfo=UTC) == START + timedelta(seconds=30)
+    assert early == 0
+    assert final["temp@example.com"].status == "failed"
+    assert final["temp@example.com"].attempts == 2
+
+
+# Тест недоступного сервера
+def test_dispatch_batch_reschedules_when_server_is_down(session_maker):
+    """Тест: если SMTP-сервер недоступен, вся пачка откладывается, а не теряется"""
+    dispatcher = make_dispatcher(session_maker, free_port(), FakeClock())
+
+    async def scenario():
+        await enqueue(session_maker, ["a@example.com", "b@example.com"])
+        claimed = await dispatcher.dispatch_batch()
+        return claimed, await outbox(session_maker)
+
+    claimed, rows = asyncio.run(scenario())
+
+    assert claimed == 2
+    assert {row.status for row in rows.values()} == {"pending"}
+    assert {row.next_attempt_at.replace(tzinfo=UTC) for row in rows.values()} == {START + timedelta(seconds=30)}
+    assert all(row.last_error for row in rows.values())
+
+
+# Тест неблокирующей отправки
+def test_dispatch_does_not_block_event_loop(smtp_server, session_maker):
+    """Тест: пока медленный SMTP-сервер принимает письма, цикл событий продолжает обслуживать другие задачи"""
+    handler, port = smtp_server(delay=0.05)
+    dispatcher = make_dispatcher(session_maker, port, FakeClock())
+    ticks = 0
+
+    async def ticker(stop):
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        await enqueue(session_maker, [f"student{index}@example.com" for index in range(10)])
+        stop = asyncio.Event()
+        task = asyncio.create_task(ticker(stop))
+        await dispatcher.dispatch_batch()
+        stop.set()
+        await task
+
+    asyncio.run(scenario())
+
+    assert len(handler.delivered) == 10
+    # 10 писем по 50 мс: заблокированный цикл не дал бы тикеру сработать ни разу
+    assert ticks >= 10
+
+
+# Тест ограничения скорости
+def test_rate_limiter_spaces_sends():
+    """Тест: при 5 письмах в секунду между отправками не меньше 200 мс, а без лимита ожидания нет"""
+    now = 100.0
+    sleeps = []
+
+    async def sleep(delay):
+        nonlocal now
+        sleeps.append(round(delay, 6))
+        now += delay
+
+    async def scenario(rate):
+        limiter = RateLimiter(rate, clock=lambda: now, sleep=sleep)
+        for _ in range(4):
+            await limiter.wait()
+
+    asyncio.run(scenario(5))
+    assert sleeps == [0.2, 0.2, 0.2]
+
+    sleeps.clear()
+    asyncio.run(scenario(0))
+    assert sleeps == []
@@ -76,18 +76,13 @@ async def get_participants_for_jury(db: Database, jury_id: int):
 async def get_leaderboard(db: Database, jury_id: int):
     """
     Считает сумму баллов для каждого участника секции.
+    Сумма критериев хранится в генерируемой колонке jury_scores.total.
     """
     query = """
         SELECT 
             pp.last_name, 
             pp.first_name,
-            SUM(
-                COALESCE(js.organization_criteria, 0) + 
-                COALESCE(js.content_criteria, 0) + 
-                COALESCE(js.visuals_criteria, 0) + 
-                COALESCE(js.mechanics_criteria, 0) + 
-                COALESCE(js.delivery_criteria, 0)
-            ) as total_score
+            COALESCE(SUM(js.total), 0) as total_score
         FROM participants p
         JOIN people pp ON p.person_id = pp.id
         JOIN section_juries sj ON p.section_id = sj.section_id
@@ -100,35 +95,29 @@ async def get_leaderboard(db: Database, jury_id: int):
     return cursor.fetchall()
 
 async def save_score(db: Database, jury_id: int, participant_id: int, scores: dict, comment: str):
-    """Сохраняет оценку в БД."""
+    """
+    Сохраняет оценку в БД одним запросом (INSERT ... ON CONFLICT DO UPDATE).
+    Повторное нажатие «Сохранить» перезаписывает ту же строку, а не создает дубликат.
+    Требует уникальный индекс uq_jury_participant_score (schema.sql, для старых баз — upgrade_db).
+    """
     try:
-        check_query = "SELECT id FROM jury_scores WHERE jury_id = ? AND participant_id = ?"
-        cursor = db.conn.execute(check_query, (jury_id, participant_id))
-        existing = cursor.fetchone()
-        
-        if existing:
-            update_query = """
-                UPDATE jury_scores 
-                SET organization_criteria=?, content_criteria=?, visuals_criteria=?, 
-                    mechanics_criteria=?, delivery_criteria=?, comment=?
-                WHERE id=?
-            """
-            db.conn.execute(update_query, (
-                scores['c1'], scores['c2'], scores['c3'], scores['c4'], scores['c5'], 
-                comment, existing[0]
-            ))
-        else:
-            insert_query = """
-                INSERT INTO jury_scores 
-                (jury_id, participant_id, organization_criteria, content_criteria, visuals_criteria, mechanics_criteria, delivery_criteria, comment)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            db.conn.execute(insert_query, (
-                jury_id, participant_id, 
-                scores['c1'], scores['c2'], scores['c3'], scores['c4'], scores['c5'], 
-                comment
-            ))
-            
+        upsert_query = """
+            INSERT INTO jury_scores
+            (jury_id, participant_id, organization_criteria, content_criteria, visuals_criteria, mechanics_criteria, delivery_criteria, comment)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (jury_id, participant_id) DO UPDATE SET
+                organization_criteria = excluded.organization_criteria,
+                content_criteria = excluded.content_criteria,
+                visuals_criteria = excluded.visuals_criteria,
+                mechanics_criteria = excluded.mechanics_criteria,
+                delivery_criteria = excluded.delivery_criteria,
+                comment = excluded.comment
+        """
+        db.conn.execute(upsert_query, (
+            jury_id, participant_id,
+            scores['c1'], scores['c2'], scores['c3'], scores['c4'], scores['c5'],
+            comment
+        ))
         db.conn.commit()
         return True
     except Exception as e:
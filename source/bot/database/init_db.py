@@ -7,12 +7,65 @@ INSTANCE_DIR = os.path.join(BASE_DIR, "instance")
 DB_PATH = os.path.join(INSTANCE_DIR, "digital_event_manager.db")
 SCHEMA_FILE = os.path.join(BASE_DIR, "schema.sql")
 
+# SQLite can only add VIRTUAL generated columns to an existing table
+JURY_SCORES_TOTAL_COLUMN = """
+    ALTER TABLE jury_scores ADD COLUMN total REAL GENERATED ALWAYS AS (
+        organization_criteria + content_criteria + visuals_criteria + mechanics_criteria + delivery_criteria
+    ) VIRTUAL
+"""
+
+# save_score upserts with ON CONFLICT (jury_id, participant_id), which needs this unique index.
+# Older databases may hold duplicate scores: the newest one (highest id) is kept and
+# the change history of the others is moved to it.
+DUPLICATE_JURY_SCORES = """
+    SELECT id FROM jury_scores
+    WHERE id NOT IN (SELECT MAX(id) FROM jury_scores GROUP BY jury_id, participant_id)
+"""
+MOVE_DUPLICATE_SCORE_CHANGES = f"""
+    UPDATE jury_scores_changes SET jury_scores_id = (
+        SELECT MAX(kept.id) FROM jury_scores AS kept
+        JOIN jury_scores AS duplicate
+            ON duplicate.jury_id = kept.jury_id AND duplicate.participant_id = kept.participant_id
+        WHERE duplicate.id = jury_scores_changes.jury_scores_id
+    )
+    WHERE jury_scores_id IN ({DUPLICATE_JURY_SCORES})
+"""
+DELETE_DUPLICATE_SCORES = f"DELETE FROM jury_scores WHERE id IN ({DUPLICATE_JURY_SCORES})"
+JURY_SCORES_UNIQUE_INDEX = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_jury_participant_score ON jury_scores (jury_id, participant_id);"
+)
+
+
+def upgrade_db(conn):
+    """
+    Brings a database created from an older schema.sql up to date.
+    Every step is idempotent, so it is safe to run on every start.
+    """
+    # generated columns are listed by table_xinfo only, not by table_info
+    columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(jury_scores);")}
+    if not columns:
+        return
+    if "total" not in columns:
+        conn.execute(JURY_SCORES_TOTAL_COLUMN)
+    has_unique_index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_jury_participant_score';"
+    ).fetchone()
+    if not has_unique_index:
+        conn.execute(MOVE_DUPLICATE_SCORE_CHANGES)
+        conn.execute(DELETE_DUPLICATE_SCORES)
+        conn.execute(JURY_SCORES_UNIQUE_INDEX)
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_jury_scores_participant_total ON jury_scores (participant_id, total);")
+    conn.commit()
+
+
 def init_db():
     if not os.path.exists(INSTANCE_DIR):
         os.makedirs(INSTANCE_DIR)
 
     if os.path.exists(DB_PATH):
-        print("Database already exists, skipping initialization")
+        with sqlite3.connect(DB_PATH) as conn:
+            upgrade_db(conn)
+        print("Database already exists, schema upgraded")
         return
 
     try:
@@ -217,10 +217,21 @@ CREATE TABLE IF NOT EXISTS jury_scores (
     mechanics_criteria REAL NOT NULL,
     delivery_criteria REAL NOT NULL,
     comment TEXT,
+    -- databases created before this column get it from upgrade_db() in init_db.py
+    total REAL GENERATED ALWAYS AS (
+        organization_criteria + content_criteria + visuals_criteria + mechanics_criteria + delivery_criteria
+    ) VIRTUAL,
     FOREIGN KEY (jury_id) REFERENCES juries(id),
     FOREIGN KEY (participant_id) REFERENCES participants(id)
 );
 
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jury_participant_score
+    ON jury_scores (jury_id, participant_id);
+
+-- total is materialized in the index, the leaderboard sum reads only the index
+CREATE INDEX IF NOT EXISTS ix_jury_scores_participant_total
+    ON jury_scores (participant_id, total);
+
 CREATE TABLE IF NOT EXISTS jury_scores_changes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     jury_scores_id INTEGER NOT NULL,
@@ -13,6 +13,7 @@ from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from components.shared.db import Database
+from database.init_db import upgrade_db
 from dotenv import load_dotenv
 from middlewares.db import DatabaseMiddleware
 
@@ -37,6 +38,7 @@ async def main() -> None:
 
     db_path = join(dirname(__file__), "digital_event_manager.db")
     db = Database(db_path).connect()
+    upgrade_db(db.conn)
 
     bot = Bot(
         token=os.getenv("TG_BOT_TOKEN"),